@@ -18,6 +18,7 @@ from models.schemas import (
 from routes.upload import get_data_store
 from routes.analysis import analysis_results_store
 from time_series_insight import TimeSeriesInsight
+from time_series_insight.utils import to_jsonable
 
 router = APIRouter()
 
@@ -208,7 +209,7 @@ async def evaluate_model(
                     "ljung_box_pvalue": adequacy.get("ljung_box_pvalue"),
                     "interpretation": adequacy.get("interpretation")
                 },
-                "residual_analysis": evaluation_result.get("residual_analysis", {}),
+                "residual_analysis": to_jsonable(evaluation_result.get("residual_analysis", {})),
                 "success": True
             }
         }
@@ -250,8 +251,8 @@ async def compare_models(
                 q = model_spec.get("q", 0)
                 order = (p, d, q)
                 
-                # 评估模型
-                evaluation_result = tsi.evaluator.generate_evaluation_report(tsi.data, order)
+                # 评估模型（比较只用到拟合统计量和评分，不需要残差ACF/PACF置信区间）
+                evaluation_result = tsi.evaluator.generate_evaluation_report(tsi.data, order, want_confint=False)
                 
                 if evaluation_result.get("success", False):
                     fit_stats = evaluation_result["fit_statistics"]
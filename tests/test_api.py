@@ -88,6 +88,55 @@ class TestTimeSeriesInsight:
             assert 'order' in best_model
             assert 'evaluation' in best_model
     
+    def test_analyze_parallel(self):
+        """测试多进程并行评估与串行评估结果一致"""
+        self.tsi.load_data(self.test_series)
+        serial = self.tsi.analyze(n_models=2)
+        parallel = self.tsi.analyze(n_models=2, n_jobs=2)
+        
+        serial_aics = [m['evaluation']['fit_statistics']['aic'] for m in serial['model_evaluation']]
+        parallel_aics = [m['evaluation']['fit_statistics']['aic'] for m in parallel['model_evaluation']]
+        assert [m['order'] for m in parallel['model_evaluation']] == \
+            [m['order'] for m in serial['model_evaluation']]
+        np.testing.assert_allclose(parallel_aics, serial_aics)
+
+    def test_analyze_parallel_uses_evaluator_settings(self):
+        """测试多进程评估沿用主进程评估器的快速拟合设置"""
+        self.tsi.load_data(self.test_series)
+        self.tsi.evaluator.use_fast = True
+        serial = self.tsi.analyze(n_models=2)
+        parallel = self.tsi.analyze(n_models=2, n_jobs=2)
+
+        from time_series_insight.evaluation.model_evaluator import ModelEvaluator
+        exact = ModelEvaluator()
+        for serial_model, parallel_model in zip(serial['model_evaluation'], parallel['model_evaluation']):
+            assert parallel_model['order'] == serial_model['order']
+            parallel_aic = parallel_model['evaluation']['fit_statistics']['aic']
+            assert parallel_aic == pytest.approx(serial_model['evaluation']['fit_statistics']['aic'])
+            assert parallel_aic != pytest.approx(exact.fit_model(self.test_series, parallel_model['order'])['aic'])
+
+    def test_best_model_ignores_nan_aic(self):
+        """测试AIC为NaN的候选模型不会被选为最佳模型"""
+        self.tsi.load_data(self.test_series)
+        evaluate = self.tsi.evaluator.generate_evaluation_report
+        nan_orders = []
+        
+        def evaluate_with_nan(data, order):
+            report = evaluate(data, order)
+            if not nan_orders and report.get('success', False):
+                nan_orders.append(order)
+                report['fit_statistics']['aic'] = np.nan
+            return report
+        
+        self.tsi.evaluator.generate_evaluation_report = evaluate_with_nan
+        results = self.tsi.analyze(n_models=3)
+        
+        # 至少有两个成功拟合的候选模型，NaN跳过逻辑才会被执行
+        successful = [m for m in results['model_evaluation'] if m['evaluation'].get('success', False)]
+        assert len(nan_orders) == 1 and len(successful) >= 2
+        assert results['best_model']['order'] != nan_orders[0]
+        assert not np.isnan(results['best_model']['evaluation']['fit_statistics']['aic'])
+    
     def test_quick_analysis(self):
         """测试一键分析功能"""
         results = self.tsi.quick_analysis(self.test_series, n_models=2)
@@ -131,6 +180,32 @@ class TestTimeSeriesInsight:
                 # 如果模型拟合失败，这是可以接受的
                 pass
     
+    def test_predict_batch(self):
+        """测试批量预测功能"""
+        self.tsi.load_data(self.test_series)
+        self.tsi.analyze(n_models=1)
+        
+        assert self.tsi.get_best_model() is not None
+        results = self.tsi.predict_batch([1, 3, 5])
+        
+        assert [r['forecast_steps'] for r in results] == [1, 3, 5]
+        assert [len(r['forecast']) for r in results] == [1, 3, 5]
+        
+        # 较短步长的预测应是最长预测的前缀
+        np.testing.assert_array_almost_equal(
+            results[1]['forecast'].values, results[2]['forecast'].values[:3]
+        )
+        assert results[0]['forecast'].index[0] > self.test_series.index[-1]
+    
+    def test_get_summary_after_replacing_results(self):
+        """测试直接替换analysis_results后摘要随之更新"""
+        self.tsi.load_data(self.test_series)
+        results = self.tsi.analyze(n_models=2)
+        assert 'best_model' in self.tsi.get_summary()
+        
+        self.tsi.analysis_results = {k: v for k, v in results.items() if k != 'best_model'}
+        assert 'best_model' not in self.tsi.get_summary()
+    
     def test_get_summary(self):
         """测试获取分析摘要"""
         self.tsi.load_data(self.test_series)
@@ -180,6 +255,43 @@ class TestTimeSeriesInsight:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
     
+    def test_export_results_json_without_orjson(self, monkeypatch):
+        """测试未安装orjson时回退到标准库json导出"""
+        from time_series_insight.utils import serialization
+        monkeypatch.setattr(serialization, "orjson", None)
+        
+        self.tsi.load_data(self.test_series)
+        self.tsi.analyze(n_models=1)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "results.json")
+            self.tsi.export_results(temp_file, format='json')
+            
+            import json
+            with open(temp_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            assert 'stationarity' in data
+            assert 'differencing' in data
+    
+    def test_export_results_excel(self):
+        """测试导出Excel结果，数据工作表逐行写入后内容完整"""
+        self.tsi.load_data(self.test_series)
+        self.tsi.analyze(n_models=1)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "results.xlsx")
+            self.tsi.export_results(temp_file, format='excel')
+            
+            sheets = pd.read_excel(temp_file, sheet_name=None)
+            assert 'Summary' in sheets
+            assert 'Data' in sheets
+            
+            data_sheet = sheets['Data']
+            assert len(data_sheet) == len(self.tsi.data)
+            assert not data_sheet.iloc[:, 1].isna().any()
+            np.testing.assert_allclose(data_sheet.iloc[:, 1].values, self.tsi.data.values)
+    
     def test_plot_analysis(self):
         """测试生成分析图表"""
         self.tsi.load_data(self.test_series)
@@ -201,6 +313,171 @@ class TestTimeSeriesInsight:
             # 验证文件存在
             assert os.path.exists(os.path.join(temp_dir, "original_series.png"))
             assert os.path.exists(os.path.join(temp_dir, "acf_pacf.png"))
+
+    def test_plotter_close_after_save(self):
+        """测试保存后关闭图形"""
+        from time_series_insight.visualization.plotter import TimeSeriesPlotter
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_path = os.path.join(temp_dir, "series.png")
+            with TimeSeriesPlotter(close_after_save=True) as plotter:
+                assert plotter.plot_time_series(self.test_series, save_path=save_path) is None
+                assert os.path.exists(save_path)
+
+                # 未保存的图形照常返回，退出时统一关闭
+                assert plotter.plot_time_series(self.test_series) is not None
+
+            assert len(plotter._active_figs) == 0
+
+    def test_plotter_release_reuses_figure(self):
+        """测试归还的图形被相同布局的绘图复用"""
+        from time_series_insight.visualization.plotter import TimeSeriesPlotter
+
+        plotter = TimeSeriesPlotter()
+        fig = plotter.plot_decomposition(self.test_series, period=12)
+        plotter.release(fig)
+
+        reused = plotter.plot_decomposition(self.test_series, period=12, title="复用")
+        assert reused is fig
+        assert len(reused.axes) == 4
+        assert reused.get_suptitle() == "复用"
+
+    def test_plotter_datashader_renderer(self):
+        """测试长序列使用datashader渲染折线"""
+        pytest.importorskip("datashader")
+        from time_series_insight.visualization.plotter import TimeSeriesPlotter
+
+        with pytest.raises(ValueError):
+            TimeSeriesPlotter(line_renderer="bokeh")
+
+        long_series = pd.Series(np.random.randn(20000).cumsum(),
+                                index=pd.date_range('2000-01-01', periods=20000, freq='h'))
+        plotter = TimeSeriesPlotter(line_renderer="datashader")
+        fig = plotter.plot_time_series(long_series)
+        ax = fig.axes[0]
+        assert len(ax.images) == 1
+        assert '原始数据' in [t.get_text() for t in ax.get_legend().get_texts()]
+        plotter.close_figures()
+
+    def test_plotter_render_batch(self):
+        """测试批量绘图返回各自独立的图形并登记到绘图器"""
+        from time_series_insight.visualization.plotter import TimeSeriesPlotter
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            jobs = [
+                ('plot_time_series', {'data': self.test_series,
+                                      'save_path': os.path.join(temp_dir, "series.png")}),
+                ('plot_acf_pacf', {'data': self.test_series.diff().dropna(),
+                                   'save_path': os.path.join(temp_dir, "acf_pacf.png")}),
+                ('plot_decomposition', {'data': self.test_series, 'period': 12,
+                                        'save_path': os.path.join(temp_dir, "decomposition.png")}),
+            ]
+            plotter = TimeSeriesPlotter()
+            figures = plotter.render_batch(jobs, max_workers=3)
+            
+            assert len({id(fig) for fig in figures}) == 3
+            assert sorted(os.listdir(temp_dir)) == ["acf_pacf.png", "decomposition.png", "series.png"]
+            assert all(fig in plotter._active_figs for fig in figures)
+            plotter.close_figures()
+            assert len(plotter._active_figs) == 0
+
+            # 推迟保存时，图像缓存在保存完成后写入；开启close_after_save时返回None
+            cache_dir = os.path.join(temp_dir, "cache")
+            plotter = TimeSeriesPlotter(image_cache_dir=cache_dir, close_after_save=True)
+            assert plotter.render_batch(jobs, max_workers=3) == [None, None, None]
+            assert len(os.listdir(cache_dir)) == 2
+            assert len(plotter._active_figs) == 0
+    
+    def test_plotter_image_cache_keyed_by_line_renderer(self):
+        """测试图像缓存区分折线渲染方式"""
+        from time_series_insight.visualization.plotter import TimeSeriesPlotter
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = os.path.join(temp_dir, "cache")
+            save_path = os.path.join(temp_dir, "report.png")
+            for line_renderer in ("matplotlib", "datashader"):
+                plotter = TimeSeriesPlotter(image_cache_dir=cache_dir, line_renderer=line_renderer)
+                # 渲染方式不同时不应命中另一种方式缓存的图像
+                drawn = plotter.create_comprehensive_report(self.test_series, save_path=save_path)
+                assert drawn.axes[0].axison
+                cached = plotter.create_comprehensive_report(self.test_series, save_path=save_path)
+                assert not cached.axes[0].axison and len(cached.axes[0].images) == 1
+                assert cached in plotter._active_figs
+                plotter.close_figures()
+            
+            assert len(os.listdir(cache_dir)) == 2
+    
+    def test_plotter_image_cache_hit_returns_figure(self):
+        """测试图像缓存命中时返回可继续使用的图形，矢量格式不使用缓存"""
+        from matplotlib.figure import Figure
+        from time_series_insight.visualization.plotter import TimeSeriesPlotter
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = os.path.join(temp_dir, "cache")
+            plotter = TimeSeriesPlotter(image_cache_dir=cache_dir)
+            data = self.test_series.diff().dropna()
+            for _ in range(2):
+                fig = plotter.plot_acf_pacf(data, save_path=os.path.join(temp_dir, "acf.png"))
+                assert isinstance(fig, Figure)
+                fig.savefig(os.path.join(temp_dir, "copy.png"))
+            
+            plotter.plot_acf_pacf(data, save_path=os.path.join(temp_dir, "acf.svg"))
+            assert os.listdir(cache_dir) == [f for f in os.listdir(cache_dir) if f.endswith('.png')]
+            plotter.close_figures()
+    
+    def test_fast_seasonal_decompose_matches_statsmodels(self):
+        """测试季节分解与statsmodels.seasonal_decompose一致"""
+        from statsmodels.tsa.seasonal import seasonal_decompose
+        from time_series_insight.visualization.plotter import _fast_seasonal_decompose
+        
+        n = 400
+        t = np.arange(n)
+        # 周期80时滤波器超过FFT卷积的长度阈值
+        for period in (7, 12, 80):
+            series = pd.Series(50 + 0.05 * t + 3 * np.sin(2 * np.pi * t / period)
+                               + np.random.default_rng(period).normal(size=n))
+            for model in ('additive', 'multiplicative'):
+                result = _fast_seasonal_decompose(series, period, model)
+                expected = seasonal_decompose(series, model=model, period=period)
+                for component in ('trend', 'seasonal', 'resid'):
+                    np.testing.assert_allclose(getattr(result, component).to_numpy(),
+                                               getattr(expected, component).to_numpy(),
+                                               rtol=1e-10, atol=1e-10, equal_nan=True)
+    
+    def test_downsample_for_plot_preserves_column_extremes(self):
+        """测试M4降采样保留每个像素列的首末点和最小、最大值"""
+        from time_series_insight.visualization.plotter import _downsample_for_plot
+        
+        target_px = 100
+        n = target_px * 37
+        x = np.arange(n, dtype=np.float64)
+        y = np.random.default_rng(0).normal(size=n).cumsum()
+        
+        x_ds, y_ds = _downsample_for_plot(x, y, target_px)
+        assert len(y_ds) <= 4 * target_px
+        assert np.all(np.diff(x_ds) > 0)
+        
+        # 等间隔横坐标下每个像素列对应一个桶
+        columns = (x * target_px // n).astype(int)
+        columns_ds = (x_ds * target_px // n).astype(int)
+        for stat in ('min', 'max', 'first', 'last'):
+            expected = pd.Series(y).groupby(columns).agg(stat)
+            actual = pd.Series(y_ds).groupby(columns_ds).agg(stat)
+            pd.testing.assert_series_equal(actual, expected)
+    
+    def test_normal_qq_matches_probplot(self):
+        """测试正态Q-Q图数据与scipy.stats.probplot一致"""
+        from scipy import stats
+        from time_series_insight.visualization.plotter import _normal_qq
+        
+        values = np.random.default_rng(0).standard_t(4, size=257)
+        theoretical, ordered, slope, intercept = _normal_qq(values)
+        (expected_theoretical, expected_ordered), (expected_slope, expected_intercept, _) = \
+            stats.probplot(values, dist="norm")
+        
+        np.testing.assert_allclose(theoretical, expected_theoretical, rtol=1e-12)
+        np.testing.assert_array_equal(ordered, expected_ordered)
+        np.testing.assert_allclose([slope, intercept], [expected_slope, expected_intercept], rtol=1e-10)
     
     def test_analyze_time_series_function(self):
         """测试便捷分析函数"""
@@ -234,6 +511,219 @@ class TestTimeSeriesInsight:
             self.tsi.export_results("test.json")
 
 
+class TestParameterEstimator:
+    """测试ParameterEstimator类"""
+    
+    def test_estimate_ar_moments_batch_matches_yule_walker(self):
+        """测试批量AR矩估计与statsmodels的Yule-Walker估计一致"""
+        from statsmodels.regression.linear_model import yule_walker
+        from time_series_insight.estimation.parameter_estimator import ParameterEstimator
+        
+        np.random.seed(1)
+        data = pd.Series(np.random.randn(300).cumsum() * 0.1 + np.random.randn(300))
+        estimates = ParameterEstimator().estimate_ar_moments_batch(data, 6)
+        
+        assert sorted(estimates) == list(range(1, 7))
+        for p, (phi, sigma2) in estimates.items():
+            rho, sigma = yule_walker(data.to_numpy(), order=p, method='mle')
+            np.testing.assert_allclose(phi, rho, rtol=1e-8, atol=1e-10)
+            np.testing.assert_allclose(sigma2, sigma ** 2, rtol=1e-8)
+
+    def test_disk_cache_keyed_by_start_params(self):
+        """测试磁盘缓存区分热启动初值与默认初值的拟合"""
+        pytest.importorskip("joblib")
+        from time_series_insight.estimation.parameter_estimator import ParameterEstimator
+        from time_series_insight.utils.digest import series_digest
+
+        np.random.seed(2)
+        data = pd.Series(np.random.randn(200))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            estimator = ParameterEstimator(cache_dir=temp_dir)
+            estimator.fit_model(data, (1, 0, 0))
+            cached_fit = estimator._cached_fit
+            args = (series_digest(data), data, (1, 0, 0), None)
+
+            assert cached_fit.check_call_in_cache(*args, None)
+            assert not cached_fit.check_call_in_cache(*args, np.array([0.0, 0.1, 1.0]))
+
+
+class TestModelEvaluator:
+    """测试ModelEvaluator类"""
+    
+    def setup_method(self):
+        """每个测试方法前的设置"""
+        from statsmodels.tsa.arima_process import arma_generate_sample
+        
+        # ARMA(1,1)过程
+        np.random.seed(0)
+        self.test_series = pd.Series(arma_generate_sample([1, -0.7], [1, 0.4], 400))
+        self.orders = [(0, 0, 1), (0, 0, 3), (1, 0, 1), (5, 0, 0)]
+    
+    def test_fit_many_ranking_matches_exact_mle(self):
+        """测试CSS批量拟合的AIC排序与精确MLE一致"""
+        from time_series_insight.evaluation.model_evaluator import ModelEvaluator
+        
+        css = ModelEvaluator(use_fast=True).fit_many(self.test_series, self.orders)
+        exact = ModelEvaluator(use_fast=False)
+        exact_aics = {order: exact.fit_model(self.test_series, order)['aic'] for order in self.orders}
+        
+        css_ranking = [tuple(int(v) for v in row) for row in css[['p', 'd', 'q']].to_numpy()]
+        assert css_ranking == sorted(self.orders, key=exact_aics.get)
+
+    def test_fit_css_stationary_and_lfilter_path(self, monkeypatch):
+        """测试CSS估计可达到单个系数超过0.99的平稳解，且未安装numba时的滤波实现结果一致"""
+        from statsmodels.tsa.arima_process import arma_generate_sample
+        from time_series_insight.evaluation import _arma_ll
+
+        np.random.seed(1)
+        y = arma_generate_sample([1, -1.2, 0.4], [1, 0.3], 2000)
+        y = y - y.mean()
+        params, resid, sigma2, llf = _arma_ll.fit_css(y, 2, 1)
+        np.testing.assert_allclose(params, [1.2, -0.4, 0.3], atol=0.08)
+        assert np.all(np.abs(np.roots(np.r_[1.0, -params[:2]])) < 1)
+
+        monkeypatch.setattr(_arma_ll, "HAS_NUMBA", False)
+        fallback = _arma_ll.fit_css(y, 2, 1)
+        np.testing.assert_allclose(fallback[0], params, atol=1e-5)
+        np.testing.assert_allclose(fallback[3], llf, rtol=1e-8)
+
+    def test_fit_model_cache_returns_independent_copies(self):
+        """测试拟合结果缓存命中时返回独立的副本，且不保留拟合模型对象"""
+        from time_series_insight.evaluation.model_evaluator import ModelEvaluator, _FIT_CACHE
+
+        _FIT_CACHE.clear()
+        evaluator = ModelEvaluator()
+        first = evaluator.fit_model(self.test_series, (1, 0, 1))
+        assert evaluator.fitted_model is not None
+        first['residuals'].iloc[:] = 0.0
+
+        second = evaluator.fit_model(self.test_series, (1, 0, 1))
+        assert evaluator.fitted_model is None
+        assert second['aic'] == first['aic']
+        assert second['residuals'].abs().sum() > 0
+        assert isinstance(second['model_summary'], str)
+        assert all(isinstance(entry, dict) for entry in _FIT_CACHE.values())
+
+    def test_exact_mle_refits_or_flags_non_convergence(self, monkeypatch):
+        """测试精确MLE达到迭代上限时继续优化，仍未收敛时在结果中标记"""
+        from time_series_insight.evaluation import model_evaluator
+
+        model_evaluator._FIT_CACHE.clear()
+        monkeypatch.setattr(model_evaluator, "EXACT_MLE_MAXITER", 1)
+        result = model_evaluator.ModelEvaluator().fit_model(self.test_series, (1, 0, 1))
+        assert result['success'] and result['converged']
+
+        model_evaluator._FIT_CACHE.clear()
+        monkeypatch.setattr(model_evaluator, "MLE_FIT_KWARGS",
+                            dict(model_evaluator.MLE_FIT_KWARGS, maxiter=1))
+        evaluator = model_evaluator.ModelEvaluator()
+        report = evaluator.generate_evaluation_report(self.test_series, (1, 0, 1))
+        assert report['fit_statistics']['converged'] is False
+        assert any('未收敛' in item for item in report['recommendations'])
+        model_evaluator._FIT_CACHE.clear()
+
+    def test_fit_many_parallel_and_sequential(self, monkeypatch):
+        """测试fit_many的joblib并行路径及未安装joblib时的顺序回退结果一致"""
+        pytest.importorskip("joblib")
+        from time_series_insight.evaluation import model_evaluator
+        
+        orders = self.orders + [(1, 1, 1)]
+        evaluator = model_evaluator.ModelEvaluator(use_fast=True)
+        sequential = evaluator.fit_many(self.test_series, orders)
+        parallel = evaluator.fit_many(self.test_series, orders, n_jobs=2)
+        pd.testing.assert_frame_equal(parallel, sequential)
+        
+        monkeypatch.setattr(model_evaluator, "joblib", None)
+        fallback = evaluator.fit_many(self.test_series, orders, n_jobs=2)
+        pd.testing.assert_frame_equal(fallback, sequential)
+        
+        assert list(sequential.columns) == ['p', 'd', 'q', 'aic', 'bic', 'hqic', 'loglikelihood', 'sigma2']
+        assert len(sequential) == len(orders)
+        assert sequential['aic'].is_monotonic_increasing
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_evaluation_report_to_json(self, monkeypatch, use_orjson):
+        """测试评估报告的JSON导出可以完整读回"""
+        import json
+        from time_series_insight.evaluation.model_evaluator import ModelEvaluator
+        from time_series_insight.utils import serialization
+        if not use_orjson:
+            monkeypatch.setattr(serialization, "orjson", None)
+        
+        evaluator = ModelEvaluator()
+        with pytest.raises(ValueError):
+            evaluator.to_json()
+        
+        report = evaluator.generate_evaluation_report(self.test_series, (1, 0, 1))
+        loaded = json.loads(evaluator.to_json(indent=True))
+        
+        assert loaded['success'] is True
+        assert loaded['model_info']['order'] == [1, 0, 1]
+        assert loaded['fit_statistics']['aic'] == pytest.approx(report['fit_statistics']['aic'])
+        np.testing.assert_allclose(loaded['residual_analysis']['acf_pacf']['acf_values'],
+                                   report['residual_analysis']['acf_pacf']['acf_values'])
+        assert loaded['model_adequacy'] == report['model_adequacy']
+    
+    def test_jarque_bera_matches_scipy(self):
+        """测试由矩计算的Jarque-Bera检验与scipy一致"""
+        from scipy import stats
+        from time_series_insight.evaluation.model_evaluator import ModelEvaluator
+        
+        residuals = np.random.default_rng(0).standard_t(5, size=500)
+        result = ModelEvaluator()._test_normality(residuals)['jarque_bera']
+        expected = stats.jarque_bera(residuals)
+        
+        np.testing.assert_allclose(result['statistic'], expected.statistic, rtol=1e-10)
+        np.testing.assert_allclose(result['p_value'], expected.pvalue, rtol=1e-8)
+    
+    @pytest.mark.parametrize("has_numba", [True, False])
+    def test_sample_moments_matches_scipy(self, monkeypatch, has_numba):
+        """测试样本矩在numba与numpy两条路径上都与scipy一致"""
+        from scipy import stats
+        from time_series_insight.utils import moments
+        if has_numba and not moments.HAS_NUMBA:
+            pytest.skip("未安装numba")
+        monkeypatch.setattr(moments, "HAS_NUMBA", has_numba)
+
+        x = np.random.default_rng(0).standard_t(5, size=1000) + 3.0
+        n, mean, var, skew, kurt, ss, mn, mx = moments.sample_moments(x)
+
+        assert n == len(x)
+        np.testing.assert_allclose([mean, var, ss, mn, mx],
+                                   [x.mean(), x.var(ddof=1), x @ x, x.min(), x.max()], rtol=1e-10)
+        np.testing.assert_allclose(skew, stats.skew(x), rtol=1e-8)
+        np.testing.assert_allclose(kurt, stats.kurtosis(x), rtol=1e-8)
+
+    def test_ljung_box_matches_statsmodels(self):
+        """测试由ACF累加的Ljung-Box检验与statsmodels一致"""
+        from statsmodels.stats.diagnostic import acorr_ljungbox
+        from time_series_insight.evaluation.model_evaluator import ModelEvaluator
+        
+        residuals = self.test_series.to_numpy()
+        expected = acorr_ljungbox(residuals, lags=10)
+        evaluator = ModelEvaluator()
+        acf_values = evaluator._calculate_residual_acf_pacf(residuals)['acf_values']
+        
+        # 复用已算得的ACF与重新计算ACF两条路径
+        for acf_input in (acf_values, None):
+            result = evaluator._test_autocorrelation(residuals, acf_input)['ljung_box']
+            np.testing.assert_allclose(result['detailed_results']['lb_stat'], expected['lb_stat'], rtol=1e-10)
+            np.testing.assert_allclose(result['detailed_results']['lb_pvalue'], expected['lb_pvalue'],
+                                       rtol=1e-8, atol=1e-300)
+    
+    def test_residual_acf_pacf_same_with_and_without_confint(self):
+        """测试是否计算置信区间时残差ACF/PACF一致"""
+        from time_series_insight.evaluation.model_evaluator import ModelEvaluator
+        
+        residuals = self.test_series.to_numpy()
+        evaluator = ModelEvaluator()
+        with_confint = evaluator._calculate_residual_acf_pacf(residuals, want_confint=True)
+        without_confint = evaluator._calculate_residual_acf_pacf(residuals, want_confint=False)
+        
+        np.testing.assert_array_equal(with_confint['acf_values'], without_confint['acf_values'])
+        np.testing.assert_array_equal(with_confint['pacf_values'], without_confint['pacf_values'])
+
+
 class TestDataTypes:
     """测试不同数据类型的处理"""
     
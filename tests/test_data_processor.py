@@ -79,6 +79,89 @@ class TestTimeSeriesProcessor:
         finally:
             os.unlink(temp_file)
     
+    def test_load_large_csv_in_chunks(self, monkeypatch):
+        """测试大文件分块读取与整体读取结果一致"""
+        from time_series_insight.core import data_processor
+        monkeypatch.setattr(data_processor, "CHUNKED_READ_THRESHOLD", 0)
+        monkeypatch.setattr(data_processor, "CHUNK_ROWS", 7)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "large.csv")
+            pd.DataFrame({
+                'date': self.test_series.index,
+                'other': 0,
+                'value': self.test_series.values
+            }).to_csv(temp_file, index=False)
+            
+            result = self.processor.load_data(temp_file, date_column='date', value_column='value')
+        
+        assert isinstance(result.index, pd.DatetimeIndex)
+        assert len(result) == len(self.test_series)
+        np.testing.assert_array_almost_equal(result.values, self.test_series.values)
+        assert (result.index == self.test_series.index).all()
+    
+    def test_load_large_csv_int_then_float(self, monkeypatch):
+        """测试分块读取时数值列先为整数、后出现小数"""
+        from time_series_insight.core import data_processor
+        monkeypatch.setattr(data_processor, "CHUNKED_READ_THRESHOLD", 0)
+        
+        # 超过pyarrow默认的1MB数据块，使小数只出现在后续数据块中
+        n = 200_000
+        values = np.arange(n, dtype=np.float64)
+        values[-1] = 1.5
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "large.csv")
+            with open(temp_file, 'w') as f:
+                f.write("date,value\n")
+                dates = pd.date_range('2000-01-01', periods=n, freq='min').strftime('%Y-%m-%d %H:%M:%S')
+                f.writelines(f"{d},{v:g}\n" for d, v in zip(dates, values))
+            
+            result = self.processor.load_data(temp_file, date_column='date', value_column='value')
+        
+        assert len(result) == n
+        np.testing.assert_array_equal(result.values, values)
+    
+    def test_load_data_parquet_cache(self):
+        """测试文件数据的parquet缓存"""
+        pytest.importorskip("pyarrow")
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "data.csv")
+            pd.DataFrame({
+                'date': self.test_series.index,
+                'value': self.test_series.values
+            }).to_csv(temp_file, index=False)
+            
+            cache_dir = os.path.join(temp_dir, "cache")
+            first = TimeSeriesProcessor(cache_dir=cache_dir).load_data(
+                temp_file, date_column='date', value_column='value')
+            assert len(os.listdir(cache_dir)) == 1
+            
+            second = TimeSeriesProcessor(cache_dir=cache_dir).load_data(
+                temp_file, date_column='date', value_column='value')
+        
+        pd.testing.assert_series_equal(first, second)
+    
+    def test_load_data_cache_mixed_type_column(self):
+        """测试数值列混有文本时缓存写入失败不影响加载"""
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("openpyxl")
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "data.xlsx")
+            pd.DataFrame({
+                'date': self.test_series.index,
+                'value': ['missing'] + list(self.test_series.values[1:])
+            }).to_excel(temp_file, index=False)
+            
+            cache_dir = os.path.join(temp_dir, "cache")
+            result = TimeSeriesProcessor(cache_dir=cache_dir).load_data(
+                temp_file, date_column='date', value_column='value')
+            assert os.listdir(cache_dir) == []
+        
+        assert len(result) == len(self.test_series) - 1
+        np.testing.assert_array_almost_equal(result.values, self.test_series.values[1:])
+    
     def test_check_stationarity_stationary(self):
         """测试平稳序列的平稳性检验"""
         # 创建平稳序列（白噪声）
@@ -104,6 +187,16 @@ class TestTimeSeriesProcessor:
         # 非平稳序列应该被检测为非平稳
         assert not result['overall']['is_stationary']
     
+    def test_check_stationarity_short_series(self):
+        """测试样本过少时直接返回不确定的结论"""
+        self.processor.load_data(self.test_series[:10])
+        
+        result = self.processor.check_stationarity()
+        
+        assert 'adf' not in result
+        assert result['overall']['is_stationary'] is False
+        assert not self.processor.is_stationary
+    
     def test_difference(self):
         """测试差分功能"""
         self.processor.load_data(self.test_series)
@@ -119,6 +212,38 @@ class TestTimeSeriesProcessor:
         expected_diff = self.test_series.diff().dropna()
         np.testing.assert_array_almost_equal(diff_result.values, expected_diff.values)
     
+    def test_float32_data_preserved(self):
+        """测试float32数据在加载和差分后保持float32"""
+        result = self.processor.load_data(self.test_series.astype(np.float32))
+        assert result.dtype == np.float32
+        assert self.processor.values.dtype == np.float64
+        
+        diff_result = self.processor.difference(order=1)
+        assert diff_result.dtype == np.float32
+        
+        stationarity = self.processor.check_stationarity()
+        assert 'overall' in stationarity
+    
+    @pytest.mark.parametrize("has_numba", [True, False])
+    def test_lag1_autocorrelations(self, monkeypatch, has_numba):
+        """测试各阶差分的滞后1自相关与numpy计算结果一致（含未安装numba时的实现）"""
+        from time_series_insight.core import data_processor
+        if has_numba and not data_processor.HAS_NUMBA:
+            pytest.skip("未安装numba")
+        monkeypatch.setattr(data_processor, "HAS_NUMBA", has_numba)
+        
+        arr = self.non_stationary_series.to_numpy(dtype=np.float64)
+        r1 = data_processor._lag1_autocorrelations(arr, 2)
+        assert np.isnan(data_processor._lag1_autocorrelations(arr[:4], 2)[2])
+        
+        current = arr
+        for order in range(3):
+            if order > 0:
+                current = np.diff(current)
+            centered = current - current.mean()
+            expected = np.dot(centered[:-1], centered[1:]) / np.dot(centered, centered)
+            assert r1[order] == pytest.approx(expected)
+    
     def test_auto_difference(self):
         """测试自动差分功能"""
         self.processor.load_data(self.non_stationary_series)
@@ -15,12 +15,18 @@ __version__ = "0.1.0"
 __author__ = "Time Series Insight Assistant"
 __email__ = "contact@example.com"
 
-from .core.data_processor import TimeSeriesProcessor
-from .analysis.model_identifier import ModelIdentifier
-from .estimation.parameter_estimator import ParameterEstimator
-from .evaluation.model_evaluator import ModelEvaluator
-from .visualization.plotter import TimeSeriesPlotter
-from .api import TimeSeriesInsight, analyze_time_series
+import importlib
+
+# 公开名称 -> 所在子模块；按需导入（PEP 562），避免import本包时就加载statsmodels/matplotlib
+_LAZY_IMPORTS = {
+    "TimeSeriesProcessor": ".core.data_processor",
+    "ModelIdentifier": ".analysis.model_identifier",
+    "ParameterEstimator": ".estimation.parameter_estimator",
+    "ModelEvaluator": ".evaluation.model_evaluator",
+    "TimeSeriesPlotter": ".visualization.plotter",
+    "TimeSeriesInsight": ".api",
+    "analyze_time_series": ".api",
+}
 
 __all__ = [
     "TimeSeriesProcessor",
@@ -31,3 +37,16 @@ __all__ = [
     "TimeSeriesInsight",
     "analyze_time_series",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
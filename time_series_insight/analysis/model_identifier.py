@@ -4,14 +4,53 @@
 实现ACF/PACF计算、截尾拖尾模式识别和ARIMA模型自动推荐功能。
 """
 
+import heapq
+from operator import itemgetter
+
 import numpy as np
 import pandas as pd
-from typing import Tuple, Dict, List, Any, Optional
-from statsmodels.tsa.stattools import acf, pacf
+from typing import Tuple, Dict, List, Any, Optional, Union
+from scipy import stats
 from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.stats.diagnostic import acorr_ljungbox
 import warnings
 
+from ..utils.autocorr import acovf, levinson_durbin_path
+
+
+def acf_pacf_with_confint(data: Union[pd.Series, np.ndarray],
+                          lags: int = 20,
+                          alpha: float = 0.05) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    基于同一组样本自协方差计算ACF、PACF及其置信区间
+    
+    Returns:
+        (acf_values, pacf_values, acf_confint, pacf_confint)
+    """
+    x = np.ascontiguousarray(data, dtype=np.float64)
+    n = len(x)
+    z = stats.norm.ppf(1 - alpha / 2.0)
+    
+    # ACF与PACF共用一次计算的（有偏）自协方差
+    acov = acovf(x, lags)
+    
+    # 计算ACF，置信区间采用Bartlett公式（与statsmodels.acf一致）
+    acf_values = acov / acov[0]
+    varacf = np.ones(lags + 1) / n
+    varacf[0] = 0
+    varacf[2:] *= 1 + 2 * np.cumsum(acf_values[1:-1] ** 2)
+    interval = z * np.sqrt(varacf)
+    acf_confint = np.column_stack((acf_values - interval, acf_values + interval))
+    
+    # 计算PACF：在同一自协方差上做Levinson-Durbin递推（等价于pacf(method='ywm')）
+    pacf_values = np.concatenate(([1.0], levinson_durbin_path(acov, lags)[1]))
+    varpacf = np.full(lags + 1, 1.0 / n)
+    varpacf[0] = 0
+    interval = z * np.sqrt(varpacf)
+    pacf_confint = np.column_stack((pacf_values - interval, pacf_values + interval))
+    
+    return acf_values, pacf_values, acf_confint, pacf_confint
+
 
 class ModelIdentifier:
     """ARIMA模型识别器"""
@@ -25,7 +64,7 @@ class ModelIdentifier:
         self.recommended_models: List[Dict[str, Any]] = []
         
     def calculate_acf_pacf(self, 
-                          data: pd.Series, 
+                          data: Union[pd.Series, np.ndarray], 
                           lags: int = 20,
                           alpha: float = 0.05) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
@@ -39,21 +78,8 @@ class ModelIdentifier:
         Returns:
             (acf_values, pacf_values, acf_confint, pacf_confint)
         """
-        # 计算ACF
-        acf_result = acf(data, nlags=lags, alpha=alpha, fft=False)
-        if isinstance(acf_result, tuple):
-            self.acf_values, self.acf_confint = acf_result
-        else:
-            self.acf_values = acf_result
-            self.acf_confint = None
-        
-        # 计算PACF
-        pacf_result = pacf(data, nlags=lags, alpha=alpha)
-        if isinstance(pacf_result, tuple):
-            self.pacf_values, self.pacf_confint = pacf_result
-        else:
-            self.pacf_values = pacf_result
-            self.pacf_confint = None
+        (self.acf_values, self.pacf_values,
+         self.acf_confint, self.pacf_confint) = acf_pacf_with_confint(data, lags, alpha)
         
         return self.acf_values, self.pacf_values, self.acf_confint, self.pacf_confint
     
@@ -145,9 +171,12 @@ class ModelIdentifier:
         Returns:
             推荐的模型列表
         """
+        # 一次性转换为连续的float64数组，后续计算不再经过pandas
+        values = np.ascontiguousarray(data, dtype=np.float64)
+        
         # 计算ACF和PACF
-        lags = min(len(data) // 4, 20)  # 动态确定滞后数
-        self.calculate_acf_pacf(data, lags=lags)
+        lags = min(len(values) // 4, 20)  # 动态确定滞后数
+        self.calculate_acf_pacf(values, lags=lags)
         
         # 分析ACF和PACF模式
         acf_pattern = self._identify_cutoff_pattern(self.acf_values, self.acf_confint)
@@ -221,19 +250,19 @@ class ModelIdentifier:
             (2, d, 0), (0, d, 2), (2, d, 1), (1, d, 2)
         ]
         
-        for order in common_models:
-            if order not in [m["order"] for m in models]:
-                models.append({
-                    "order": order,
-                    "type": f"ARIMA{order}",
-                    "reasoning": "常用低阶模型",
-                    "confidence": 0.3
-                })
-        
-        # 按置信度排序
-        models.sort(key=lambda x: x["confidence"], reverse=True)
+        seen_orders = {m["order"] for m in models}
+        models.extend(
+            {
+                "order": order,
+                "type": f"ARIMA{order}",
+                "reasoning": "常用低阶模型",
+                "confidence": 0.3
+            }
+            for order in common_models if order not in seen_orders
+        )
         
-        self.recommended_models = models[:10]  # 保留前10个推荐
+        # 按置信度取前10个推荐（nlargest与稳定排序后截断的结果一致）
+        self.recommended_models = heapq.nlargest(10, models, key=itemgetter("confidence"))
         return self.recommended_models
     
     def get_analysis_summary(self) -> Dict[str, Any]:
@@ -6,14 +6,121 @@
 
 import pandas as pd
 import numpy as np
-from typing import Union, Dict, Any, Optional, Tuple, List
+from typing import TYPE_CHECKING, Union, Dict, Any, Optional, Tuple, List
 from pathlib import Path
+from dataclasses import dataclass
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from pandas.tseries.frequencies import to_offset
 
-from .core.data_processor import TimeSeriesProcessor
-from .analysis.model_identifier import ModelIdentifier
-from .estimation.parameter_estimator import ParameterEstimator
-from .evaluation.model_evaluator import ModelEvaluator
-from .visualization.plotter import TimeSeriesPlotter
+from .utils.serialization import dump_json
+
+if TYPE_CHECKING:
+    from .core.data_processor import TimeSeriesProcessor
+    from .analysis.model_identifier import ModelIdentifier
+    from .estimation.parameter_estimator import ParameterEstimator
+    from .evaluation.model_evaluator import ModelEvaluator
+    from .visualization.plotter import TimeSeriesPlotter
+
+
+def _fit_and_evaluate(data: pd.Series,
+                      order: Tuple[int, int, int],
+                      cache_dir: Optional[Union[str, Path]] = None,
+                      use_fast: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """对单个候选阶数执行参数估计和模型评估（子进程入口，需定义在模块顶层）"""
+    from .estimation.parameter_estimator import ParameterEstimator
+    from .evaluation.model_evaluator import ModelEvaluator
+    
+    estimation_results = ParameterEstimator(cache_dir=cache_dir).estimate_parameters(data, order)
+    evaluation_result = ModelEvaluator(use_fast=use_fast).generate_evaluation_report(data, order)
+    return estimation_results, evaluation_result
+
+
+def _evaluate_in_processes(data: pd.Series,
+                           orders: List[Tuple[int, int, int]],
+                           n_jobs: int,
+                           cache_dir: Optional[Union[str, Path]] = None,
+                           use_fast: bool = False) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    使用多进程并行拟合多个候选模型
+    
+    Args:
+        data: 时间序列数据
+        orders: 候选ARIMA阶数列表
+        n_jobs: 进程数，小于0时使用全部CPU
+        cache_dir: 拟合结果缓存目录
+        use_fast: 模型评估是否使用CSS快速拟合（与主进程评估器的设置一致）
+        
+    Returns:
+        与orders一一对应的(参数估计结果, 评估结果)列表
+    """
+    max_workers = None if n_jobs < 0 else min(n_jobs, len(orders))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_fit_and_evaluate, repeat(data), orders,
+                                 repeat(cache_dir), repeat(use_fast)))
+
+
+@dataclass
+class _FlatSummary:
+    """analyze()结果的扁平摘要，摘要、导出和绘图直接读取，无需重复遍历嵌套字典"""
+    __slots__ = (
+        'stationarity', 'differencing', 'best_order', 'aic', 'bic',
+        'r_squared', 'adequacy_score', 'adequacy_level', 'model_rows',
+    )
+    
+    stationarity: Optional[Dict[str, Any]]
+    differencing: Optional[Dict[str, Any]]
+    best_order: Optional[Tuple[int, int, int]]
+    aic: Optional[float]
+    bic: Optional[float]
+    r_squared: Optional[float]
+    adequacy_score: Optional[float]
+    adequacy_level: Optional[str]
+    model_rows: List[Dict[str, Any]]
+    
+    @classmethod
+    def from_results(cls, results: Dict[str, Any]) -> "_FlatSummary":
+        """从analyze()的结果字典构建摘要"""
+        stationarity = None
+        if 'stationarity' in results:
+            overall = results['stationarity']['overall']
+            stationarity = {
+                "is_stationary": overall['is_stationary'],
+                "interpretation": overall['interpretation']
+            }
+        
+        differencing = None
+        if 'differencing' in results:
+            diff_info = results['differencing']
+            differencing = {
+                "applied": diff_info['applied'],
+                "order": diff_info['order']
+            }
+        
+        # 各候选模型的评估指标
+        model_rows = []
+        for model in results.get('model_evaluation', []):
+            eval_stats = model['evaluation']['fit_statistics']
+            model_rows.append({
+                'order': model['order'],
+                'aic': eval_stats['aic'],
+                'bic': eval_stats['bic'],
+                'hqic': eval_stats['hqic'],
+                'r_squared': eval_stats['r_squared'],
+                'adequacy_score': model['evaluation']['model_adequacy']['score']
+            })
+        
+        best_model = results.get('best_model')
+        if best_model is None:
+            return cls(stationarity, differencing, None, None, None, None, None, None, model_rows)
+        
+        eval_stats = best_model['evaluation']['fit_statistics']
+        adequacy = best_model['evaluation']['model_adequacy']
+        return cls(
+            stationarity, differencing, best_model['order'],
+            eval_stats['aic'], eval_stats['bic'], eval_stats['r_squared'],
+            adequacy['score'], adequacy['level'], model_rows
+        )
 
 
 class TimeSeriesInsight:
@@ -29,17 +136,72 @@ class TimeSeriesInsight:
     - 可视化
     """
     
-    def __init__(self):
-        """初始化时间序列洞察助手"""
-        self.processor = TimeSeriesProcessor()
-        self.identifier = ModelIdentifier()
-        self.estimator = ParameterEstimator()
-        self.evaluator = ModelEvaluator()
-        self.plotter = TimeSeriesPlotter()
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        """
+        初始化时间序列洞察助手
+        
+        Args:
+            cache_dir: ARIMA拟合结果和文件数据（parquet）的磁盘缓存目录，
+                重复分析相同数据时直接复用；默认不缓存
+        """
+        self.cache_dir = cache_dir
+        
+        # 各组件依赖statsmodels/matplotlib等重量级模块，首次访问时才导入并创建
+        self._processor = None
+        self._identifier = None
+        self._estimator = None
+        self._evaluator = None
+        self._plotter = None
         
         # 存储分析结果
         self.data = None
         self.analysis_results = {}
+        self._forecast_freq = None
+        self._forecast_index: Optional[pd.DatetimeIndex] = None
+        self._data_info: Optional[Dict[str, Any]] = None
+        # analysis_results的扁平摘要及其来源字典（按对象身份判断是否过期）
+        self._flat_summary: Optional[_FlatSummary] = None
+        self._flat_summary_source: Optional[Dict[str, Any]] = None
+    
+    @property
+    def processor(self) -> "TimeSeriesProcessor":
+        """数据处理器"""
+        if self._processor is None:
+            from .core.data_processor import TimeSeriesProcessor
+            self._processor = TimeSeriesProcessor(cache_dir=self.cache_dir)
+        return self._processor
+    
+    @property
+    def identifier(self) -> "ModelIdentifier":
+        """模型识别器"""
+        if self._identifier is None:
+            from .analysis.model_identifier import ModelIdentifier
+            self._identifier = ModelIdentifier()
+        return self._identifier
+    
+    @property
+    def estimator(self) -> "ParameterEstimator":
+        """参数估计器"""
+        if self._estimator is None:
+            from .estimation.parameter_estimator import ParameterEstimator
+            self._estimator = ParameterEstimator(cache_dir=self.cache_dir)
+        return self._estimator
+    
+    @property
+    def evaluator(self) -> "ModelEvaluator":
+        """模型评估器"""
+        if self._evaluator is None:
+            from .evaluation.model_evaluator import ModelEvaluator
+            self._evaluator = ModelEvaluator()
+        return self._evaluator
+    
+    @property
+    def plotter(self) -> "TimeSeriesPlotter":
+        """可视化器"""
+        if self._plotter is None:
+            from .visualization.plotter import TimeSeriesPlotter
+            self._plotter = TimeSeriesPlotter()
+        return self._plotter
         
     def load_data(self, 
                   data: Union[str, Path, pd.Series, pd.DataFrame, np.ndarray],
@@ -62,13 +224,48 @@ class TimeSeriesInsight:
             data, date_column=date_column, 
             value_column=value_column, date_format=date_format
         )
+        # 预测索引的频率和数据统计量只在加载数据时计算一次
+        self._forecast_freq = self._infer_forecast_freq(self.data.index)
+        self._forecast_index = None
+        self._data_info = self._describe_data(self.data)
+        self._flat_summary = None
         return self.data
     
+    @staticmethod
+    def _describe_data(data: pd.Series) -> Dict[str, Any]:
+        """计算数据的基本信息"""
+        return {
+            "length": len(data),
+            "start": str(data.index[0]) if len(data) > 0 else None,
+            "end": str(data.index[-1]) if len(data) > 0 else None,
+            "mean": float(data.mean()),
+            "std": float(data.std())
+        }
+    
+    @staticmethod
+    def _infer_forecast_freq(index: pd.Index) -> Optional[pd.DateOffset]:
+        """推断预测索引的频率，非日期索引返回None"""
+        if not isinstance(index, pd.DatetimeIndex) or len(index) < 2:
+            return None
+        
+        freq = index.freq
+        if freq is None:
+            try:
+                freq = pd.infer_freq(index)
+            except (TypeError, ValueError):
+                freq = None
+        if freq is None:
+            # 无法推断时使用最后两个观测的时间间隔
+            freq = index[-1] - index[-2]
+        
+        return to_offset(freq)
+    
     def analyze(self, 
                 auto_diff: bool = True,
                 max_p: int = 5,
                 max_q: int = 5,
-                n_models: int = 3) -> Dict[str, Any]:
+                n_models: int = 3,
+                n_jobs: int = 1) -> Dict[str, Any]:
         """
         执行完整的时间序列分析
         
@@ -77,6 +274,7 @@ class TimeSeriesInsight:
             max_p: 最大AR阶数
             max_q: 最大MA阶数
             n_models: 评估的模型数量
+            n_jobs: 并行拟合候选模型的进程数，1表示在当前进程中依次拟合，-1表示使用全部CPU
             
         Returns:
             完整的分析结果
@@ -117,16 +315,24 @@ class TimeSeriesInsight:
         }
         
         # 4. 参数估计和模型评估
+        candidates = recommended_models[:n_models]
+        orders = [model_info['order'] for model_info in candidates]
+        if n_jobs == 1 or len(orders) <= 1:
+            # 参数估计和模型评估
+            outcomes = [
+                (self.estimator.estimate_parameters(self.data, order),
+                 self.evaluator.generate_evaluation_report(self.data, order))
+                for order in orders
+            ]
+        else:
+            # 每个候选模型的拟合相互独立，分发到多个进程并行执行
+            outcomes = _evaluate_in_processes(self.data, orders, n_jobs, self.cache_dir,
+                                              self.evaluator.use_fast)
+        
         evaluated_models = []
-        for i, model_info in enumerate(recommended_models[:n_models]):
+        for model_info, (estimation_results, evaluation_result) in zip(candidates, outcomes):
             order = model_info['order']
             
-            # 参数估计
-            estimation_results = self.estimator.estimate_parameters(self.data, order)
-            
-            # 模型评估
-            evaluation_result = self.evaluator.generate_evaluation_report(self.data, order)
-            
             if evaluation_result.get('success', False):
                 model_result = {
                     'order': order,
@@ -140,13 +346,18 @@ class TimeSeriesInsight:
         
         # 5. 选择最佳模型
         if evaluated_models:
-            # 根据AIC选择最佳模型
-            best_model = min(evaluated_models, 
-                           key=lambda x: x['evaluation']['fit_statistics']['aic'])
-            results['best_model'] = best_model
+            # 根据AIC选择最佳模型（AIC为NaN的模型不参与比较，全部为NaN时取第一个）
+            aics = np.fromiter(
+                (m['evaluation']['fit_statistics']['aic'] for m in evaluated_models),
+                dtype=np.float64, count=len(evaluated_models)
+            )
+            best_index = 0 if np.isnan(aics).all() else int(np.nanargmin(aics))
+            results['best_model'] = evaluated_models[best_index]
         
         # 保存结果
         self.analysis_results = results
+        self._flat_summary = _FlatSummary.from_results(results)
+        self._flat_summary_source = results
         return results
     
     def quick_analysis(self, 
@@ -168,7 +379,7 @@ class TimeSeriesInsight:
         
         # 提取分析参数
         analyze_params = {k: v for k, v in kwargs.items() 
-                         if k in ['auto_diff', 'max_p', 'max_q', 'n_models']}
+                         if k in ['auto_diff', 'max_p', 'max_q', 'n_models', 'n_jobs']}
         
         # 加载数据
         self.load_data(data, **load_params)
@@ -195,52 +406,119 @@ class TimeSeriesInsight:
         Returns:
             预测结果
         """
+        fitted_model, order = self._get_best_fitted_model()
+        
+        # 进行预测
+        forecast, conf_int = self._forecast(fitted_model, steps, alpha)
+        return self._build_forecast_result(forecast, conf_int, steps, order)
+    
+    def predict_batch(self,
+                      steps_list: List[int],
+                      alpha: float = 0.05) -> List[Dict[str, Any]]:
+        """
+        使用最佳模型一次性生成多个预测步长的结果
+        
+        只按最大步长调用一次模型预测，较短步长的结果取其前缀，
+        避免对每个步长重复运行状态空间滤波。
+        
+        Args:
+            steps_list: 预测步数列表
+            alpha: 置信水平
+            
+        Returns:
+            与steps_list一一对应的预测结果列表
+        """
+        fitted_model, order = self._get_best_fitted_model()
+        if not steps_list:
+            return []
+        
+        forecast, conf_int = self._forecast(fitted_model, max(steps_list), alpha)
+        return [
+            self._build_forecast_result(
+                forecast[:steps],
+                conf_int[:steps] if conf_int is not None else None,
+                steps, order
+            )
+            for steps in steps_list
+        ]
+    
+    def _get_best_fitted_model(self) -> Tuple[Any, Tuple[int, int, int]]:
+        """获取最佳模型的拟合结果对象及其阶数"""
         best_model = self.get_best_model()
         if best_model is None:
             raise ValueError("没有可用的模型，请先执行分析")
         
-        # 获取拟合的模型
-        if 'fitted_model' in best_model['estimation'].get('mle', {}):
-            fitted_model = best_model['estimation']['mle']['fitted_model']
-            
-            # 进行预测
-            forecast_result = fitted_model.forecast(steps=steps, alpha=alpha)
-            
-            if isinstance(forecast_result, tuple):
-                forecast, conf_int = forecast_result
-            else:
-                forecast = forecast_result
-                conf_int = None
-            
-            # 创建预测索引
-            if isinstance(self.data.index, pd.DatetimeIndex):
-                # 尝试推断频率
-                freq = self.data.index.freq
-                if freq is None:
-                    # 估算频率
-                    time_diff = self.data.index[-1] - self.data.index[-2]
-                    freq = time_diff
-                
-                forecast_index = pd.date_range(
-                    start=self.data.index[-1] + freq,
-                    periods=steps,
-                    freq=freq
-                )
-            else:
-                forecast_index = range(len(self.data), len(self.data) + steps)
-            
-            forecast_series = pd.Series(forecast, index=forecast_index)
-            
-            result = {
-                'forecast': forecast_series,
-                'confidence_intervals': conf_int,
-                'model_order': best_model['order'],
-                'forecast_steps': steps
-            }
-            
-            return result
-        else:
+        if not best_model['estimation'].get('mle', {}).get('success'):
             raise ValueError("最佳模型没有拟合结果")
+        
+        return self._get_fitted_model(best_model), best_model['order']
+    
+    def _get_fitted_model(self, model_result: Dict[str, Any]) -> Any:
+        """
+        获取候选模型的拟合结果对象
+        
+        估计器中已淘汰或在子进程中拟合的结果按阶数重新拟合（启用cache_dir时直接读取磁盘缓存）。
+        """
+        fitted_model = self.estimator.get_fitted_model(model_result['estimation']['mle'].get('fit_id'))
+        if fitted_model is None:
+            fitted_model = self.estimator.fit_model(self.data, model_result['order'])
+        return fitted_model
+    
+    @staticmethod
+    def _forecast(fitted_model: Any, steps: int, alpha: float) -> Tuple[np.ndarray, Any]:
+        """调用拟合模型进行预测，返回预测值数组和置信区间"""
+        forecast_result = fitted_model.forecast(steps=steps, alpha=alpha)
+        
+        if isinstance(forecast_result, tuple):
+            forecast, conf_int = forecast_result
+        else:
+            forecast = forecast_result
+            conf_int = None
+        
+        return np.asarray(forecast), conf_int
+    
+    def _build_forecast_result(self,
+                               forecast: np.ndarray,
+                               conf_int: Any,
+                               steps: int,
+                               order: Tuple[int, int, int]) -> Dict[str, Any]:
+        """组装预测结果字典"""
+        # 创建预测索引
+        if self._forecast_freq is not None:
+            forecast_index = self._get_forecast_index(steps)
+        else:
+            forecast_index = pd.RangeIndex(len(self.data), len(self.data) + steps)
+        
+        forecast_series = pd.Series(np.asarray(forecast), index=forecast_index, copy=False)
+        
+        return {
+            'forecast': forecast_series,
+            'confidence_intervals': conf_int,
+            'model_order': order,
+            'forecast_steps': steps
+        }
+    
+    def _get_forecast_index(self, steps: int) -> pd.DatetimeIndex:
+        """
+        获取从数据末尾开始的预测日期索引
+        
+        索引在多次预测间复用，只有步数超过已生成的长度时才向后延伸。
+        """
+        index = self._forecast_index
+        if index is None:
+            index = pd.date_range(
+                start=self.data.index[-1] + self._forecast_freq,
+                periods=steps,
+                freq=self._forecast_freq
+            )
+        elif len(index) < steps:
+            index = index.append(pd.date_range(
+                start=index[-1] + self._forecast_freq,
+                periods=steps - len(index),
+                freq=self._forecast_freq
+            ))
+        self._forecast_index = index
+        return index[:steps]
     
     def plot_analysis(self, 
                      save_dir: Optional[Union[str, Path]] = None,
@@ -285,8 +563,8 @@ class TimeSeriesInsight:
         
         # 3. 残差诊断图
         best_model = self.get_best_model()
-        if best_model and 'fitted_model' in best_model['estimation'].get('mle', {}):
-            fitted_model = best_model['estimation']['mle']['fitted_model']
+        if best_model and best_model['estimation'].get('mle', {}).get('success'):
+            fitted_model = self._get_fitted_model(best_model)
             residuals = fitted_model.resid
             fitted_values = fitted_model.fittedvalues
             
@@ -298,18 +576,13 @@ class TimeSeriesInsight:
             plots_info['residual_diagnostics'] = fig3
         
         # 4. 模型比较图
-        if 'model_evaluation' in self.analysis_results:
-            models = self.analysis_results['model_evaluation']
-            if len(models) > 1:
-                model_results = []
-                for model in models:
-                    eval_stats = model['evaluation']['fit_statistics']
-                    model_results.append({
-                        'order': model['order'],
-                        'aic': eval_stats['aic'],
-                        'bic': eval_stats['bic'],
-                        'hqic': eval_stats['hqic']
-                    })
+        if self.analysis_results:
+            model_rows = self._get_flat_summary().model_rows
+            if len(model_rows) > 1:
+                model_results = [
+                    {key: row[key] for key in ('order', 'aic', 'bic', 'hqic')}
+                    for row in model_rows
+                ]
                 
                 fig4 = self.plotter.plot_model_comparison(
                     model_results,
@@ -329,50 +602,45 @@ class TimeSeriesInsight:
         if not self.analysis_results:
             return {"error": "请先执行分析"}
         
-        summary = {
-            "data_info": {
-                "length": len(self.data),
-                "start": str(self.data.index[0]) if len(self.data) > 0 else None,
-                "end": str(self.data.index[-1]) if len(self.data) > 0 else None,
-                "mean": float(self.data.mean()),
-                "std": float(self.data.std())
-            }
-        }
+        if self._data_info is None:
+            self._data_info = self._describe_data(self.data)
+        
+        flat = self._get_flat_summary()
+        summary = {"data_info": dict(self._data_info)}
         
         # 平稳性信息
-        if 'stationarity' in self.analysis_results:
-            stationarity = self.analysis_results['stationarity']
-            summary["stationarity"] = {
-                "is_stationary": stationarity['overall']['is_stationary'],
-                "interpretation": stationarity['overall']['interpretation']
-            }
+        if flat.stationarity is not None:
+            summary["stationarity"] = dict(flat.stationarity)
         
         # 差分信息
-        if 'differencing' in self.analysis_results:
-            diff_info = self.analysis_results['differencing']
-            summary["differencing"] = {
-                "applied": diff_info['applied'],
-                "order": diff_info['order']
-            }
+        if flat.differencing is not None:
+            summary["differencing"] = dict(flat.differencing)
         
         # 最佳模型信息
-        best_model = self.get_best_model()
-        if best_model:
-            eval_stats = best_model['evaluation']['fit_statistics']
-            adequacy = best_model['evaluation']['model_adequacy']
-            
+        if flat.best_order is not None:
             summary["best_model"] = {
-                "order": best_model['order'],
-                "type": f"ARIMA{best_model['order']}",
-                "aic": eval_stats['aic'],
-                "bic": eval_stats['bic'],
-                "r_squared": eval_stats['r_squared'],
-                "adequacy_score": adequacy['score'],
-                "adequacy_level": adequacy['level']
+                "order": flat.best_order,
+                "type": f"ARIMA{flat.best_order}",
+                "aic": flat.aic,
+                "bic": flat.bic,
+                "r_squared": flat.r_squared,
+                "adequacy_score": flat.adequacy_score,
+                "adequacy_level": flat.adequacy_level
             }
         
         return summary
     
+    def _get_flat_summary(self) -> _FlatSummary:
+        """
+        获取扁平摘要
+        
+        analysis_results被整体替换为另一个字典时重新构建；原地修改该字典不会被察觉。
+        """
+        if self._flat_summary is None or self._flat_summary_source is not self.analysis_results:
+            self._flat_summary = _FlatSummary.from_results(self.analysis_results)
+            self._flat_summary_source = self.analysis_results
+        return self._flat_summary
+    
     def export_results(self, 
                       file_path: Union[str, Path],
                       format: str = 'json') -> None:
@@ -389,30 +657,8 @@ class TimeSeriesInsight:
         file_path = Path(file_path)
         
         if format.lower() == 'json':
-            import json
-            
-            # 转换不可序列化的对象
-            def convert_for_json(obj):
-                if hasattr(obj, 'tolist'):
-                    return obj.tolist()
-                elif isinstance(obj, pd.Timestamp):
-                    return str(obj)
-                elif isinstance(obj, (pd.Series, pd.DataFrame)):
-                    return obj.to_dict()
-                return obj
-            
-            def clean_dict(d):
-                if isinstance(d, dict):
-                    return {k: clean_dict(v) for k, v in d.items()}
-                elif isinstance(d, list):
-                    return [clean_dict(item) for item in d]
-                else:
-                    return convert_for_json(d)
-            
-            cleaned_results = clean_dict(self.analysis_results)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(cleaned_results, f, ensure_ascii=False, indent=2)
+            # orjson可用时直接在C层序列化numpy数组，无需逐层递归转换
+            dump_json(self.analysis_results, file_path)
         
         elif format.lower() == 'csv':
             # 导出摘要信息到CSV
@@ -422,34 +668,86 @@ class TimeSeriesInsight:
         
         elif format.lower() == 'excel':
             # 导出到Excel，包含多个工作表
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                # 摘要信息
-                summary = self.get_summary()
-                summary_df = pd.DataFrame([summary])
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                
-                # 原始数据
-                self.data.to_excel(writer, sheet_name='Data')
-                
-                # 模型比较
-                if 'model_evaluation' in self.analysis_results:
-                    models_data = []
-                    for model in self.analysis_results['model_evaluation']:
-                        eval_stats = model['evaluation']['fit_statistics']
-                        models_data.append({
-                            'Model': f"ARIMA{model['order']}",
-                            'AIC': eval_stats['aic'],
-                            'BIC': eval_stats['bic'],
-                            'R_squared': eval_stats['r_squared'],
-                            'Adequacy_Score': model['evaluation']['model_adequacy']['score']
-                        })
-                    
-                    models_df = pd.DataFrame(models_data)
-                    models_df.to_excel(writer, sheet_name='Model_Comparison', index=False)
+            self._export_excel(file_path)
         
         else:
             raise ValueError(f"不支持的导出格式: {format}")
 
+    
+    def _excel_sheets(self) -> Dict[str, Tuple[pd.DataFrame, bool]]:
+        """收集需要导出到Excel的工作表：名称 -> (数据表, 是否写入索引)"""
+        # 摘要信息
+        summary = self.get_summary()
+        sheets = {'Summary': (pd.DataFrame([summary]), False)}
+        
+        # 原始数据
+        sheets['Data'] = (self.data.to_frame(), True)
+        
+        # 模型比较
+        if 'model_evaluation' in self.analysis_results:
+            models_data = [
+                {
+                    'Model': f"ARIMA{row['order']}",
+                    'AIC': row['aic'],
+                    'BIC': row['bic'],
+                    'R_squared': row['r_squared'],
+                    'Adequacy_Score': row['adequacy_score']
+                }
+                for row in self._get_flat_summary().model_rows
+            ]
+            
+            sheets['Model_Comparison'] = (pd.DataFrame(models_data), False)
+        
+        return sheets
+    
+    def _export_excel(self, file_path: Path) -> None:
+        """
+        导出Excel文件
+        
+        优先使用xlsxwriter的constant_memory模式逐行落盘，内存占用不随序列长度增长；
+        未安装xlsxwriter时回退到openpyxl。
+        """
+        sheets = self._excel_sheets()
+        
+        try:
+            import xlsxwriter  # noqa: F401
+        except ImportError:
+            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+                for sheet_name, (frame, index) in sheets.items():
+                    frame.to_excel(writer, sheet_name=sheet_name, index=index)
+            return
+        
+        engine_kwargs = {'options': {'constant_memory': True, 'remove_timezone': True}}
+        with pd.ExcelWriter(file_path, engine='xlsxwriter', engine_kwargs=engine_kwargs) as writer:
+            # constant_memory模式下已刷新的行不能再写入，而DataFrame.to_excel按列写单元格，
+            # 因此这里按行顺序自行写入
+            date_format = writer.book.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+            for sheet_name, (frame, index) in sheets.items():
+                worksheet = writer.book.add_worksheet(sheet_name)
+                header = [str(c) for c in frame.columns]
+                if index:
+                    header.insert(0, '' if frame.index.name is None else str(frame.index.name))
+                worksheet.write_row(0, 0, header)
+                
+                for row_idx, row in enumerate(frame.itertuples(index=index, name=None), start=1):
+                    for col_idx, value in enumerate(row):
+                        self._write_excel_cell(worksheet, row_idx, col_idx, value, date_format)
+    
+    @staticmethod
+    def _write_excel_cell(worksheet, row: int, col: int, value: Any, date_format) -> None:
+        """按值类型写入单个Excel单元格，缺失值留空"""
+        if value is None or value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+            return
+        if isinstance(value, (bool, np.bool_)):
+            worksheet.write_boolean(row, col, bool(value))
+        elif isinstance(value, (int, float, np.integer, np.floating)):
+            if np.isfinite(value):
+                worksheet.write_number(row, col, float(value))
+        elif isinstance(value, pd.Timestamp):
+            worksheet.write_datetime(row, col, value.to_pydatetime(), date_format)
+        else:
+            worksheet.write_string(row, col, str(value))
+
 
 # 便捷函数
 def analyze_time_series(data: Union[str, Path, pd.Series, pd.DataFrame, np.ndarray],
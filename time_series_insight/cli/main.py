@@ -5,27 +5,32 @@
 """
 
 import typer
-import pandas as pd
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-import json
+from typing import TYPE_CHECKING, Optional, List
 
-from ..core.data_processor import TimeSeriesProcessor
-from ..analysis.model_identifier import ModelIdentifier
-from ..estimation.parameter_estimator import ParameterEstimator
-from ..evaluation.model_evaluator import ModelEvaluator
-from ..visualization.plotter import TimeSeriesPlotter
+# pandas、statsmodels、matplotlib和rich等重量级依赖在命令内部按需导入，
+# 使 `tsia --help`、`tsia version` 等命令无需为其付出导入开销
+if TYPE_CHECKING:
+    import pandas as pd
+    from rich.console import Console
 
 app = typer.Typer(
     name="tsia",
     help="时间序列洞察助手 - 智能的时间序列分析工具",
     add_completion=False
 )
-console = Console()
+
+
+# analyze命令缓存解析后数据的目录
+DATA_CACHE_DIR = Path.home() / ".cache" / "tsia"
+
+
+@lru_cache(maxsize=None)
+def _console() -> "Console":
+    """获取共享的rich控制台（首次使用时创建）"""
+    from rich.console import Console
+    return Console()
 
 
 @app.command()
@@ -38,16 +43,29 @@ def analyze(
     max_q: int = typer.Option(5, "--max-q", help="最大MA阶数"),
     auto_diff: bool = typer.Option(True, "--auto-diff/--no-auto-diff", help="是否自动差分"),
     save_plots: bool = typer.Option(True, "--save-plots/--no-save-plots", help="是否保存图表"),
+    jobs: int = typer.Option(1, "--jobs", "-j", help="并行评估模型的进程数（-1表示使用全部CPU）"),
+    dpi: int = typer.Option(150, "--dpi", help="保存图表的分辨率"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="是否缓存解析后的数据（~/.cache/tsia）"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="详细输出"),
 ):
     """
     分析时间序列数据，自动识别模型并估计参数
     """
-    console.print(Panel.fit("🔍 时间序列洞察助手", style="bold blue"))
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from ..core.data_processor import TimeSeriesProcessor
+    from ..analysis.model_identifier import ModelIdentifier
+    from ..estimation.parameter_estimator import ParameterEstimator
+    from ..evaluation.model_evaluator import ModelEvaluator
+    from ..visualization.plotter import TimeSeriesPlotter
+    from ..api import _evaluate_in_processes
+    from concurrent.futures import ThreadPoolExecutor
+    
+    _console().print(Panel.fit("🔍 时间序列洞察助手", style="bold blue"))
     
     # 检查文件是否存在
     if not file_path.exists():
-        console.print(f"❌ 文件不存在: {file_path}", style="bold red")
+        _console().print(f"❌ 文件不存在: {file_path}", style="bold red")
         raise typer.Exit(1)
     
     # 创建输出目录
@@ -59,12 +77,12 @@ def analyze(
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=_console(),
         ) as progress:
             
             # 1. 加载数据
             task1 = progress.add_task("📊 加载数据...", total=None)
-            processor = TimeSeriesProcessor()
+            processor = TimeSeriesProcessor(cache_dir=DATA_CACHE_DIR if cache else None)
             data = processor.load_data(
                 file_path, 
                 date_column=date_column, 
@@ -72,10 +90,11 @@ def analyze(
             )
             progress.update(task1, description="✅ 数据加载完成")
             
-            console.print(f"📈 数据概览: {len(data)} 个观测值")
+            _console().print(f"📈 数据概览: {len(data)} 个观测值")
             if verbose:
-                console.print(f"   数据范围: {data.index[0]} 到 {data.index[-1]}")
-                console.print(f"   数值范围: {data.min():.4f} 到 {data.max():.4f}")
+                stats = _basic_stats(data)
+                _console().print(f"   数据范围: {data.index[0]} 到 {data.index[-1]}")
+                _console().print(f"   数值范围: {stats['min']:.4f} 到 {stats['max']:.4f}")
             
             # 2. 平稳性检验
             task2 = progress.add_task("🔬 平稳性检验...", total=None)
@@ -90,7 +109,7 @@ def analyze(
                 task3 = progress.add_task("📉 自动差分处理...", total=None)
                 diff_data, diff_order = processor.auto_difference()
                 progress.update(task3, description=f"✅ 差分完成 (阶数: {diff_order})")
-                console.print(f"🔄 差分阶数: {diff_order}")
+                _console().print(f"🔄 差分阶数: {diff_order}")
             else:
                 diff_data = data
                 diff_order = 0
@@ -110,18 +129,24 @@ def analyze(
             task5 = progress.add_task("⚙️ 参数估计和模型评估...", total=None)
             
             best_models = []
+            candidates = recommended_models[:3]  # 评估前3个模型
+            orders = [model_info['order'] for model_info in candidates]
+            
             estimator = ParameterEstimator()
-            evaluator = ModelEvaluator()
+            if jobs == 1:
+                evaluator = ModelEvaluator()
+                # 参数估计和模型评估
+                outcomes = [
+                    (estimator.estimate_parameters(data, order),
+                     evaluator.generate_evaluation_report(data, order))
+                    for order in orders
+                ]
+            else:
+                outcomes = _evaluate_in_processes(data, orders, jobs)
             
-            for i, model_info in enumerate(recommended_models[:3]):  # 评估前3个模型
+            for model_info, (estimation_results, evaluation_result) in zip(candidates, outcomes):
                 order = model_info['order']
                 
-                # 参数估计
-                estimation_results = estimator.estimate_parameters(data, order)
-                
-                # 模型评估
-                evaluation_result = evaluator.generate_evaluation_report(data, order)
-                
                 if evaluation_result.get('success', False):
                     model_result = {
                         'order': order,
@@ -139,19 +164,21 @@ def analyze(
                 plotter = TimeSeriesPlotter()
                 
                 # 原始数据图
-                fig1 = plotter.plot_time_series(data, title="原始时间序列")
-                fig1.savefig(output_dir / "01_original_series.png", dpi=300, bbox_inches='tight')
+                figures = [(plotter.plot_time_series(data, title="原始时间序列"), "01_original_series.png")]
                 
                 # ACF/PACF图
                 analysis_data = diff_data if diff_order > 0 else data
-                fig2 = plotter.plot_acf_pacf(analysis_data, title="ACF和PACF分析")
-                fig2.savefig(output_dir / "02_acf_pacf.png", dpi=300, bbox_inches='tight')
+                figures.append((plotter.plot_acf_pacf(analysis_data, title="ACF和PACF分析"), "02_acf_pacf.png"))
                 
                 # 如果有最佳模型，绘制残差诊断
                 if best_models:
                     best_model = best_models[0]
-                    if 'fitted_model' in best_model['estimation'].get('mle', {}):
-                        fitted_model = best_model['estimation']['mle']['fitted_model']
+                    mle_result = best_model['estimation'].get('mle', {})
+                    if mle_result.get('success'):
+                        # 子进程中拟合的结果不在本进程的估计器中，按阶数重新拟合
+                        fitted_model = estimator.get_fitted_model(mle_result.get('fit_id'))
+                        if fitted_model is None:
+                            fitted_model = estimator.fit_model(data, best_model['order'])
                         residuals = fitted_model.resid
                         fitted_values = fitted_model.fittedvalues
                         
@@ -159,10 +186,17 @@ def analyze(
                             residuals, fitted_values, 
                             title=f"残差诊断 - ARIMA{best_model['order']}"
                         )
-                        fig3.savefig(output_dir / "03_residual_diagnostics.png", dpi=300, bbox_inches='tight')
+                        figures.append((fig3, "03_residual_diagnostics.png"))
+                
+                # matplotlib不保证线程安全：全部图表在主线程中依次构建完成后，
+                # 才在线程池中并行保存（每个线程只渲染、编码各自的图形，Agg渲染和libpng编码会释放GIL）；
+                # 保存失败时在此抛出异常
+                with ThreadPoolExecutor(max_workers=len(figures)) as executor:
+                    list(executor.map(lambda item: plotter.save_figure(item[0], output_dir / item[1], dpi),
+                                      figures))
                 
                 progress.update(task6, description="✅ 可视化图表已保存")
-                console.print(f"📊 图表已保存到: {output_dir}")
+                _console().print(f"📊 图表已保存到: {output_dir}")
         
         # 7. 显示最终结果
         _display_final_results(best_models)
@@ -189,14 +223,14 @@ def analyze(
             }
         )
         
-        console.print(f"💾 分析结果已保存到: {output_dir / 'analysis_results.json'}")
-        console.print("🎉 分析完成！", style="bold green")
+        _console().print(f"💾 分析结果已保存到: {output_dir / 'analysis_results.json'}")
+        _console().print("🎉 分析完成！", style="bold green")
         
     except Exception as e:
-        console.print(f"❌ 分析过程中出现错误: {str(e)}", style="bold red")
+        _console().print(f"❌ 分析过程中出现错误: {str(e)}", style="bold red")
         if verbose:
             import traceback
-            console.print(traceback.format_exc())
+            _console().print(traceback.format_exc())
         raise typer.Exit(1)
 
 
@@ -209,7 +243,12 @@ def quick_check(
     """
     快速检查时间序列数据的基本信息
     """
-    console.print(Panel.fit("⚡ 快速数据检查", style="bold cyan"))
+    import pandas as pd
+    from rich.panel import Panel
+    from rich.table import Table
+    from ..core.data_processor import TimeSeriesProcessor
+    
+    _console().print(Panel.fit("⚡ 快速数据检查", style="bold cyan"))
     
     try:
         # 加载数据
@@ -221,34 +260,67 @@ def quick_check(
         table.add_column("项目", style="cyan")
         table.add_column("值", style="magenta")
         
+        stats = _basic_stats(data)
         table.add_row("观测数量", str(len(data)))
         table.add_row("数据类型", str(data.dtype))
-        table.add_row("缺失值", str(data.isnull().sum()))
-        table.add_row("最小值", f"{data.min():.4f}")
-        table.add_row("最大值", f"{data.max():.4f}")
-        table.add_row("均值", f"{data.mean():.4f}")
-        table.add_row("标准差", f"{data.std():.4f}")
+        table.add_row("缺失值", str(stats['missing']))
+        table.add_row("最小值", f"{stats['min']:.4f}")
+        table.add_row("最大值", f"{stats['max']:.4f}")
+        table.add_row("均值", f"{stats['mean']:.4f}")
+        table.add_row("标准差", f"{stats['std']:.4f}")
         
         if isinstance(data.index, pd.DatetimeIndex):
             table.add_row("开始时间", str(data.index[0]))
             table.add_row("结束时间", str(data.index[-1]))
             table.add_row("频率", str(data.index.freq) if data.index.freq else "不规则")
         
-        console.print(table)
+        _console().print(table)
         
         # 平稳性快速检查
         stationarity_result = processor.check_stationarity()
         
         status = "✅ 平稳" if stationarity_result['overall']['is_stationary'] else "❌ 非平稳"
-        console.print(f"\n📊 平稳性: {status}")
+        _console().print(f"\n📊 平稳性: {status}")
         
     except Exception as e:
-        console.print(f"❌ 检查失败: {str(e)}", style="bold red")
+        _console().print(f"❌ 检查失败: {str(e)}", style="bold red")
         raise typer.Exit(1)
 
 
+def _basic_stats(data: "pd.Series") -> dict:
+    """
+    计算序列的基本统计量
+    
+    直接在底层ndarray上归约，缺失值只统计一次并在计算前剔除，
+    避免pandas每个统计量各自做一遍缺失值掩码。
+    """
+    import numpy as np
+    
+    # 浮点数据直接使用底层数组（不做类型转换），其余类型转换为float64
+    arr = data.to_numpy()
+    if arr.dtype.kind != 'f':
+        arr = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    missing = np.isnan(arr)
+    n_missing = int(np.count_nonzero(missing))
+    if n_missing:
+        arr = arr[~missing]
+    
+    if arr.size == 0:
+        return {'missing': n_missing, 'min': np.nan, 'max': np.nan, 'mean': np.nan, 'std': np.nan}
+    
+    return {
+        'missing': n_missing,
+        'min': float(arr.min()),
+        'max': float(arr.max()),
+        'mean': float(arr.mean()),
+        'std': float(arr.std(ddof=1)) if arr.size > 1 else np.nan
+    }
+
+
 def _display_stationarity_results(results: dict):
     """显示平稳性检验结果"""
+    from rich.table import Table
+    
     table = Table(title="平稳性检验结果")
     table.add_column("检验方法", style="cyan")
     table.add_column("统计量", style="magenta")
@@ -265,15 +337,17 @@ def _display_stationarity_results(results: dict):
         result_text = "✅ 平稳" if kpss['is_stationary'] else "❌ 非平稳"
         table.add_row("KPSS检验", f"{kpss['statistic']:.4f}", f"{kpss['p_value']:.4f}", result_text)
     
-    console.print(table)
+    _console().print(table)
     
     if 'overall' in results:
         overall_status = "✅ 平稳" if results['overall']['is_stationary'] else "❌ 非平稳"
-        console.print(f"\n📊 综合判断: {overall_status}")
+        _console().print(f"\n📊 综合判断: {overall_status}")
 
 
 def _display_recommended_models(models: List[dict]):
     """显示推荐模型"""
+    from rich.table import Table
+    
     table = Table(title="推荐的ARIMA模型")
     table.add_column("排名", style="cyan")
     table.add_column("模型", style="magenta")
@@ -284,13 +358,15 @@ def _display_recommended_models(models: List[dict]):
         confidence = f"{model['confidence']:.1%}"
         table.add_row(str(i), model['type'], confidence, model['reasoning'])
     
-    console.print(table)
+    _console().print(table)
 
 
 def _display_final_results(best_models: List[dict]):
     """显示最终结果"""
+    from rich.table import Table
+    
     if not best_models:
-        console.print("❌ 没有成功拟合的模型", style="bold red")
+        _console().print("❌ 没有成功拟合的模型", style="bold red")
         return
     
     table = Table(title="模型评估结果")
@@ -313,48 +389,27 @@ def _display_final_results(best_models: List[dict]):
             f"{adequacy['score']:.0f}% ({adequacy['level']})"
         )
     
-    console.print(table)
+    _console().print(table)
     
     # 显示最佳模型的详细信息
     best_model = best_models[0]
-    console.print(f"\n🏆 推荐模型: ARIMA{best_model['order']}")
-    console.print(f"📊 模型适合度: {best_model['evaluation']['model_adequacy']['interpretation']}")
+    _console().print(f"\n🏆 推荐模型: ARIMA{best_model['order']}")
+    _console().print(f"📊 模型适合度: {best_model['evaluation']['model_adequacy']['interpretation']}")
 
 
 def _save_results_to_json(file_path: Path, results: dict):
     """保存结果到JSON文件"""
-    # 转换不可序列化的对象
-    def convert_for_json(obj):
-        if hasattr(obj, 'tolist'):
-            return obj.tolist()
-        elif hasattr(obj, 'to_dict'):
-            return obj.to_dict()
-        elif isinstance(obj, pd.Timestamp):
-            return str(obj)
-        elif isinstance(obj, (pd.Series, pd.DataFrame)):
-            return obj.to_dict()
-        return obj
-    
-    # 递归转换
-    def clean_dict(d):
-        if isinstance(d, dict):
-            return {k: clean_dict(v) for k, v in d.items()}
-        elif isinstance(d, list):
-            return [clean_dict(item) for item in d]
-        else:
-            return convert_for_json(d)
-    
-    cleaned_results = clean_dict(results)
+    from ..utils.serialization import dump_json
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(cleaned_results, f, ensure_ascii=False, indent=2)
+    # numpy数组、pandas对象和时间戳由序列化工具统一转换，无需预先递归清理
+    dump_json(results, file_path)
 
 
 @app.command()
 def version():
     """显示版本信息"""
     from .. import __version__
-    console.print(f"时间序列洞察助手 v{__version__}")
+    _console().print(f"时间序列洞察助手 v{__version__}")
 
 
 if __name__ == "__main__":
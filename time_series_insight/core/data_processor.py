@@ -8,22 +8,124 @@ import pandas as pd
 import numpy as np
 from typing import Union, Tuple, Optional, Dict, Any
 from pathlib import Path
+import hashlib
 from statsmodels.tsa.stattools import adfuller, kpss
 from statsmodels.tsa.seasonal import seasonal_decompose
+import re
 import warnings
+from statsmodels.tools.sm_exceptions import InterpolationWarning
+
+from ..utils.jit import HAS_NUMBA, njit
+
+# KPSS统计量超出查表范围时会发出InterpolationWarning（p值取边界值，不影响判断）。
+# 该警告归属于调用方模块，这里在导入时设置一次，只屏蔽本模块发起的调用
+warnings.filterwarnings('ignore', category=InterpolationWarning, module=re.escape(__name__))
+
+# 超过该大小的CSV文件分块读取
+CHUNKED_READ_THRESHOLD = 100 * 1024 * 1024
+# 无pyarrow时pandas分块读取的行数
+CHUNK_ROWS = 500_000
+
+# 少于该长度的序列不做平稳性检验
+MIN_STATIONARITY_TEST_LENGTH = 20
+# 差分后滞后1自相关仍高于该值时视为存在单位根，不再运行ADF检验
+UNIT_ROOT_R1_THRESHOLD = 0.95
+
+
+@njit(cache=True, fastmath=True)
+def _lag1_autocorrelations_jit(arr, max_order):
+    """在工作副本上原地差分的逐阶滞后1自相关（numba编译），每阶只需一次遍历"""
+    work = arr.copy()
+    n = work.shape[0]
+    r1 = np.full(max_order + 1, np.nan)
+    for k in range(max_order + 1):
+        m = n - k
+        if m < 3:
+            break
+        if k > 0:
+            for i in range(m):
+                work[i] = work[i + 1] - work[i]
+        
+        total = 0.0
+        for i in range(m):
+            total += work[i]
+        mean = total / m
+        
+        prev = work[0] - mean
+        num = 0.0
+        den = prev * prev
+        for i in range(1, m):
+            cur = work[i] - mean
+            num += prev * cur
+            den += cur * cur
+            prev = cur
+        r1[k] = num / den if den > 0 else 0.0
+    return r1
+
+
+def _lag1_autocorrelations_numpy(arr: np.ndarray, max_order: int) -> np.ndarray:
+    """由numpy点积计算的逐阶滞后1自相关（未安装numba时使用）"""
+    r1 = np.full(max_order + 1, np.nan)
+    current = arr
+    for k in range(max_order + 1):
+        if arr.shape[0] - k < 3:
+            break
+        if k > 0:
+            current = np.diff(current)
+        centered = current - current.mean()
+        den = centered @ centered
+        r1[k] = (centered[:-1] @ centered[1:]) / den if den > 0 else 0.0
+    return r1
+
+
+def _lag1_autocorrelations(arr: np.ndarray, max_order: int) -> np.ndarray:
+    """
+    依次计算0~max_order阶差分序列的滞后1自相关系数
+
+    安装numba时使用编译的单遍实现，否则使用numpy向量化实现；序列过短的阶数返回NaN。
+    """
+    if HAS_NUMBA:
+        return _lag1_autocorrelations_jit(arr, max_order)
+    return _lag1_autocorrelations_numpy(arr, max_order)
+
+
+def _describe_stats(arr: np.ndarray) -> Dict[str, float]:
+    """计算均值、标准差（ddof=1）、最小值和最大值"""
+    if arr.size == 0:
+        return {"均值": np.nan, "标准差": np.nan, "最小值": np.nan, "最大值": np.nan}
+    return {
+        "均值": float(arr.mean()),
+        "标准差": float(arr.std(ddof=1)),
+        "最小值": float(arr.min()),
+        "最大值": float(arr.max()),
+    }
 
 
 class TimeSeriesProcessor:
     """时间序列数据处理器"""
     
-    def __init__(self):
-        """初始化处理器"""
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        """
+        初始化处理器
+        
+        Args:
+            cache_dir: 文件数据的parquet缓存目录，再次加载未修改的文件时跳过解析；
+                默认不缓存
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         self.data: Optional[pd.Series] = None
         self.original_data: Optional[pd.Series] = None
         self.differenced_data: Optional[pd.Series] = None
         self.diff_order: int = 0
         self.is_stationary: bool = False
         self.stationarity_tests: Dict[str, Any] = {}
+        # ADF检验结果缓存，键为(差分阶数, 序列长度)，加载新数据时清空
+        self._adf_cache: Dict[Tuple[int, int], tuple] = {}
+        # 生成stationarity_tests时使用的(alpha, method)
+        self._stationarity_key: Optional[Tuple[float, str]] = None
+        # self.data对应的连续float64数组及其来源Series
+        self._values: Optional[np.ndarray] = None
+        self._values_source: Optional[pd.Series] = None
         
     def load_data(self, 
                   data: Union[str, Path, pd.Series, pd.DataFrame, np.ndarray],
@@ -45,41 +147,27 @@ class TimeSeriesProcessor:
         if isinstance(data, (str, Path)):
             # 从文件加载
             file_path = Path(data)
-            if file_path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path)
-            elif file_path.suffix.lower() in ['.xlsx', '.xls']:
-                df = pd.read_excel(file_path)
+            cache_path = self._cache_path(file_path, date_column, value_column, date_format)
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                self.data = cached
             else:
-                raise ValueError(f"不支持的文件格式: {file_path.suffix}")
-                
-            # 处理DataFrame
-            if date_column and value_column:
-                df[date_column] = pd.to_datetime(df[date_column], format=date_format)
-                df.set_index(date_column, inplace=True)
-                self.data = df[value_column]
-            elif len(df.columns) == 2:
-                # 假设第一列是日期，第二列是数值
-                df.iloc[:, 0] = pd.to_datetime(df.iloc[:, 0], format=date_format)
-                df.set_index(df.columns[0], inplace=True)
-                self.data = df.iloc[:, 0]
-            elif len(df.columns) == 1:
-                # 只有一列数值，使用默认索引
-                self.data = df.iloc[:, 0]
-            else:
-                raise ValueError("无法自动识别数据格式，请指定date_column和value_column")
+                self.data = self._load_file(file_path, date_column, value_column, date_format)
+                self._write_cache(cache_path, self.data)
                 
         elif isinstance(data, pd.DataFrame):
             if value_column:
                 if date_column:
-                    data[date_column] = pd.to_datetime(data[date_column], format=date_format)
-                    data.set_index(date_column, inplace=True)
-                self.data = data[value_column]
+                    # 不修改调用方传入的DataFrame
+                    self.data = self._with_date_index(data[value_column], data[date_column], date_format)
+                else:
+                    self.data = data[value_column]
             else:
                 # 假设第一列是数值
                 self.data = data.iloc[:, 0]
                 
         elif isinstance(data, pd.Series):
-            self.data = data.copy()
+            self.data = data
             
         elif isinstance(data, np.ndarray):
             self.data = pd.Series(data)
@@ -87,28 +175,208 @@ class TimeSeriesProcessor:
         else:
             raise ValueError(f"不支持的数据类型: {type(data)}")
         
-        # 保存原始数据
-        self.original_data = self.data.copy()
+        # 保存原始数据（只读引用，处理过程不会原地修改数据，因此无需复制）
+        self.original_data = self.data
+        self._adf_cache.clear()
+        self._stationarity_key = None
         
         # 基本数据清理
         self.data = self._clean_data(self.data)
+        self._values = np.ascontiguousarray(self.data.to_numpy(dtype=np.float64))
+        self._values_source = self.data
         
         return self.data
     
+    @property
+    def values(self) -> np.ndarray:
+        """
+        当前数据的连续float64数组
+        
+        在加载数据时转换一次，供需要float64输入的ADF/KPSS检验和自动差分复用
+        （self.data本身保持原有dtype，如float32）；
+        self.data被直接替换时自动重新转换并清空ADF缓存。
+        """
+        if self.data is None:
+            raise ValueError("请先加载数据")
+        if self._values_source is not self.data:
+            self._values = np.ascontiguousarray(self.data.to_numpy(dtype=np.float64))
+            self._values_source = self.data
+            # 数据已变化，基于旧数据的ADF缓存随之失效
+            self._adf_cache.clear()
+            self._stationarity_key = None
+        return self._values
+    
+    def _load_file(self,
+                   file_path: Path,
+                   date_column: Optional[str] = None,
+                   value_column: Optional[str] = None,
+                   date_format: Optional[str] = None) -> pd.Series:
+        """从CSV/Excel文件读取时间序列"""
+        # 指定了日期列和数值列时只读取这两列
+        usecols = [date_column, value_column] if date_column and value_column else None
+        if file_path.suffix.lower() == '.csv':
+            if usecols and file_path.stat().st_size > CHUNKED_READ_THRESHOLD:
+                df = self._read_csv_chunked(file_path, date_column, value_column, date_format)
+            else:
+                df = self._read_csv(file_path, usecols)
+        elif file_path.suffix.lower() in ['.xlsx', '.xls']:
+            df = pd.read_excel(file_path, usecols=usecols)
+        else:
+            raise ValueError(f"不支持的文件格式: {file_path.suffix}")
+            
+        # 处理DataFrame
+        if date_column and value_column:
+            return self._with_date_index(df[value_column], df[date_column], date_format)
+        elif len(df.columns) == 2:
+            # 假设第一列是日期，第二列是数值
+            return self._with_date_index(df.iloc[:, 1], df.iloc[:, 0], date_format)
+        elif len(df.columns) == 1:
+            # 只有一列数值，使用默认索引
+            return df.iloc[:, 0]
+        else:
+            raise ValueError("无法自动识别数据格式，请指定date_column和value_column")
+    
+    def _cache_path(self,
+                    file_path: Path,
+                    date_column: Optional[str],
+                    value_column: Optional[str],
+                    date_format: Optional[str]) -> Optional[Path]:
+        """根据文件路径、修改时间和读取参数生成缓存文件路径，未启用缓存时返回None"""
+        if self.cache_dir is None or not file_path.exists():
+            return None
+        stat = file_path.stat()
+        key = f"{file_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:{date_column}:{value_column}:{date_format}"
+        return self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.parquet"
+    
+    @staticmethod
+    def _read_cache(cache_path: Optional[Path]) -> Optional[pd.Series]:
+        """读取parquet缓存，缓存不存在或无法读取时返回None"""
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            return pd.read_parquet(cache_path, engine='pyarrow').iloc[:, 0]
+        except (ImportError, OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def _write_cache(cache_path: Optional[Path], data: pd.Series) -> None:
+        """将解析后的序列写入parquet缓存（未安装pyarrow或写入失败时跳过）"""
+        if cache_path is None:
+            return
+        try:
+            import pyarrow as pa
+        except ImportError:  # pyarrow为可选依赖
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            data.to_frame().to_parquet(cache_path, engine='pyarrow', compression='zstd')
+        except (OSError, TypeError, ValueError, pa.ArrowException):
+            # 混合类型的object列等无法写入parquet，跳过缓存并清理可能残留的文件
+            cache_path.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _read_csv(file_path: Path, usecols: Optional[list] = None) -> pd.DataFrame:
+        """
+        读取CSV文件
+        
+        优先使用pyarrow引擎（多线程解析），未安装pyarrow时回退到默认的C引擎。
+        列仍使用numpy数据类型，保证后续statsmodels计算不受影响。
+        """
+        try:
+            return pd.read_csv(file_path, engine='pyarrow', usecols=usecols)
+        except ImportError:
+            return pd.read_csv(file_path, usecols=usecols)
+    
+    def _read_csv_chunked(self,
+                          file_path: Path,
+                          date_column: str,
+                          value_column: str,
+                          date_format: Optional[str] = None) -> pd.DataFrame:
+        """
+        分块读取大型CSV文件的日期列和数值列
+        
+        数值逐块写入预分配的float64数组（按文件采样估算行数，不足时倍增），
+        日期逐块解析后拼接，峰值内存只与单个数据块相关。
+        pyarrow按第一个数据块推断列类型，数值列因此显式指定为float64，
+        避免前面全是整数、后面出现小数时中途转换失败。
+        """
+        columns = [date_column, value_column]
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+            reader = pa_csv.open_csv(
+                file_path,
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={value_column: pa.float64()},
+                    include_columns=columns
+                )
+            )
+            chunks = (batch.to_pandas() for batch in reader)
+        except ImportError:
+            chunks = pd.read_csv(file_path, usecols=columns, chunksize=CHUNK_ROWS)
+        
+        # 根据文件开头的行密度估算总行数
+        with open(file_path, 'rb') as f:
+            sample = f.read(1 << 20)
+        estimated_rows = int(file_path.stat().st_size * sample.count(b'\n') / max(len(sample), 1)) + 1
+        
+        values = np.empty(estimated_rows, dtype=np.float64)
+        n_rows = 0
+        date_chunks = []
+        for chunk in chunks:
+            chunk_values = pd.to_numeric(chunk[value_column], errors='coerce').to_numpy(dtype=np.float64)
+            end = n_rows + len(chunk_values)
+            if end > len(values):
+                values = np.resize(values, max(end, 2 * len(values)))
+            values[n_rows:end] = chunk_values
+            n_rows = end
+            date_chunks.append(self._parse_dates(chunk[date_column], date_format))
+        
+        dates = pd.concat(date_chunks, ignore_index=True) if date_chunks else pd.Series([], dtype='datetime64[ns]')
+        return pd.DataFrame({date_column: dates, value_column: values[:n_rows]})
+    
+    @staticmethod
+    def _parse_dates(values: pd.Series, date_format: Optional[str] = None) -> pd.Series:
+        """
+        将日期列转换为datetime
+        
+        读取时已解析为日期类型的列直接返回；未指定格式时先按ISO8601走快速解析路径，
+        失败后再回退到pandas的逐值格式推断。
+        """
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+        if date_format is not None:
+            return pd.to_datetime(values, format=date_format, cache=True)
+        try:
+            return pd.to_datetime(values, format='ISO8601', cache=True)
+        except (ValueError, TypeError):
+            return pd.to_datetime(values, cache=True)
+    
+    def _with_date_index(self,
+                         values: pd.Series,
+                         dates: pd.Series,
+                         date_format: Optional[str] = None) -> pd.Series:
+        """以解析后的日期列作为数值列的索引，返回新的Series"""
+        index = pd.DatetimeIndex(self._parse_dates(dates, date_format), name=dates.name)
+        return values.set_axis(index)
+    
     def _clean_data(self, data: pd.Series) -> pd.Series:
         """清理数据"""
-        # 移除缺失值
-        data = data.dropna()
-        
-        # 确保数据类型为数值型
-        if not pd.api.types.is_numeric_dtype(data):
-            try:
-                data = pd.to_numeric(data, errors='coerce')
+        if pd.api.types.is_numeric_dtype(data):
+            # 移除缺失值（没有缺失值时直接沿用原对象，不产生副本）
+            if data.hasnans:
                 data = data.dropna()
-            except:
-                raise ValueError("无法将数据转换为数值型")
+            # pyarrow后端的数值列转换为对应的numpy类型（float32保持float32，不向上转换）
+            arrow_dtype = getattr(pd, 'ArrowDtype', None)
+            if arrow_dtype is not None and isinstance(data.dtype, arrow_dtype):
+                data = data.astype(data.dtype.numpy_dtype)
+            return data
         
-        return data
+        # 非数值型数据转换为数值型，无法转换的值与原有缺失值一并移除
+        try:
+            return pd.to_numeric(data, errors='coerce').dropna()
+        except (TypeError, ValueError):
+            raise ValueError("无法将数据转换为数值型")
     
     def check_stationarity(self, 
                           alpha: float = 0.05,
@@ -126,11 +394,28 @@ class TimeSeriesProcessor:
         if self.data is None:
             raise ValueError("请先加载数据")
         
+        n = len(self.data)
+        if n == 0:
+            raise ValueError("数据为空，无法进行平稳性检验")
+        
+        if n < MIN_STATIONARITY_TEST_LENGTH:
+            # 样本过少时ADF/KPSS检验不可靠，直接给出不确定的结论
+            self.is_stationary = False
+            results = {
+                'overall': {
+                    'is_stationary': False,
+                    'interpretation': f'样本过少（{n}个观测值），无法可靠检验平稳性'
+                }
+            }
+            self.stationarity_tests = results
+            self._stationarity_key = (alpha, method)
+            return results
+        
         results = {}
         
         if method in ['adf', 'both']:
             # ADF检验 (原假设：存在单位根，即非平稳)
-            adf_result = adfuller(self.data, autolag='AIC')
+            adf_result = self._adf(self.values, 0)
             results['adf'] = {
                 'statistic': adf_result[0],
                 'p_value': adf_result[1],
@@ -141,9 +426,7 @@ class TimeSeriesProcessor:
         
         if method in ['kpss', 'both']:
             # KPSS检验 (原假设：平稳)
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                kpss_result = kpss(self.data, regression='c')
+            kpss_result = kpss(self.values, regression='c')
             results['kpss'] = {
                 'statistic': kpss_result[0],
                 'p_value': kpss_result[1],
@@ -180,8 +463,30 @@ class TimeSeriesProcessor:
             }
         
         self.stationarity_tests = results
+        self._stationarity_key = (alpha, method)
         return results
     
+    def _adf(self, arr: np.ndarray, diff_order: int) -> tuple:
+        """
+        执行ADF检验并缓存结果
+        
+        滞后阶数按Schwert准则 12*(n/100)^(1/4) 固定（不超过n/4），
+        只做一次回归，避免autolag逐个滞后阶数拟合比较。
+        
+        Args:
+            arr: 当前数据经diff_order阶差分后的数组
+            diff_order: 差分阶数
+            
+        Returns:
+            adfuller的返回值
+        """
+        key = (diff_order, len(arr))
+        if key not in self._adf_cache:
+            n = len(arr)
+            maxlag = min(int(12 * (n / 100) ** 0.25), n // 4)
+            self._adf_cache[key] = adfuller(arr, maxlag=maxlag, autolag=None)
+        return self._adf_cache[key]
+    
     def difference(self, order: int = 1, seasonal_order: int = 0) -> pd.Series:
         """
         对时间序列进行差分
@@ -196,16 +501,27 @@ class TimeSeriesProcessor:
         if self.data is None:
             raise ValueError("请先加载数据")
         
-        differenced = self.data.copy()
-        
-        # 季节差分
-        if seasonal_order > 0:
+        if order == 0 and seasonal_order == 0:
+            differenced = self.data
+        else:
+            # 直接在ndarray上做切片相减，不产生NaN也无需dropna；
+            # 浮点数据保持原有精度（如float32），整数数据转换为float64
+            arr = self.data.to_numpy()
+            if arr.dtype.kind != 'f':
+                arr = arr.astype(np.float64)
+            index = self.data.index
+            
+            # 季节差分
             for _ in range(seasonal_order):
-                differenced = differenced.diff(periods=12).dropna()  # 假设季节周期为12
-        
-        # 普通差分
-        for _ in range(order):
-            differenced = differenced.diff().dropna()
+                arr = arr[12:] - arr[:-12]  # 假设季节周期为12
+                index = index[12:]
+            
+            # 普通差分
+            for _ in range(order):
+                arr = arr[1:] - arr[:-1]
+                index = index[1:]
+            
+            differenced = pd.Series(arr, index=index, name=self.data.name)
         
         self.differenced_data = differenced
         self.diff_order = order
@@ -226,24 +542,36 @@ class TimeSeriesProcessor:
         if self.data is None:
             raise ValueError("请先加载数据")
         
-        current_data = self.data.copy()
         diff_order = 0
+        arr = self.values
         
-        # 检查原始数据是否平稳
-        stationarity_result = self.check_stationarity(alpha=alpha)
+        # 检查原始数据是否平稳：已有相同alpha的完整检验报告时直接复用，
+        # 否则只做ADF检验（与后续各阶差分的判断标准一致），不再额外运行KPSS
+        if self.stationarity_tests and self._stationarity_key == (alpha, 'both'):
+            is_stationary = self.stationarity_tests['overall']['is_stationary']
+        else:
+            is_stationary = self._adf(arr, 0)[1] < alpha
         
-        if stationarity_result['overall']['is_stationary']:
+        if is_stationary:
+            current_data = self.data
             self.differenced_data = current_data
             self.diff_order = 0
             return current_data, 0
         
-        # 逐步差分直到平稳
+        # 先用滞后1自相关粗筛，差分后仍接近单位根的阶数直接跳过ADF检验；
+        # 无论是否安装numba都执行粗筛（未安装时使用numpy实现），保证选出的差分阶数一致
+        r1 = _lag1_autocorrelations(arr, max_order)
+        
+        # 逐步差分直到平稳：在ndarray上增量差分，只在最后包装回Series
+        current = arr
         for order in range(1, max_order + 1):
-            current_data = current_data.diff().dropna()
+            current = current[1:] - current[:-1]
+            if r1[order] > UNIT_ROOT_R1_THRESHOLD:
+                continue
             
             # 检验差分后的平稳性
             try:
-                adf_result = adfuller(current_data, autolag='AIC')
+                adf_result = self._adf(current, order)
                 if adf_result[1] < alpha:  # 平稳
                     diff_order = order
                     break
@@ -252,9 +580,12 @@ class TimeSeriesProcessor:
         
         if diff_order == 0:
             print(f"警告：在{max_order}阶差分内未能达到平稳，使用1阶差分")
-            current_data = self.data.diff().dropna()
+            current = arr[1:] - arr[:-1]
             diff_order = 1
         
+        current_data = pd.Series(
+            current, index=self.data.index[len(arr) - len(current):], name=self.data.name
+        )
         self.differenced_data = current_data
         self.diff_order = diff_order
         
@@ -280,21 +611,13 @@ class TimeSeriesProcessor:
             "差分阶数": self.diff_order,
             "是否平稳": self.is_stationary,
             "平稳性检验结果": self.stationarity_tests,
-            "数据统计": {
-                "均值": float(self.data.mean()),
-                "标准差": float(self.data.std()),
-                "最小值": float(self.data.min()),
-                "最大值": float(self.data.max()),
-            }
+            "数据统计": _describe_stats(self.values)
         }
         
         if self.differenced_data is not None:
             summary["差分后数据长度"] = len(self.differenced_data)
-            summary["差分后数据统计"] = {
-                "均值": float(self.differenced_data.mean()),
-                "标准差": float(self.differenced_data.std()),
-                "最小值": float(self.differenced_data.min()),
-                "最大值": float(self.differenced_data.max()),
-            }
+            summary["差分后数据统计"] = _describe_stats(
+                self.differenced_data.to_numpy(dtype=np.float64)
+            )
         
         return summary
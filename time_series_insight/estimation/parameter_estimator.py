@@ -4,24 +4,228 @@
 实现矩估计法和最大似然估计的参数计算功能。
 """
 
+import math
+import uuid
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, Tuple, Optional, List
+from pathlib import Path
+from typing import Dict, Any, Tuple, Optional, List, Union
 from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.tsa.stattools import acf, pacf
+from statsmodels.tsa.arima_process import arma2ma
 from scipy.optimize import minimize
+from scipy.linalg import LinAlgError, solve_toeplitz
 import warnings
 
+from ..utils.autocorr import acovf, levinson_durbin, levinson_durbin_path
+from ..utils.digest import series_digest
+from ..utils.jit import njit
+
+try:
+    import joblib
+except ImportError:  # 未安装joblib时不启用磁盘缓存
+    joblib = None
+
+
+# 估计器内保留的最近拟合结果对象数量（每个对象持有完整的状态空间结果，占用内存较大）
+MAX_CACHED_FITS = 8
+
+# 状态空间MLE的优化器参数（ARIMA.fit会原地修改method_kwargs，使用时需复制）
+MLE_FIT_KWARGS = {'method': 'lbfgs', 'maxiter': 200, 'pgtol': 1e-6}
+
+
+def _yule_walker_solve(gamma: np.ndarray, p: int) -> np.ndarray:
+    """
+    求解AR(p)的Yule-Walker系数
+    
+    使用scipy编译的Levinson实现（solve_toeplitz），不构建p×p矩阵；
+    Toeplitz矩阵奇异时回退到逐阶递推。
+    """
+    try:
+        return solve_toeplitz(gamma[:p], gamma[1:p + 1])
+    except LinAlgError:
+        return levinson_durbin(gamma, p)[0]
+
+
+@njit(cache=True, fastmath=True)
+def _ma_sse_grad(theta, sample_acf):
+    """
+    MA(q)理论ACF与样本ACF的误差平方和及其解析梯度
+    
+    记psi = (1, theta_1, ..., theta_q)，c_k = sum_j psi_j * psi_{j+k}，rho_k = c_k / c_0。
+    
+    Returns:
+        (误差平方和, 对theta的梯度)
+    """
+    q = theta.shape[0]
+    psi = np.empty(q + 1)
+    psi[0] = 1.0
+    psi[1:] = theta
+    
+    c = np.zeros(q + 1)
+    for k in range(q + 1):
+        for j in range(q - k + 1):
+            c[k] += psi[j] * psi[j + k]
+    
+    sse = 0.0
+    grad = np.zeros(q)
+    for k in range(1, q + 1):
+        resid = c[k] / c[0] - sample_acf[k - 1]
+        sse += resid * resid
+        for i in range(1, q + 1):
+            dc = 0.0
+            if i + k <= q:
+                dc += psi[i + k]
+            if i - k >= 0:
+                dc += psi[i - k]
+            drho = (dc * c[0] - c[k] * 2.0 * psi[i]) / (c[0] * c[0])
+            grad[i - 1] += 2.0 * resid * drho
+    return sse, grad
+
+
+def _fit_arima(data_digest: Optional[str],
+               data: pd.Series,
+               order: Tuple[int, int, int],
+               model: Optional[ARIMA] = None,
+               start_params: Optional[np.ndarray] = None):
+    """
+    拟合ARIMA模型
+
+    data_digest与order、start_params一起构成缓存键（热启动与默认初值的拟合分别缓存），
+    data和model不参与joblib的参数哈希。
+    状态空间MLE从start_params（默认为statsmodels的初值）开始优化，通常几十次迭代内收敛；
+    未收敛时再以innovations_mle的估计作为初值重新优化，取似然更大的结果。
+    """
+    if model is None:
+        model = ARIMA(data, order=order)
+    fitted = model.fit(start_params=start_params, method='statespace', method_kwargs=dict(MLE_FIT_KWARGS))
+    if fitted.mle_retvals.get('converged', True):
+        return fitted
+    
+    try:
+        start_params = ARIMA(data, order=order).fit(
+            method='innovations_mle',
+            method_kwargs={'minimize_kwargs': {'options': {'maxiter': 50}}}
+        ).params
+    except Exception:
+        return fitted
+    refitted = model.fit(start_params=start_params, method='statespace', method_kwargs=dict(MLE_FIT_KWARGS))
+    return refitted if refitted.llf > fitted.llf else fitted
+
 
 class ParameterEstimator:
     """ARIMA模型参数估计器"""
     
-    def __init__(self):
-        """初始化参数估计器"""
+    def __init__(self,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 warm_start: bool = False):
+        """
+        初始化参数估计器
+        
+        Args:
+            cache_dir: 拟合结果的磁盘缓存目录，按(数据摘要, 阶数, 初值)缓存ARIMA拟合结果；
+                为None或未安装joblib时不缓存
+            warm_start: 是否以上一次相邻阶数的MLE参数作为初值。扫描相邻阶数时
+                迭代次数明显减少，但可能收敛到较差的局部最优，默认关闭
+        """
+        self.warm_start = warm_start
         self.moment_estimates: Dict[str, Any] = {}
         self.mle_estimates: Dict[str, Any] = {}
         self.comparison_results: Dict[str, Any] = {}
         
+        self._cached_fit = None
+        if cache_dir is not None and joblib is not None:
+            memory = joblib.Memory(location=str(cache_dir), verbose=0)
+            self._cached_fit = memory.cache(_fit_arima, ignore=['data', 'model'])
+        
+        # 当前数据对应的ARIMA模型对象（按阶数缓存），重复拟合时复用状态空间表示；
+        # 持有数据引用，数据对象变化时整体失效
+        self._model_data: Optional[pd.Series] = None
+        self._model_cache: Dict[Tuple[int, int, int], ARIMA] = {}
+        # 上一次MLE拟合的数据和参数（参数名 -> 估计值），用于相邻阶数的热启动
+        self._last_fit_data: Optional[pd.Series] = None
+        self._last_fit_params: Dict[str, float] = {}
+        self._last_fit_order: Optional[Tuple[int, int, int]] = None
+        # 当前数据的AR矩估计递推结果（均值、自协方差、各阶解、偏自相关），
+        # 同一数据对象上不超过已计算阶数的AR矩估计直接复用
+        self._ar_path_data: Optional[pd.Series] = None
+        self._ar_path: Optional[Tuple[float, np.ndarray, List[Tuple[np.ndarray, float]], np.ndarray]] = None
+        # 最近一次差分的(原始数据, 差分阶数, 差分结果)，重复估计同一数据时复用
+        self._diff_cache: Optional[Tuple[pd.Series, int, pd.Series]] = None
+        # 最近的MLE拟合结果对象（fit_id -> 结果），超过MAX_CACHED_FITS时淘汰最久未使用的
+        self._fits: "OrderedDict[str, Any]" = OrderedDict()
+    
+    def _get_model(self, data: pd.Series, order: Tuple[int, int, int]) -> ARIMA:
+        """获取(数据, 阶数)对应的ARIMA模型对象，同一数据对象的相同阶数只构建一次"""
+        if self._model_data is not data:
+            self._model_data = data
+            self._model_cache.clear()
+        model = self._model_cache.get(order)
+        if model is None:
+            model = self._model_cache[order] = ARIMA(data, order=order)
+        return model
+    
+    def _warm_start_params(self,
+                           data: pd.Series,
+                           order: Tuple[int, int, int],
+                           model: ARIMA) -> Optional[np.ndarray]:
+        """
+        以上一次相邻阶数（p或q相差1、d相同）的拟合参数作为初值
+        
+        同名参数沿用已有估计，新增的参数置0；不满足条件时返回None使用默认初值。
+        """
+        if not self.warm_start or self._last_fit_data is not data or self._last_fit_order is None:
+            return None
+        (p0, d0, q0), (p, d, q) = self._last_fit_order, order
+        if d0 != d or abs(p - p0) + abs(q - q0) != 1:
+            return None
+        return np.array([self._last_fit_params.get(name, 0.0) for name in model.param_names])
+    
+    def fit_model(self, data: pd.Series, order: Tuple[int, int, int]):
+        """
+        拟合ARIMA模型并返回statsmodels的结果对象（用于预测和残差诊断）
+        
+        Args:
+            data: 时间序列数据
+            order: ARIMA模型阶数 (p, d, q)
+        """
+        return self._fit_arima(data, order)
+    
+    def get_fitted_model(self, fit_id: Optional[str]):
+        """
+        按estimate_mle结果中的fit_id获取拟合结果对象
+        
+        Returns:
+            拟合结果对象；已被淘汰或不属于本估计器（如在子进程中拟合）时返回None
+        """
+        fitted = self._fits.get(fit_id)
+        if fitted is not None:
+            self._fits.move_to_end(fit_id)
+        return fitted
+    
+    def _register_fit(self, fitted) -> str:
+        """保存拟合结果对象并返回其编号（全局唯一，其他估计器或子进程产生的编号不会误命中）"""
+        fit_id = uuid.uuid4().hex
+        self._fits[fit_id] = fitted
+        while len(self._fits) > MAX_CACHED_FITS:
+            self._fits.popitem(last=False)
+        return fit_id
+    
+    def _fit_arima(self, data: pd.Series, order: Tuple[int, int, int]):
+        """拟合ARIMA模型，启用缓存时相同数据和阶数直接读取已有结果"""
+        model = self._get_model(data, order)
+        start_params = self._warm_start_params(data, order, model)
+        if self._cached_fit is not None:
+            fitted = self._cached_fit(series_digest(data), data, order, model, start_params)
+        else:
+            fitted = _fit_arima(None, data, order, model, start_params)
+        
+        self._last_fit_data = data
+        self._last_fit_order = order
+        self._last_fit_params = dict(zip(fitted.param_names, np.asarray(fitted.params, dtype=np.float64)))
+        return fitted
+        
     def estimate_ar_moments(self, data: pd.Series, p: int) -> Dict[str, Any]:
         """
         使用矩估计法估计AR模型参数
@@ -37,48 +241,10 @@ class ParameterEstimator:
             return {"error": "AR阶数必须大于0"}
         
         try:
-            # 计算样本自协方差
-            n = len(data)
-            mean = data.mean()
-            centered_data = data - mean
-            
-            # 计算自协方差函数
-            gamma = np.zeros(p + 1)
-            for k in range(p + 1):
-                if k == 0:
-                    gamma[k] = np.var(centered_data, ddof=1)
-                else:
-                    gamma[k] = np.mean(centered_data[:-k] * centered_data[k:])
-            
-            # 构建Yule-Walker方程组
-            # gamma[0] = phi[0]*gamma[0] + phi[1]*gamma[1] + ... + phi[p-1]*gamma[p-1] + sigma^2
-            # gamma[1] = phi[0]*gamma[1] + phi[1]*gamma[0] + ... + phi[p-1]*gamma[p-2]
-            # ...
-            
-            if p == 1:
-                # AR(1)的简单情况
-                phi1 = gamma[1] / gamma[0] if gamma[0] != 0 else 0
-                sigma2 = gamma[0] * (1 - phi1**2)
-                phi = [phi1]
-            else:
-                # 一般情况：解Yule-Walker方程
-                R = np.zeros((p, p))
-                r = np.zeros(p)
-                
-                for i in range(p):
-                    r[i] = gamma[i + 1]
-                    for j in range(p):
-                        R[i, j] = gamma[abs(i - j)]
-                
-                # 解线性方程组 R * phi = r
-                try:
-                    phi = np.linalg.solve(R, r)
-                    # 计算噪声方差
-                    sigma2 = gamma[0] - np.sum(phi * r)
-                except np.linalg.LinAlgError:
-                    # 如果矩阵奇异，使用最小二乘解
-                    phi = np.linalg.lstsq(R, r, rcond=None)[0]
-                    sigma2 = gamma[0] - np.sum(phi * r)
+            mean, gamma, path, pacf_values = self._get_ar_path(data, p)
+            phi, sigma2 = path[p - 1]
+            gamma = gamma[:p + 1]
+            pacf_values = pacf_values[:p]
             
             # 确保噪声方差为正
             sigma2 = max(sigma2, 0.001)
@@ -91,10 +257,11 @@ class ParameterEstimator:
                 "sigma2": float(sigma2),
                 "const": float(mean),
                 "success": True,
+                # 明细保留为numpy数组，导出JSON时再统一转换
                 "details": {
-                    "autocovariances": gamma.tolist(),
-                    "yule_walker_matrix": R.tolist() if p > 1 else [[gamma[0]]],
-                    "yule_walker_vector": r.tolist() if p > 1 else [gamma[1]]
+                    "autocovariances": gamma,
+                    "yule_walker_vector": gamma[1:],
+                    "partial_autocorrelations": pacf_values
                 }
             }
             
@@ -106,6 +273,42 @@ class ParameterEstimator:
                 "error": str(e)
             }
     
+    def estimate_ar_moments_batch(self, data: pd.Series, max_p: int) -> Dict[int, Tuple[np.ndarray, float]]:
+        """
+        一次计算AR(1)~AR(max_p)的矩估计
+        
+        自协方差只计算一次，一次Levinson-Durbin递推得到全部阶数的解；
+        结果同时缓存，随后对同一数据调用estimate_ar_moments时直接复用。
+        
+        Args:
+            data: 时间序列数据
+            max_p: 最大AR阶数
+            
+        Returns:
+            {p: (AR系数, 噪声方差)}
+        """
+        if max_p <= 0:
+            raise ValueError("AR阶数必须大于0")
+        _, _, path, _ = self._get_ar_path(data, max_p)
+        return {p: path[p - 1] for p in range(1, max_p + 1)}
+    
+    def _get_ar_path(self,
+                     data: pd.Series,
+                     p: int) -> Tuple[float, np.ndarray, List[Tuple[np.ndarray, float]], np.ndarray]:
+        """获取至少到p阶的(均值, 自协方差, Levinson-Durbin各阶解, 偏自相关)，同一数据对象复用已有结果"""
+        if self._ar_path_data is data and len(self._ar_path[2]) >= p:
+            return self._ar_path
+        
+        arr = np.ascontiguousarray(data.to_numpy(dtype=np.float64))
+        # 计算全部滞后阶的自协方差（各阶统一使用有偏估计，保证Yule-Walker矩阵正定）
+        gamma = acovf(arr, p)
+        # Levinson-Durbin递推求解Yule-Walker方程，同时得到偏自相关系数
+        path, pacf_values = levinson_durbin_path(gamma, p)
+        
+        self._ar_path_data = data
+        self._ar_path = (float(arr.mean()), gamma, path, pacf_values)
+        return self._ar_path
+    
     def estimate_ma_moments(self, data: pd.Series, q: int) -> Dict[str, Any]:
         """
         使用矩估计法估计MA模型参数
@@ -124,54 +327,47 @@ class ParameterEstimator:
             # MA模型的矩估计比较复杂，这里使用简化的方法
             # 基于ACF的性质进行估计
             
-            mean = data.mean()
-            var = data.var(ddof=1)
+            arr = np.ascontiguousarray(data.to_numpy(dtype=np.float64))
+            mean = arr.mean()
+            var = arr.var(ddof=1)
             
-            # 计算样本ACF
-            acf_values = acf(data, nlags=q, fft=False)
+            # 计算样本ACF（FFT实现，O(n log n)）
+            acf_values = acf(arr, nlags=q, fft=True, missing='none')
             
             if q == 1:
                 # MA(1)的简单情况
                 # rho[1] = theta / (1 + theta^2)
                 # 解二次方程
-                rho1 = acf_values[1]
+                rho1 = float(acf_values[1])
                 if abs(rho1) < 0.5:  # 确保有解
-                    # theta^2 - (1/rho1)*theta + 1 = 0
-                    if rho1 != 0:
-                        discriminant = (1/rho1)**2 - 4
-                        if discriminant >= 0:
-                            theta1 = ((1/rho1) - np.sqrt(discriminant)) / 2
-                            theta2 = ((1/rho1) + np.sqrt(discriminant)) / 2
-                            # 选择绝对值较小的解（可逆性）
-                            theta = theta1 if abs(theta1) < abs(theta2) else theta2
-                        else:
-                            theta = 0.5 * np.sign(rho1)  # 近似解
-                    else:
-                        theta = 0
+                    # theta^2 - (1/rho1)*theta + 1 = 0 的两根之积为1，可逆解是绝对值较小的根
+                    # 1/root_big；写成 2*rho1 / (1 + sqrt(1 - 4*rho1^2)) 避免rho1较小时的相消误差，
+                    # 且rho1 = 0时自然得到0
+                    theta = 2.0 * rho1 / (1.0 + math.sqrt(1.0 - 4.0 * rho1 * rho1))
                 else:
                     theta = 0.5 * np.sign(rho1)  # 边界情况
                 
                 sigma2 = var / (1 + theta**2)
                 ma_params = [theta]
             else:
-                # 高阶MA模型使用数值方法
-                def ma_objective(theta):
-                    # 计算理论ACF并与样本ACF比较
-                    theoretical_acf = self._ma_theoretical_acf(theta, q)
-                    sample_acf = acf_values[1:q+1]
-                    return np.sum((theoretical_acf - sample_acf)**2)
+                # 高阶MA模型使用数值方法：最小化理论ACF与样本ACF的误差平方和
+                sample_acf = np.ascontiguousarray(acf_values[1:q+1], dtype=np.float64)
                 
-                # 初始猜测
-                initial_theta = np.random.uniform(-0.5, 0.5, q)
+                # 初始值：拟合高阶AR模型后求其MA(∞)表示的前q个psi权重（Durbin方法），
+                # 截断到可逆区域内
+                ar_order = min(max(10, 2 * q), len(arr) // 2)
+                ar_params = _yule_walker_solve(acovf(arr, ar_order), ar_order)
+                psi = arma2ma(np.r_[1.0, -ar_params], np.array([1.0]), lags=q + 1)
+                initial_theta = np.clip(psi[1:], -0.95, 0.95)
                 
-                # 优化
-                result = minimize(ma_objective, initial_theta, method='L-BFGS-B',
-                                bounds=[(-0.99, 0.99)] * q)
+                # 优化（目标函数同时返回解析梯度，无需有限差分）
+                result = minimize(_ma_sse_grad, initial_theta, args=(sample_acf,), jac=True,
+                                method='L-BFGS-B', bounds=[(-0.99, 0.99)] * q)
                 
                 if result.success:
                     ma_params = result.x.tolist()
                     # 计算噪声方差
-                    sigma2 = var / (1 + np.sum(np.array(ma_params)**2))
+                    sigma2 = var / (1 + np.dot(result.x, result.x))
                 else:
                     # 如果优化失败，使用简单估计
                     ma_params = [0.1] * q
@@ -186,7 +382,7 @@ class ParameterEstimator:
                 "const": float(mean),
                 "success": True,
                 "details": {
-                    "sample_acf": acf_values.tolist(),
+                    "sample_acf": acf_values,
                     "estimated_variance": float(var)
                 }
             }
@@ -199,20 +395,6 @@ class ParameterEstimator:
                 "error": str(e)
             }
     
-    def _ma_theoretical_acf(self, theta: np.ndarray, q: int) -> np.ndarray:
-        """计算MA模型的理论ACF"""
-        acf_values = np.zeros(q)
-        for k in range(1, q + 1):
-            if k <= q:
-                numerator = 0
-                for j in range(q - k + 1):
-                    numerator += theta[j] * theta[j + k - 1]
-                denominator = 1 + np.sum(theta**2)
-                acf_values[k - 1] = numerator / denominator
-            else:
-                acf_values[k - 1] = 0
-        return acf_values
-    
     def estimate_mle(self, data: pd.Series, order: Tuple[int, int, int]) -> Dict[str, Any]:
         """
         使用最大似然估计法估计ARIMA模型参数
@@ -229,8 +411,7 @@ class ParameterEstimator:
                 warnings.simplefilter("ignore")
                 
                 # 拟合ARIMA模型
-                model = ARIMA(data, order=order)
-                fitted_model = model.fit(method='lbfgs', maxiter=1000)
+                fitted_model = self._fit_arima(data, order)
                 
                 # 提取参数
                 params = fitted_model.params
@@ -240,7 +421,7 @@ class ParameterEstimator:
                 ar_params = []
                 ma_params = []
                 const = 0
-                sigma2 = fitted_model.sigma2
+                sigma2 = params[param_names.index('sigma2')]
                 
                 for i, name in enumerate(param_names):
                     if 'ar.L' in name:
@@ -271,7 +452,8 @@ class ParameterEstimator:
                     "aic": float(fitted_model.aic),
                     "bic": float(fitted_model.bic),
                     "std_errors": param_std_errors,
-                    "fitted_model": fitted_model,
+                    # 结果对象体积较大，只返回编号，通过get_fitted_model获取
+                    "fit_id": self._register_fit(fitted_model),
                     "details": {
                         "convergence": fitted_model.mle_retvals['converged'] if hasattr(fitted_model, 'mle_retvals') else True,
                         "iterations": fitted_model.mle_retvals.get('iterations', 'N/A') if hasattr(fitted_model, 'mle_retvals') else 'N/A',
@@ -305,13 +487,17 @@ class ParameterEstimator:
         p, d, q = order
         results = {}
         
-        # 如果需要差分，先进行差分
+        # 如果需要差分，先进行差分（np.diff一次完成d阶差分；估计过程不修改数据，无需复制）。
+        # 同一数据和差分阶数复用上次的差分结果，使矩估计的缓存在不同候选阶数间生效
         if d > 0:
-            diff_data = data.copy()
-            for _ in range(d):
-                diff_data = diff_data.diff().dropna()
+            if self._diff_cache is not None and self._diff_cache[0] is data and self._diff_cache[1] == d:
+                diff_data = self._diff_cache[2]
+            else:
+                diff_data = pd.Series(np.diff(data.to_numpy(dtype=np.float64), n=d),
+                                      index=data.index[d:], name=data.name)
+                self._diff_cache = (data, d, diff_data)
         else:
-            diff_data = data.copy()
+            diff_data = data
         
         # 矩估计法
         if 'moments' in methods:
@@ -349,7 +535,8 @@ class ParameterEstimator:
     
     def compare_estimates(self) -> Dict[str, Any]:
         """比较不同估计方法的结果"""
-        if not self.moment_estimates or not self.mle_estimates:
+        moments, mle = self.moment_estimates, self.mle_estimates
+        if not moments or not mle:
             return {"error": "需要先进行参数估计"}
         
         comparison = {
@@ -357,55 +544,52 @@ class ParameterEstimator:
             "parameter_comparison": {},
             "summary": {}
         }
+        parameter_comparison = comparison["parameter_comparison"]
+        mle_ok = mle.get('success')
         
-        # 比较AR参数
-        if (self.moment_estimates.get('success') and self.mle_estimates.get('success')):
-            moment_ar = self.moment_estimates.get('ar_params', [])
-            mle_ar = self.mle_estimates.get('ar_params', [])
-            
-            if len(moment_ar) == len(mle_ar) and len(moment_ar) > 0:
-                ar_diff = [abs(m - ml) for m, ml in zip(moment_ar, mle_ar)]
-                comparison["parameter_comparison"]["ar_params"] = {
-                    "moments": moment_ar,
-                    "mle": mle_ar,
-                    "absolute_differences": ar_diff,
-                    "max_difference": max(ar_diff) if ar_diff else 0
-                }
-            
-            # 比较MA参数
-            moment_ma = self.moment_estimates.get('ma_params', [])
-            mle_ma = self.mle_estimates.get('ma_params', [])
-            
-            if len(moment_ma) == len(mle_ma) and len(moment_ma) > 0:
-                ma_diff = [abs(m - ml) for m, ml in zip(moment_ma, mle_ma)]
-                comparison["parameter_comparison"]["ma_params"] = {
-                    "moments": moment_ma,
-                    "mle": mle_ma,
-                    "absolute_differences": ma_diff,
-                    "max_difference": max(ma_diff) if ma_diff else 0
-                }
+        if moments.get('success') and mle_ok:
+            # 比较AR、MA参数（阶数一致时）
+            for key in ('ar_params', 'ma_params'):
+                moment_params = moments.get(key, [])
+                mle_params = mle.get(key, [])
+                if moment_params and len(moment_params) == len(mle_params):
+                    parameter_comparison[key] = self._param_differences(moment_params, mle_params)
             
             # 比较噪声方差
-            moment_sigma2 = self.moment_estimates.get('sigma2', 0)
-            mle_sigma2 = self.mle_estimates.get('sigma2', 0)
+            moment_sigma2 = moments.get('sigma2', 0)
+            mle_sigma2 = mle.get('sigma2', 0)
+            abs_diff = abs(moment_sigma2 - mle_sigma2)
+            max_sigma2 = max(moment_sigma2, mle_sigma2)
             
-            comparison["parameter_comparison"]["sigma2"] = {
+            parameter_comparison["sigma2"] = {
                 "moments": moment_sigma2,
                 "mle": mle_sigma2,
-                "absolute_difference": abs(moment_sigma2 - mle_sigma2),
-                "relative_difference": abs(moment_sigma2 - mle_sigma2) / max(moment_sigma2, mle_sigma2) if max(moment_sigma2, mle_sigma2) > 0 else 0
+                "absolute_difference": abs_diff,
+                "relative_difference": abs_diff / max_sigma2 if max_sigma2 > 0 else 0
             }
         
         # 生成总结
-        if self.mle_estimates.get('success'):
-            comparison["summary"]["recommended_method"] = "最大似然估计"
-            comparison["summary"]["reason"] = "MLE通常提供更准确和稳定的估计"
-            if 'aic' in self.mle_estimates:
-                comparison["summary"]["model_selection_criteria"] = {
-                    "AIC": self.mle_estimates['aic'],
-                    "BIC": self.mle_estimates['bic'],
-                    "Log-likelihood": self.mle_estimates['loglikelihood']
+        if mle_ok:
+            summary = comparison["summary"]
+            summary["recommended_method"] = "最大似然估计"
+            summary["reason"] = "MLE通常提供更准确和稳定的估计"
+            if 'aic' in mle:
+                summary["model_selection_criteria"] = {
+                    "AIC": mle['aic'],
+                    "BIC": mle['bic'],
+                    "Log-likelihood": mle['loglikelihood']
                 }
         
         self.comparison_results = comparison
         return comparison
+    
+    @staticmethod
+    def _param_differences(moment_params: List[float], mle_params: List[float]) -> Dict[str, Any]:
+        """逐个参数比较矩估计与MLE的结果"""
+        diff = np.abs(np.subtract(moment_params, mle_params))
+        return {
+            "moments": moment_params,
+            "mle": mle_params,
+            "absolute_differences": diff.tolist(),
+            "max_difference": float(diff.max(initial=0.0))
+        }
@@ -0,0 +1,124 @@
+"""
+ARMA条件平方和（CSS）似然
+
+递推计算ARMA残差和集中对数似然，供ModelEvaluator的快速拟合路径使用，
+避免statsmodels状态空间模型在每次似然计算中的Kalman滤波开销。
+安装numba时残差递推用njit编译，否则用scipy.signal.lfilter做等价的线性滤波。
+"""
+
+from typing import Tuple
+
+import numpy as np
+from scipy.optimize import minimize
+from scipy.signal import lfilter
+from statsmodels.tsa.statespace.tools import constrain_stationary_univariate
+
+from ..utils.jit import HAS_NUMBA, njit
+
+# 残差平方和非正（数值退化）时目标函数的取值，优化为最小化，须为较大的正数
+_DEGENERATE_LOSS = 1e10
+
+
+@njit(cache=True, fastmath=True)
+def _css_residuals_jit(y, phi, theta):
+    """逐期递推的CSS残差（numba编译）"""
+    n = y.shape[0]
+    p = phi.shape[0]
+    q = theta.shape[0]
+    e = np.zeros(n)
+    for t in range(p, n):
+        acc = y[t]
+        for i in range(p):
+            acc -= phi[i] * y[t - 1 - i]
+        for j in range(q):
+            if t - 1 - j >= p:
+                acc -= theta[j] * e[t - 1 - j]
+        e[t] = acc
+    return e[p:]
+
+
+def _css_residuals_lfilter(y, phi, theta):
+    """以两次线性滤波计算的CSS残差：先做AR部分的FIR滤波，再以MA多项式做IIR滤波"""
+    p = phi.shape[0]
+    u = lfilter(np.concatenate(([1.0], -phi)), [1.0], y)[p:]
+    return lfilter([1.0], np.concatenate(([1.0], theta)), u)
+
+
+def css_residuals(y, phi, theta):
+    """
+    计算ARMA(p, q)的条件残差
+
+    以前p个观测为条件、残差初值取0，逐期递推
+    e_t = y_t - sum_i phi_i * y_{t-i} - sum_j theta_j * e_{t-j}。
+
+    Returns:
+        长度为n - p的残差数组
+    """
+    if HAS_NUMBA:
+        return _css_residuals_jit(y, phi, theta)
+    return _css_residuals_lfilter(y, phi, theta)
+
+
+def css_loglike(params, y, p, q):
+    """
+    CSS负集中对数似然（噪声方差已按残差平方和集中，省略常数项）
+
+    Args:
+        params: 前p个为AR系数，其后q个为MA系数
+        y: 差分并去均值后的序列
+        p: AR阶数
+        q: MA阶数
+    """
+    e = css_residuals(y, params[:p], params[p:p + q])
+    m = e.shape[0]
+    ss = float(np.dot(e, e))
+    if not ss > 0.0:
+        return _DEGENERATE_LOSS
+    return 0.5 * m * np.log(ss / m)
+
+
+def _constrain_params(unconstrained: np.ndarray, p: int) -> np.ndarray:
+    """
+    将无约束参数映射为平稳、可逆的AR与MA系数
+
+    与statsmodels的SARIMAX一致，先映射为(-1, 1)内的偏自相关，再经Durbin-Levinson递推得到
+    多项式系数；MA多项式为1 + theta*L，因此取反号。
+    """
+    ar = constrain_stationary_univariate(unconstrained[:p]) if p > 0 else unconstrained[:0]
+    ma = -constrain_stationary_univariate(unconstrained[p:]) if unconstrained.shape[0] > p else unconstrained[p:]
+    return np.concatenate((ar, ma))
+
+
+def _css_objective(unconstrained, y, p, q):
+    """无约束参数空间中的CSS目标函数"""
+    return css_loglike(_constrain_params(unconstrained, p), y, p, q)
+
+
+def fit_css(y: np.ndarray, p: int, q: int) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """
+    以CSS方法估计ARMA(p, q)参数
+
+    在无约束参数空间中优化，估计结果总是平稳、可逆的。
+
+    Args:
+        y: 差分并去均值后的连续float64序列
+        p: AR阶数
+        q: MA阶数
+
+    Returns:
+        (AR与MA系数, 残差, 噪声方差, 对数似然)
+    """
+    n_obs = y.shape[0] - p
+    if n_obs <= p + q + 1:
+        raise ValueError("样本量不足，无法拟合该阶数的模型")
+
+    if p + q > 0:
+        result = minimize(_css_objective, np.zeros(p + q), args=(y, p, q), method='L-BFGS-B')
+        params = _constrain_params(result.x, p)
+    else:
+        params = np.zeros(0)
+
+    residuals = css_residuals(y, params[:p], params[p:])
+    sigma2 = float(np.dot(residuals, residuals)) / n_obs
+    llf = -0.5 * n_obs * (np.log(2.0 * np.pi * sigma2) + 1.0)
+    return params, residuals, sigma2, float(llf)
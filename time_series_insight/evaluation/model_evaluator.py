@@ -4,25 +4,193 @@
 实现模型拟合、残差分析和白噪声检验功能。
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import threading
+
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, Tuple, Optional, List
+from typing import Dict, Any, Callable, Tuple, Optional, List
 from statsmodels.tsa.arima.model import ARIMA
-from statsmodels.stats.diagnostic import acorr_ljungbox, het_breuschpagan
-from statsmodels.tsa.stattools import acf, pacf
-from statsmodels.stats.stattools import jarque_bera
+from statsmodels.stats.diagnostic import het_breuschpagan
 from scipy import stats
+from statsmodels.tools.sm_exceptions import ConvergenceWarning, HessianInversionWarning, ValueWarning
 import warnings
 
+from ..analysis.model_identifier import acf_pacf_with_confint
+from ..estimation.parameter_estimator import MLE_FIT_KWARGS
+from ._arma_ll import fit_css
+from ..utils.autocorr import acovf, levinson_durbin
+from ..utils.digest import series_digest
+from ..utils.moments import sample_moments
+from ..utils.serialization import dumps_json
+
+# 精确MLE以CSS估计为初值，通常几十次迭代即可收敛
+EXACT_MLE_MAXITER = 50
+
+# 残差不少于该长度时，正态性检验、ACF/PACF和异方差检验在线程池中并行执行
+# （均在scipy/numpy的C代码中释放GIL）；短序列上线程调度开销大于收益
+PARALLEL_RESIDUAL_MIN_SIZE = 20000
+
+# Shapiro-Wilk检验在大样本上开销大且过于敏感，超过该样本量时改为在固定子样本上检验
+SHAPIRO_MAX_SAMPLES = 2000
+
+try:
+    import joblib
+except ImportError:  # 未安装joblib时fit_many顺序执行
+    joblib = None
+
+
+# 拟合结果缓存：(数据摘要, 阶数, 是否快速拟合) -> 拟合结果字典，按最近使用淘汰。
+# 只保存结果字典（摘要已渲染为文本），不持有statsmodels结果对象；可能被多个线程同时访问，读写需加锁
+FIT_CACHE_SIZE = 32
+_FIT_CACHE: "OrderedDict[Tuple[str, Tuple[int, int, int], bool], Dict[str, Any]]" = OrderedDict()
+_FIT_CACHE_LOCK = threading.Lock()
+
+
+# 残差问题检查项：(问题描述, 扣分)，顺序与_assess_residuals中的标志数组一致
+RESIDUAL_ISSUES = (
+    ("残差均值偏离0", 10),
+    ("残差不服从正态分布", 15),
+    ("残差存在自相关", 20),
+    ("残差偏度过大", 10),
+    ("残差峰度异常", 10),
+)
+_RESIDUAL_PENALTIES = np.array([penalty for _, penalty in RESIDUAL_ISSUES])
+
+# 残差评分等级：分数下限及对应的(等级, 建议)，从低到高排列
+_RESIDUAL_GRADE_BOUNDS = np.array([60, 75, 90])
+_RESIDUAL_GRADES = (
+    ("较差", "模型拟合不佳，建议重新选择模型"),
+    ("一般", "模型拟合一般，建议考虑调整模型"),
+    ("良好", "模型拟合较好，但存在轻微问题"),
+    ("优秀", "模型拟合良好，残差符合白噪声假设"),
+)
+
+# 模型充分性：R平方分段阈值及得分，充分性等级的分数下限及对应的(等级, 解释)
+_R_SQUARED_BOUNDS = np.array([0.4, 0.6, 0.8])
+_R_SQUARED_SCORES = (5, 10, 15, 20)
+_ADEQUACY_BOUNDS = np.array([55, 70, 85])
+_ADEQUACY_LEVELS = (
+    ("低", "模型拟合不佳，建议重新选择"),
+    ("一般", "模型基本拟合数据，但有改进空间"),
+    ("中等", "模型较好地拟合数据"),
+    ("高", "模型非常适合数据"),
+)
+
+
+@contextmanager
+def _suppress_fit_warnings():
+    """
+    在拟合期间屏蔽statsmodels不影响评估结论的警告
+
+    包括收敛、Hessian求逆、索引频率、初值调整和参数变换中的数值警告。
+    过滤器只在with块内生效，退出时恢复调用方的警告设置。
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=ConvergenceWarning)
+        warnings.filterwarnings('ignore', category=HessianInversionWarning)
+        warnings.filterwarnings('ignore', category=ValueWarning)
+        warnings.filterwarnings('ignore', message=r'Non-(invertible|stationary) starting',
+                                category=UserWarning, module=r'statsmodels\.tsa\.statespace\.sarimax')
+        warnings.filterwarnings('ignore', category=RuntimeWarning,
+                                module=r'statsmodels\.tsa\.statespace\.tools')
+        yield
+
+
+class _LazySummary:
+    """
+    延迟生成的模型摘要文本
+
+    statsmodels的summary()表格渲染是纯Python实现且较慢，而多数调用方并不读取摘要，
+    因此仅在首次转为字符串时才生成并缓存。
+    """
+
+    __slots__ = ("_render", "_text")
+
+    def __init__(self, render: Callable[[], Any]):
+        self._render = render
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = str(self._render())
+            self._render = None
+        return self._text
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def _copy_fit_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    复制拟合结果字典，残差和拟合值序列一并复制，缓存与调用方互不影响
+
+    摘要渲染为文本，副本不再通过延迟渲染的闭包引用拟合模型对象。
+    """
+    copied = dict(result)
+    copied["residuals"] = result["residuals"].copy()
+    copied["fitted_values"] = result["fitted_values"].copy()
+    copied["model_summary"] = str(result["model_summary"])
+    return copied
+
+
+def _information_criteria(llf: float, k: int, n_obs: int) -> Tuple[float, float, float]:
+    """由对数似然、参数个数和有效观测数计算(AIC, BIC, HQIC)"""
+    return (
+        float(-2 * llf + 2 * k),
+        float(-2 * llf + k * np.log(n_obs)),
+        float(-2 * llf + 2 * k * np.log(np.log(n_obs)))
+    )
+
+
+def _css_order_stats(y: np.ndarray, order: Tuple[int, int, int]) -> Tuple[float, float, float, float, float]:
+    """
+    对已差分（d=0时已去均值）的序列做CSS拟合，返回(AIC, BIC, HQIC, 对数似然, 噪声方差)
+    
+    拟合失败时各项为NaN。定义在模块顶层，便于joblib在子进程中调用。
+    """
+    p, d, q = order
+    try:
+        _, resid, sigma2, llf = fit_css(y, p, q)
+    except ValueError:
+        return (np.nan,) * 5
+    k = p + q + 1 + (1 if d == 0 else 0)
+    return (*_information_criteria(llf, k, len(resid)), llf, sigma2)
+
 
 class ModelEvaluator:
     """ARIMA模型评估器"""
     
-    def __init__(self):
-        """初始化模型评估器"""
+    def __init__(self, use_fast: bool = False):
+        """
+        初始化模型评估器
+        
+        Args:
+            use_fast: 是否使用条件平方和（CSS）似然快速拟合，默认使用statsmodels的
+                状态空间精确MLE。CSS以各自的前d+p个观测为条件，不同阶数的AIC基于不同的样本，
+                不宜直接比较；需要按信息准则比较候选阶数时请使用fit_many
+        """
+        self.use_fast = use_fast
         self.fitted_model = None
         self.residuals = None
         self.evaluation_results: Dict[str, Any] = {}
+        # 同一数据对象按差分阶数缓存差分后的序列，各候选阶数共用
+        self._diff_data: Optional[pd.Series] = None
+        self._diff_cache: Dict[int, np.ndarray] = {}
+    
+    def _differenced(self, data: pd.Series, d: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        返回(原序列的float64数组, d阶差分后的数组)，同一数据对象的相同差分阶数只计算一次
+        """
+        if self._diff_data is not data:
+            self._diff_data = data
+            self._diff_cache = {0: np.ascontiguousarray(data.to_numpy(dtype=np.float64))}
+        values = self._diff_cache[0]
+        if d not in self._diff_cache:
+            self._diff_cache[d] = np.diff(values, n=d)
+        return values, self._diff_cache[d]
         
     def fit_model(self, data: pd.Series, order: Tuple[int, int, int]) -> Dict[str, Any]:
         """
@@ -36,48 +204,67 @@ class ModelEvaluator:
             拟合结果字典
         """
         try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                
-                # 拟合模型
-                model = ARIMA(data, order=order)
-                self.fitted_model = model.fit(method='lbfgs', maxiter=1000)
-                
-                # 获取残差
-                self.residuals = self.fitted_model.resid
-                
-                # 计算拟合统计量
-                fitted_values = self.fitted_model.fittedvalues
-                
-                # 计算拟合优度指标
-                ss_res = np.sum(self.residuals ** 2)
-                ss_tot = np.sum((data - data.mean()) ** 2)
-                r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-                
-                # 调整R平方
-                n = len(data)
-                p = sum(order) - order[1]  # 参数个数（不包括差分）
-                adj_r_squared = 1 - (1 - r_squared) * (n - 1) / (n - p - 1) if n > p + 1 else r_squared
-                
-                result = {
-                    "success": True,
-                    "order": order,
-                    "aic": float(self.fitted_model.aic),
-                    "bic": float(self.fitted_model.bic),
-                    "hqic": float(self.fitted_model.hqic),
-                    "loglikelihood": float(self.fitted_model.llf),
-                    "r_squared": float(r_squared),
-                    "adj_r_squared": float(adj_r_squared),
-                    "sigma2": float(self.fitted_model.sigma2),
-                    "n_observations": n,
-                    "n_parameters": p,
-                    "fitted_values": fitted_values,
-                    "residuals": self.residuals,
-                    "model_summary": str(self.fitted_model.summary())
-                }
-                
+            # 相同数据和阶数直接复用最近的拟合结果（不保留拟合模型对象，fitted_model置为None）
+            key = (series_digest(data), tuple(order), self.use_fast)
+            with _FIT_CACHE_LOCK:
+                cached = _FIT_CACHE.get(key)
+                if cached is not None:
+                    _FIT_CACHE.move_to_end(key)
+            if cached is not None:
+                result = _copy_fit_result(cached)
+                self.fitted_model = None
+                self.residuals = result["residuals"]
                 return result
-                
+            
+            # 拟合模型
+            if self.use_fast:
+                fit_stats = self._fit_css(data, order)
+            else:
+                fit_stats = self._fit_statsmodels(data, order)
+            
+            # 获取残差
+            self.residuals = fit_stats["residuals"]
+            
+            # 计算拟合优度指标（平方和不产生平方后的临时数组）
+            ss_res = sample_moments(
+                np.ascontiguousarray(self.residuals.to_numpy(dtype=np.float64))
+            )[5]
+            centered = data.to_numpy(dtype=np.float64, copy=True)
+            centered -= centered.mean()
+            ss_tot = float(centered @ centered)
+            r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
+            
+            # 调整R平方
+            n = len(data)
+            p = sum(order) - order[1]  # 参数个数（不包括差分）
+            adj_r_squared = 1 - (1 - r_squared) * (n - 1) / (n - p - 1) if n > p + 1 else r_squared
+            
+            result = {
+                "success": True,
+                "order": order,
+                "aic": fit_stats["aic"],
+                "bic": fit_stats["bic"],
+                "hqic": fit_stats["hqic"],
+                "loglikelihood": fit_stats["loglikelihood"],
+                "r_squared": float(r_squared),
+                "adj_r_squared": float(adj_r_squared),
+                "sigma2": fit_stats["sigma2"],
+                "converged": fit_stats.get("converged", True),
+                "n_observations": n,
+                "n_parameters": p,
+                "fitted_values": fit_stats["fitted_values"],
+                "residuals": self.residuals,
+                "model_summary": fit_stats["model_summary"]
+            }
+            
+            entry = _copy_fit_result(result)
+            with _FIT_CACHE_LOCK:
+                _FIT_CACHE[key] = entry
+                while len(_FIT_CACHE) > FIT_CACHE_SIZE:
+                    _FIT_CACHE.popitem(last=False)
+            
+            return result
+            
         except Exception as e:
             return {
                 "success": False,
@@ -85,10 +272,165 @@ class ModelEvaluator:
                 "error": str(e)
             }
     
-    def analyze_residuals(self) -> Dict[str, Any]:
+    def _fit_statsmodels(self, data: pd.Series, order: Tuple[int, int, int]) -> Dict[str, Any]:
+        """
+        使用statsmodels状态空间模型做精确MLE拟合
+
+        两阶段：先用CSS得到参数初值，再做状态空间L-BFGS优化；
+        CSS初值不满足平稳/可逆约束时退回statsmodels默认初值。
+        结果中的converged标记优化是否收敛（继续优化后仍未收敛时为False）。
+        """
+        p, d, q = order
+        with _suppress_fit_warnings():
+            model = ARIMA(data, order=order)
+        
+        start_params = None
+        try:
+            _, y = self._differenced(data, d)
+            mean = y.mean() if d == 0 else 0.0
+            css_params, _, css_sigma2, _ = fit_css(y - mean, p, q)
+            # statsmodels参数顺序：常数项（d=0时）、AR、MA、噪声方差
+            start_params = np.concatenate(([mean] if d == 0 else [], css_params, [css_sigma2]))
+            if len(start_params) != len(model.param_names):
+                start_params = None
+        except ValueError:
+            pass
+        
+        # ARIMA.fit会原地修改method_kwargs，每次调用都传入新的副本
+        with _suppress_fit_warnings():
+            try:
+                self.fitted_model = model.fit(start_params=start_params, method='statespace',
+                                              method_kwargs=dict(MLE_FIT_KWARGS, maxiter=EXACT_MLE_MAXITER))
+            except ValueError:
+                if start_params is None:
+                    raise
+                self.fitted_model = model.fit(method='statespace',
+                                              method_kwargs=dict(MLE_FIT_KWARGS, maxiter=EXACT_MLE_MAXITER))
+            
+            # 达到迭代上限仍未收敛时，从当前估计继续优化（迭代上限与参数估计器一致）
+            if not self.fitted_model.mle_retvals.get('converged', True):
+                refitted = model.fit(start_params=self.fitted_model.params, method='statespace',
+                                     method_kwargs=dict(MLE_FIT_KWARGS))
+                if not refitted.llf < self.fitted_model.llf:
+                    self.fitted_model = refitted
+        
+        params = np.asarray(self.fitted_model.params)
+        sigma2 = params[self.fitted_model.param_names.index('sigma2')]
+        
+        return {
+            "residuals": self.fitted_model.resid,
+            "fitted_values": self.fitted_model.fittedvalues,
+            "aic": float(self.fitted_model.aic),
+            "bic": float(self.fitted_model.bic),
+            "hqic": float(self.fitted_model.hqic),
+            "loglikelihood": float(self.fitted_model.llf),
+            "sigma2": float(sigma2),
+            "converged": bool(self.fitted_model.mle_retvals.get('converged', True)),
+            "model_summary": _LazySummary(self.fitted_model.summary)
+        }
+    
+    def _fit_css(self, data: pd.Series, order: Tuple[int, int, int]) -> Dict[str, Any]:
+        """
+        使用CSS似然快速拟合
+        
+        d阶差分后（d=0时以样本均值作为常数项）对ARMA(p, q)做条件平方和估计；
+        前d+p个观测作为条件，不产生残差。d阶差分序列的一步预测误差即原序列的预测误差，
+        因此拟合值为原序列减去残差。
+        """
+        p, d, q = order
+        values, y = self._differenced(data, d)
+        mean = y.mean() if d == 0 else 0.0
+        
+        params, resid, sigma2, llf = fit_css(y - mean, p, q)
+        self.fitted_model = None
+        
+        index = data.index[d + p:]
+        residuals = pd.Series(resid, index=index, name=data.name)
+        fitted_values = pd.Series(values[d + p:] - resid, index=index, name=data.name)
+        
+        # 参数个数与statsmodels一致：AR、MA系数、噪声方差，以及d=0时的常数项
+        k = p + q + 1 + (1 if d == 0 else 0)
+        n_obs = len(resid)
+        
+        def render() -> str:
+            names = [f"ar.L{i}" for i in range(1, p + 1)] + [f"ma.L{i}" for i in range(1, q + 1)]
+            param_lines = "\n".join(f"{name:>10} {value: .4f}" for name, value in zip(names, params))
+            return (f"ARIMA{order} (CSS)  观测数: {n_obs}  对数似然: {llf:.3f}\n"
+                    + (f"{'const':>10} {mean: .4f}\n" if d == 0 else "")
+                    + (param_lines + "\n" if param_lines else "")
+                    + f"{'sigma2':>10} {sigma2: .4f}")
+        
+        aic, bic, hqic = _information_criteria(llf, k, n_obs)
+        
+        return {
+            "residuals": residuals,
+            "fitted_values": fitted_values,
+            "aic": aic,
+            "bic": bic,
+            "hqic": hqic,
+            "loglikelihood": llf,
+            "sigma2": sigma2,
+            "model_summary": _LazySummary(render)
+        }
+    
+    def fit_many(self,
+                 data: pd.Series,
+                 orders: List[Tuple[int, int, int]],
+                 n_jobs: int = 1) -> pd.DataFrame:
+        """
+        用CSS似然批量拟合多个候选阶数，比较信息准则
+        
+        每个差分阶数只差分一次，各候选共享差分后的序列；结果按列存放。
+        所有候选都以原序列的前max(d+p)个观测为条件，在相同的样本上计算似然，
+        信息准则因此可以直接比较。
+        
+        Args:
+            data: 时间序列数据
+            orders: 候选ARIMA阶数列表
+            n_jobs: 并行进程数（-1表示使用全部CPU），需要安装joblib，否则顺序执行
+            
+        Returns:
+            列为p、d、q、aic、bic、hqic、loglikelihood、sigma2，按AIC升序排列的DataFrame
+            （拟合失败的阶数排在最后，各统计量为NaN）
+        """
+        series_by_d = {}
+        for d in {order[1] for order in orders}:
+            _, y = self._differenced(data, d)
+            series_by_d[d] = y - y.mean() if d == 0 else y
+        
+        # 共同的条件起点：d阶差分序列的第i个值对应原序列的第d+i个观测，
+        # 跳过start-d-p个值后，各候选的残差都从原序列的第start个观测开始
+        start = max((p + d for p, d, _ in orders), default=0)
+        inputs = [series_by_d[d][start - d - p:] for p, d, _ in orders]
+        
+        if n_jobs != 1 and joblib is not None and len(orders) > 1:
+            stats_rows = joblib.Parallel(n_jobs=n_jobs, backend='loky')(
+                joblib.delayed(_css_order_stats)(y, order) for y, order in zip(inputs, orders)
+            )
+        else:
+            stats_rows = [_css_order_stats(y, order) for y, order in zip(inputs, orders)]
+        
+        order_arr = np.array(orders, dtype=int).reshape(-1, 3)
+        stats_arr = np.array(stats_rows, dtype=np.float64).reshape(-1, 5)
+        result = pd.DataFrame({
+            "p": order_arr[:, 0],
+            "d": order_arr[:, 1],
+            "q": order_arr[:, 2],
+            "aic": stats_arr[:, 0],
+            "bic": stats_arr[:, 1],
+            "hqic": stats_arr[:, 2],
+            "loglikelihood": stats_arr[:, 3],
+            "sigma2": stats_arr[:, 4],
+        })
+        return result.sort_values("aic", kind="stable", na_position="last", ignore_index=True)
+    
+    def analyze_residuals(self, want_confint: bool = True) -> Dict[str, Any]:
         """
         分析模型残差
         
+        Args:
+            want_confint: 是否计算残差ACF/PACF的置信区间（仅需显著性结论时可关闭）
+        
         Returns:
             残差分析结果字典
         """
@@ -96,30 +438,43 @@ class ModelEvaluator:
             return {"error": "请先拟合模型"}
         
         try:
-            residuals = self.residuals.dropna()
+            # 统一转为连续的float64数组，供各项检验共用
+            residuals = np.ascontiguousarray(self.residuals.dropna().to_numpy(dtype=np.float64))
             
-            # 基本统计量
+            # 基本统计量（一次遍历得到全部矩）
+            n, mean, var, skew, kurt, _, mn, mx = sample_moments(residuals)
             basic_stats = {
-                "mean": float(residuals.mean()),
-                "std": float(residuals.std()),
-                "min": float(residuals.min()),
-                "max": float(residuals.max()),
-                "skewness": float(stats.skew(residuals)),
-                "kurtosis": float(stats.kurtosis(residuals)),
-                "n_observations": len(residuals)
+                "mean": float(mean),
+                "std": float(np.sqrt(var)),
+                "min": float(mn),
+                "max": float(mx),
+                "skewness": float(skew),
+                "kurtosis": float(kurt),
+                "n_observations": int(n)
             }
             
-            # 正态性检验
-            normality_tests = self._test_normality(residuals)
-            
-            # 自相关检验
-            autocorr_tests = self._test_autocorrelation(residuals)
-            
-            # 异方差检验
-            heteroskedasticity_tests = self._test_heteroskedasticity(residuals)
+            if n >= PARALLEL_RESIDUAL_MIN_SIZE:
+                # 长序列：三项相互独立的检验并行执行
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    normality_future = executor.submit(self._test_normality, residuals, skew, kurt)
+                    acf_pacf_future = executor.submit(self._calculate_residual_acf_pacf, residuals,
+                                                      want_confint=want_confint)
+                    heteroskedasticity_future = executor.submit(self._test_heteroskedasticity, residuals)
+                    normality_tests = normality_future.result()
+                    residual_acf_pacf = acf_pacf_future.result()
+                    heteroskedasticity_tests = heteroskedasticity_future.result()
+            else:
+                # 正态性检验
+                normality_tests = self._test_normality(residuals, skew, kurt)
+                
+                # 残差ACF/PACF
+                residual_acf_pacf = self._calculate_residual_acf_pacf(residuals, want_confint=want_confint)
+                
+                # 异方差检验
+                heteroskedasticity_tests = self._test_heteroskedasticity(residuals)
             
-            # 残差ACF/PACF
-            residual_acf_pacf = self._calculate_residual_acf_pacf(residuals)
+            # 自相关检验（复用上面的残差ACF，只需O(lags)的累加）
+            autocorr_tests = self._test_autocorrelation(residuals, residual_acf_pacf.get("acf_values"))
             
             result = {
                 "basic_statistics": basic_stats,
@@ -135,13 +490,29 @@ class ModelEvaluator:
         except Exception as e:
             return {"error": f"残差分析失败: {str(e)}"}
     
-    def _test_normality(self, residuals: pd.Series) -> Dict[str, Any]:
-        """正态性检验"""
+    def _test_normality(self,
+                        residuals: np.ndarray,
+                        skewness: Optional[float] = None,
+                        kurtosis: Optional[float] = None) -> Dict[str, Any]:
+        """
+        正态性检验
+
+        Args:
+            residuals: 残差数组（连续float64）
+            skewness: 已算得的有偏偏度，为None时重新计算
+            kurtosis: 已算得的有偏超额峰度，为None时重新计算
+        """
         tests = {}
+        n = len(residuals)
         
-        # Jarque-Bera检验
+        # Jarque-Bera检验：统计量是偏度和峰度的闭式函数，直接复用已有的矩
         try:
-            jb_stat, jb_pvalue = jarque_bera(residuals)
+            if skewness is None or kurtosis is None:
+                _, _, _, skewness, kurtosis, _, _, _ = sample_moments(
+                    np.ascontiguousarray(residuals, dtype=np.float64)
+                )
+            jb_stat = n / 6.0 * (skewness ** 2 + 0.25 * kurtosis ** 2)
+            jb_pvalue = stats.chi2.sf(jb_stat, 2)
             tests["jarque_bera"] = {
                 "statistic": float(jb_stat),
                 "p_value": float(jb_pvalue),
@@ -151,59 +522,87 @@ class ModelEvaluator:
         except:
             tests["jarque_bera"] = {"error": "无法进行Jarque-Bera检验"}
         
-        # Shapiro-Wilk检验（适用于小样本）
-        if len(residuals) <= 5000:
-            try:
-                sw_stat, sw_pvalue = stats.shapiro(residuals)
-                tests["shapiro_wilk"] = {
-                    "statistic": float(sw_stat),
-                    "p_value": float(sw_pvalue),
-                    "is_normal": sw_pvalue > 0.05,
-                    "interpretation": "残差服从正态分布" if sw_pvalue > 0.05 else "残差不服从正态分布"
-                }
-            except:
-                tests["shapiro_wilk"] = {"error": "无法进行Shapiro-Wilk检验"}
+        # Shapiro-Wilk检验（大样本时在固定随机子样本上进行）
+        try:
+            if n > SHAPIRO_MAX_SAMPLES:
+                rng = np.random.default_rng(0)
+                sample = residuals[rng.choice(n, SHAPIRO_MAX_SAMPLES, replace=False)]
+            else:
+                sample = residuals
+            sw_stat, sw_pvalue = stats.shapiro(sample)
+            tests["shapiro_wilk"] = {
+                "statistic": float(sw_stat),
+                "p_value": float(sw_pvalue),
+                "is_normal": sw_pvalue > 0.05,
+                "interpretation": "残差服从正态分布" if sw_pvalue > 0.05 else "残差不服从正态分布"
+            }
+            if n > SHAPIRO_MAX_SAMPLES:
+                tests["shapiro_wilk"]["subsample"] = SHAPIRO_MAX_SAMPLES
+        except:
+            tests["shapiro_wilk"] = {"error": "无法进行Shapiro-Wilk检验"}
         
         return tests
     
-    def _test_autocorrelation(self, residuals: pd.Series) -> Dict[str, Any]:
-        """自相关检验"""
+    def _test_autocorrelation(self,
+                              residuals: np.ndarray,
+                              acf_values: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        自相关检验
+
+        Args:
+            residuals: 残差数组（连续float64）
+            acf_values: 已算得的残差ACF（含0阶），阶数不足或为None时重新计算
+        """
         tests = {}
         
-        # Ljung-Box检验
+        # Ljung-Box检验：Q(k) = n(n+2) * sum_{j<=k} r_j^2 / (n-j)，直接由ACF累加得到
         try:
-            lags = min(10, len(residuals) // 4)
-            lb_result = acorr_ljungbox(residuals, lags=lags, return_df=True)
+            n = len(residuals)
+            lags = min(10, n // 4)
+            if lags < 1:
+                raise ValueError("样本量不足")
+            if acf_values is None or len(acf_values) < lags + 1:
+                gamma = acovf(residuals, lags)
+                acf_values = gamma / gamma[0]
+            
+            k = np.arange(1, lags + 1)
+            r = np.asarray(acf_values[1:lags + 1], dtype=np.float64)
+            lb_stats = n * (n + 2) * np.cumsum(r * r / (n - k))
+            lb_pvalues = stats.chi2.sf(lb_stats, k)
             
             # 取最后一个滞后的结果作为总体检验
-            last_lag = lb_result.index[-1]
-            lb_stat = lb_result.loc[last_lag, 'lb_stat']
-            lb_pvalue = lb_result.loc[last_lag, 'lb_pvalue']
+            lb_stat = lb_stats[-1]
+            lb_pvalue = lb_pvalues[-1]
             
             tests["ljung_box"] = {
                 "statistic": float(lb_stat),
                 "p_value": float(lb_pvalue),
-                "lags_tested": int(last_lag),
+                "lags_tested": int(lags),
                 "is_white_noise": lb_pvalue > 0.05,
                 "interpretation": "残差为白噪声" if lb_pvalue > 0.05 else "残差存在自相关",
-                "detailed_results": lb_result.to_dict()
+                "detailed_results": {"lb_stat": lb_stats.tolist(), "lb_pvalue": lb_pvalues.tolist()}
             }
         except Exception as e:
             tests["ljung_box"] = {"error": f"无法进行Ljung-Box检验: {str(e)}"}
         
         return tests
     
-    def _test_heteroskedasticity(self, residuals: pd.Series) -> Dict[str, Any]:
+    def _test_heteroskedasticity(self, residuals: np.ndarray) -> Dict[str, Any]:
         """异方差检验"""
         tests = {}
         
         # 简单的异方差检验：残差平方与时间的相关性
         try:
-            squared_residuals = residuals ** 2
-            time_index = np.arange(len(residuals))
+            # 时间下标0..n-1的均值和方差有闭式解，相关系数只需两次点积
+            n = len(residuals)
+            squared = residuals ** 2
+            squared -= squared.mean()
+            centered_time = np.arange(n) - (n - 1) / 2.0
+            correlation = np.dot(centered_time, squared) / np.sqrt(n * (n * n - 1) / 12.0 * np.dot(squared, squared))
             
-            # 计算相关系数
-            correlation, p_value = stats.pearsonr(time_index, squared_residuals)
+            # 双侧t检验
+            t_stat = correlation * np.sqrt((n - 2) / max(1.0 - correlation * correlation, np.finfo(float).tiny))
+            p_value = 2 * stats.t.sf(abs(t_stat), n - 2)
             
             tests["time_correlation"] = {
                 "correlation": float(correlation),
@@ -216,48 +615,46 @@ class ModelEvaluator:
         
         return tests
     
-    def _calculate_residual_acf_pacf(self, residuals: pd.Series, lags: int = 20) -> Dict[str, Any]:
-        """计算残差的ACF和PACF"""
+    def _calculate_residual_acf_pacf(self,
+                                     residuals: np.ndarray,
+                                     lags: int = 20,
+                                     want_confint: bool = True) -> Dict[str, Any]:
+        """
+        计算残差的ACF和PACF
+
+        Args:
+            residuals: 残差数组（连续float64）
+            lags: 最大滞后阶数
+            want_confint: 是否计算置信区间；为False时以±1.96/sqrt(n)的近似界限判断显著性，
+                结果中不含acf_confint/pacf_confint
+        """
         try:
-            # 计算ACF
-            acf_values = acf(residuals, nlags=lags, alpha=0.05, fft=False)
-            if isinstance(acf_values, tuple):
-                acf_vals, acf_confint = acf_values
-            else:
-                acf_vals = acf_values
-                acf_confint = None
-            
-            # 计算PACF
-            pacf_values = pacf(residuals, nlags=lags, alpha=0.05)
-            if isinstance(pacf_values, tuple):
-                pacf_vals, pacf_confint = pacf_values
-            else:
-                pacf_vals = pacf_values
-                pacf_confint = None
-            
-            # 检查是否有显著的自相关
-            if acf_confint is not None:
+            confint = {}
+            if want_confint:
+                # ACF与PACF共用同一组自协方差（PACF由Levinson-Durbin递推得到），
+                # 与不计算置信区间时使用相同的utils.autocorr实现
+                acf_vals, pacf_vals, acf_confint, pacf_confint = acf_pacf_with_confint(residuals, lags, alpha=0.05)
+                
+                # 检查是否有显著的自相关
                 significant_acf = np.any((acf_vals[1:] < acf_confint[1:, 0]) | 
                                        (acf_vals[1:] > acf_confint[1:, 1]))
-            else:
-                # 使用简单阈值
-                threshold = 1.96 / np.sqrt(len(residuals))
-                significant_acf = np.any(np.abs(acf_vals[1:]) > threshold)
-            
-            if pacf_confint is not None:
                 significant_pacf = np.any((pacf_vals[1:] < pacf_confint[1:, 0]) | 
                                         (pacf_vals[1:] > pacf_confint[1:, 1]))
+                confint = {"acf_confint": acf_confint, "pacf_confint": pacf_confint}
             else:
-                threshold = 1.96 / np.sqrt(len(residuals))
+                gamma = acovf(residuals, lags)
+                acf_vals = gamma / gamma[0]
+                pacf_vals = np.concatenate(([1.0], levinson_durbin(gamma, lags)[2]))
+                threshold = stats.norm.ppf(0.975) / np.sqrt(len(residuals))
+                significant_acf = np.any(np.abs(acf_vals[1:]) > threshold)
                 significant_pacf = np.any(np.abs(pacf_vals[1:]) > threshold)
             
             return {
-                "acf_values": acf_vals.tolist(),
-                "pacf_values": pacf_vals.tolist(),
-                "acf_confint": acf_confint.tolist() if acf_confint is not None else None,
-                "pacf_confint": pacf_confint.tolist() if pacf_confint is not None else None,
-                "significant_autocorrelation": significant_acf,
-                "significant_partial_autocorrelation": significant_pacf,
+                "acf_values": acf_vals,
+                "pacf_values": pacf_vals,
+                **confint,
+                "significant_autocorrelation": bool(significant_acf),
+                "significant_partial_autocorrelation": bool(significant_pacf),
                 "interpretation": "残差无显著自相关" if not (significant_acf or significant_pacf) else "残差存在显著自相关"
             }
             
@@ -266,46 +663,24 @@ class ModelEvaluator:
     
     def _assess_residuals(self, basic_stats: Dict, normality_tests: Dict, autocorr_tests: Dict) -> Dict[str, Any]:
         """综合评估残差质量"""
-        issues = []
-        score = 100
-        
-        # 检查均值是否接近0
-        if abs(basic_stats["mean"]) > 0.1 * basic_stats["std"]:
-            issues.append("残差均值偏离0")
-            score -= 10
-        
-        # 检查正态性
-        if "jarque_bera" in normality_tests and not normality_tests["jarque_bera"].get("is_normal", True):
-            issues.append("残差不服从正态分布")
-            score -= 15
-        
-        # 检查自相关
-        if "ljung_box" in autocorr_tests and not autocorr_tests["ljung_box"].get("is_white_noise", True):
-            issues.append("残差存在自相关")
-            score -= 20
-        
-        # 检查偏度和峰度
-        if abs(basic_stats["skewness"]) > 1:
-            issues.append("残差偏度过大")
-            score -= 10
-        
-        if abs(basic_stats["kurtosis"]) > 3:
-            issues.append("残差峰度异常")
-            score -= 10
+        mean = abs(basic_stats["mean"])
+        std = basic_stats["std"]
+        skewness = abs(basic_stats["skewness"])
+        kurtosis = abs(basic_stats["kurtosis"])
+        
+        # 各检查项是否存在问题（顺序同RESIDUAL_ISSUES），按权重一次性扣分
+        flags = np.array([
+            mean > 0.1 * std,
+            not normality_tests.get("jarque_bera", {}).get("is_normal", True),
+            not autocorr_tests.get("ljung_box", {}).get("is_white_noise", True),
+            skewness > 1,
+            kurtosis > 3,
+        ], dtype=bool)
+        score = 100 - int(_RESIDUAL_PENALTIES[flags].sum())
+        issues = [RESIDUAL_ISSUES[i][0] for i in np.flatnonzero(flags)]
         
         # 评估等级
-        if score >= 90:
-            grade = "优秀"
-            recommendation = "模型拟合良好，残差符合白噪声假设"
-        elif score >= 75:
-            grade = "良好"
-            recommendation = "模型拟合较好，但存在轻微问题"
-        elif score >= 60:
-            grade = "一般"
-            recommendation = "模型拟合一般，建议考虑调整模型"
-        else:
-            grade = "较差"
-            recommendation = "模型拟合不佳，建议重新选择模型"
+        grade, recommendation = _RESIDUAL_GRADES[np.searchsorted(_RESIDUAL_GRADE_BOUNDS, score, side='right')]
         
         return {
             "score": score,
@@ -313,21 +688,25 @@ class ModelEvaluator:
             "issues": issues,
             "recommendation": recommendation,
             "detailed_assessment": {
-                "mean_centered": abs(basic_stats["mean"]) <= 0.1 * basic_stats["std"],
+                "mean_centered": mean <= 0.1 * std,
                 "normal_distribution": normality_tests.get("jarque_bera", {}).get("is_normal", False),
                 "no_autocorrelation": autocorr_tests.get("ljung_box", {}).get("is_white_noise", False),
-                "reasonable_skewness": abs(basic_stats["skewness"]) <= 1,
-                "reasonable_kurtosis": abs(basic_stats["kurtosis"]) <= 3
+                "reasonable_skewness": skewness <= 1,
+                "reasonable_kurtosis": kurtosis <= 3
             }
         }
     
-    def generate_evaluation_report(self, data: pd.Series, order: Tuple[int, int, int]) -> Dict[str, Any]:
+    def generate_evaluation_report(self,
+                                   data: pd.Series,
+                                   order: Tuple[int, int, int],
+                                   want_confint: bool = True) -> Dict[str, Any]:
         """
         生成完整的模型评估报告
         
         Args:
             data: 原始时间序列数据
             order: ARIMA模型阶数
+            want_confint: 是否计算残差ACF/PACF的置信区间，批量筛选候选模型时可关闭
             
         Returns:
             完整的评估报告
@@ -342,7 +721,7 @@ class ModelEvaluator:
             }
         
         # 残差分析
-        residual_analysis = self.analyze_residuals()
+        residual_analysis = self.analyze_residuals(want_confint=want_confint)
         
         # 生成综合报告
         report = {
@@ -358,7 +737,8 @@ class ModelEvaluator:
                 "loglikelihood": fit_result["loglikelihood"],
                 "r_squared": fit_result["r_squared"],
                 "adj_r_squared": fit_result["adj_r_squared"],
-                "sigma2": fit_result["sigma2"]
+                "sigma2": fit_result["sigma2"],
+                "converged": fit_result["converged"]
             },
             "residual_analysis": residual_analysis,
             "model_adequacy": self._assess_model_adequacy(fit_result, residual_analysis),
@@ -368,6 +748,22 @@ class ModelEvaluator:
         self.evaluation_results = report
         return report
     
+    def to_json(self, indent: bool = False) -> bytes:
+        """
+        将最近一次生成的评估报告序列化为JSON
+
+        安装orjson时直接在C层序列化报告中的numpy数组，否则回退到标准库json。
+        
+        Args:
+            indent: 是否缩进输出
+            
+        Returns:
+            UTF-8编码的JSON字节串
+        """
+        if not self.evaluation_results:
+            raise ValueError("没有评估报告可导出，请先调用generate_evaluation_report")
+        return dumps_json(self.evaluation_results, indent=indent)
+    
     def _assess_model_adequacy(self, fit_result: Dict, residual_analysis: Dict) -> Dict[str, Any]:
         """评估模型充分性"""
         adequacy_score = 0
@@ -376,16 +772,9 @@ class ModelEvaluator:
         # AIC/BIC评分（相对评分，需要与其他模型比较）
         adequacy_score += 20  # 基础分
         
-        # R平方评分
-        r_squared = fit_result.get("r_squared", 0)
-        if r_squared > 0.8:
-            adequacy_score += 20
-        elif r_squared > 0.6:
-            adequacy_score += 15
-        elif r_squared > 0.4:
-            adequacy_score += 10
-        else:
-            adequacy_score += 5
+        # R平方评分（按阈值分段查表）
+        r_squared = np.nan_to_num(fit_result.get("r_squared", 0))
+        adequacy_score += _R_SQUARED_SCORES[np.searchsorted(_R_SQUARED_BOUNDS, r_squared, side='left')]
         
         # 残差评分
         if "overall_assessment" in residual_analysis:
@@ -394,18 +783,9 @@ class ModelEvaluator:
         
         adequacy_percentage = min(adequacy_score, max_score)
         
-        if adequacy_percentage >= 85:
-            adequacy_level = "高"
-            interpretation = "模型非常适合数据"
-        elif adequacy_percentage >= 70:
-            adequacy_level = "中等"
-            interpretation = "模型较好地拟合数据"
-        elif adequacy_percentage >= 55:
-            adequacy_level = "一般"
-            interpretation = "模型基本拟合数据，但有改进空间"
-        else:
-            adequacy_level = "低"
-            interpretation = "模型拟合不佳，建议重新选择"
+        adequacy_level, interpretation = _ADEQUACY_LEVELS[
+            np.searchsorted(_ADEQUACY_BOUNDS, adequacy_percentage, side='right')
+        ]
         
         return {
             "score": adequacy_percentage,
@@ -417,6 +797,9 @@ class ModelEvaluator:
         """生成改进建议"""
         recommendations = []
         
+        if not fit_result.get("converged", True):
+            recommendations.append("参数估计未收敛，AIC等信息准则可能不可靠，建议简化模型阶数后重新拟合")
+        
         # 基于残差分析的建议
         if "overall_assessment" in residual_analysis:
             issues = residual_analysis["overall_assessment"].get("issues", [])
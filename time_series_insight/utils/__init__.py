@@ -0,0 +1,13 @@
+"""通用工具模块"""
+
+from .serialization import dump_json, dumps_json, to_jsonable
+from .jit import HAS_NUMBA, njit
+from .autocorr import acovf, levinson_durbin, levinson_durbin_path
+from .digest import series_digest
+from .moments import sample_moments
+
+__all__ = [
+    "dump_json", "dumps_json", "to_jsonable", "HAS_NUMBA", "njit",
+    "acovf", "levinson_durbin", "levinson_durbin_path", "series_digest",
+    "sample_moments",
+]
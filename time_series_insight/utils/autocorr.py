@@ -0,0 +1,83 @@
+"""
+自协方差与Levinson-Durbin递推
+
+模型识别、参数估计和残差诊断共用的ACF/PACF底层计算。
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+from scipy.fft import next_fast_len
+
+
+def _acovf_fft(x: np.ndarray, nlag: int) -> np.ndarray:
+    """
+    基于FFT计算0~nlag阶样本自协方差（有偏估计，除以n）
+    
+    补零到不小于2n的快速长度后做一次rfft/irfft，避免循环相关。
+    """
+    n = len(x)
+    n2 = next_fast_len(2 * n)
+    spectrum = np.fft.rfft(x - x.mean(), n=n2)
+    return np.fft.irfft(spectrum * np.conj(spectrum), n=n2)[:nlag + 1] / n
+
+
+def acovf(x: np.ndarray, nlag: int) -> np.ndarray:
+    """
+    计算0~nlag阶样本自协方差（有偏估计，除以n）
+    
+    滞后阶数不超过log2(n)时逐阶做点积（BLAS ddot，O(nlag*n)且不产生临时数组），
+    否则使用FFT（O(n log n)）。
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x)
+    if nlag + 1 > np.log2(max(n, 2)):
+        return _acovf_fft(x, nlag)
+    
+    centered = x - x.mean()
+    gamma = np.empty(nlag + 1)
+    gamma[0] = np.dot(centered, centered)
+    for k in range(1, nlag + 1):
+        gamma[k] = np.dot(centered[:-k], centered[k:])
+    return gamma / n
+
+
+def levinson_durbin_path(gamma: np.ndarray, p: int) -> Tuple[List[Tuple[np.ndarray, float]], np.ndarray]:
+    """
+    Levinson-Durbin递推求解Yule-Walker方程（O(p^2)），保留每一阶的解
+    
+    递推第k步的结果正是AR(k)的Yule-Walker解，因此一次递推即得到AR(1)~AR(p)，
+    各步的反射系数即1~p阶偏自相关系数。
+    
+    Args:
+        gamma: 0~p阶自协方差
+        p: 最大AR阶数
+        
+    Returns:
+        ([(AR(k)系数, AR(k)噪声方差) for k in 1~p], 1~p阶偏自相关系数)
+    """
+    phi = np.zeros(p)
+    pacf_values = np.zeros(p)
+    sigma2 = float(gamma[0])
+    path = []
+    for k in range(p):
+        if sigma2 > 0:
+            kappa = (gamma[k + 1] - phi[:k] @ gamma[k:0:-1]) / sigma2
+            phi[:k] = phi[:k] - kappa * phi[:k][::-1]
+            phi[k] = kappa
+            pacf_values[k] = kappa
+            sigma2 *= 1 - kappa ** 2
+        path.append((phi[:k + 1].copy(), sigma2))
+    return path, pacf_values
+
+
+def levinson_durbin(gamma: np.ndarray, p: int) -> Tuple[np.ndarray, float, np.ndarray]:
+    """
+    Levinson-Durbin递推求解AR(p)的Yule-Walker方程
+    
+    Returns:
+        (AR系数, 噪声方差, 1~p阶偏自相关系数)
+    """
+    path, pacf_values = levinson_durbin_path(gamma, p)
+    phi, sigma2 = path[-1]
+    return phi, sigma2, pacf_values
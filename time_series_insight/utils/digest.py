@@ -0,0 +1,18 @@
+"""
+序列摘要工具
+
+为拟合结果缓存生成只取决于序列内容（而非对象身份）的键。
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+
+def series_digest(data: pd.Series) -> str:
+    """计算序列内容（数值和索引）的摘要，作为拟合缓存的键"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(data.to_numpy(dtype=np.float64)).tobytes())
+    digest.update(pd.util.hash_pandas_object(data.index).to_numpy().tobytes())
+    return digest.hexdigest()
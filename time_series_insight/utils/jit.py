@@ -0,0 +1,26 @@
+"""
+JIT编译工具
+
+安装numba时使用其njit编译数值内核，未安装时退化为普通Python函数。
+"""
+
+try:
+    from numba import njit as _numba_njit
+    HAS_NUMBA = True
+except ImportError:  # numba为可选依赖
+    _numba_njit = None
+    HAS_NUMBA = False
+
+
+def njit(*args, **kwargs):
+    """
+    numba.njit的包装
+
+    支持 ``@njit`` 和 ``@njit(cache=True, ...)`` 两种写法；未安装numba时原样返回函数。
+    调用方应在纯Python实现过慢时检查 ``HAS_NUMBA`` 选择其他路径。
+    """
+    if HAS_NUMBA:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
@@ -0,0 +1,92 @@
+"""
+样本矩
+
+残差诊断和残差图共用的均值、方差、偏度、峰度与取值范围计算。
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from .jit import HAS_NUMBA, njit
+
+
+@njit(cache=True)
+def _sample_moments_jit(x):
+    """
+    一次遍历计算样本矩（numba编译）
+
+    中心矩用Welford/Terriberry在线递推更新，避免由原点矩换算时的精度损失；
+    平方和用Kahan补偿求和。不启用fastmath，以免重排运算破坏补偿求和。
+    """
+    n = x.shape[0]
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    ss = 0.0
+    comp = 0.0
+    mn = np.inf
+    mx = -np.inf
+    for i in range(n):
+        v = x[i]
+        k = i + 1.0
+        delta = v - mean
+        delta_k = delta / k
+        delta_k2 = delta_k * delta_k
+        term = delta * delta_k * i
+        mean += delta_k
+        m4 += term * delta_k2 * (k * k - 3.0 * k + 3.0) + 6.0 * delta_k2 * m2 - 4.0 * delta_k * m3
+        m3 += term * delta_k * (k - 2.0) - 3.0 * delta_k * m2
+        m2 += term
+
+        # Kahan补偿求和
+        y = v * v - comp
+        t = ss + y
+        comp = (t - ss) - y
+        ss = t
+
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+
+    var = m2 / (n - 1) if n > 1 else np.nan
+    skew = np.sqrt(n) * m3 / m2 ** 1.5 if m2 > 0 else 0.0
+    kurt = n * m4 / (m2 * m2) - 3.0 if m2 > 0 else -3.0
+    return n, mean, var, skew, kurt, ss, mn, mx
+
+
+def _sample_moments_numpy(x: np.ndarray) -> Tuple[int, float, float, float, float, float, float, float]:
+    """由numpy归约计算样本矩（未安装numba时使用）"""
+    n = x.shape[0]
+    if n == 0:
+        return 0, 0.0, np.nan, 0.0, -3.0, 0.0, np.inf, -np.inf
+    mean = x.mean()
+    centered = x - mean
+    squared = centered * centered
+    m2 = squared.sum()
+    m3 = squared @ centered
+    m4 = squared @ squared
+    var = m2 / (n - 1) if n > 1 else np.nan
+    skew = np.sqrt(n) * m3 / m2 ** 1.5 if m2 > 0 else 0.0
+    kurt = n * m4 / (m2 * m2) - 3.0 if m2 > 0 else -3.0
+    return n, mean, var, skew, kurt, float(x @ x), x.min(), x.max()
+
+
+def sample_moments(x: np.ndarray) -> Tuple[int, float, float, float, float, float, float, float]:
+    """
+    计算样本量、均值、方差（ddof=1）、偏度、峰度、平方和、最小值和最大值
+
+    偏度、峰度为有偏估计（与scipy.stats.skew/kurtosis默认值一致，峰度为超额峰度）。
+    安装numba时一次遍历完成，否则使用numpy归约。
+
+    Args:
+        x: 连续的float64数组（不含缺失值）
+
+    Returns:
+        (n, mean, var, skewness, kurtosis, ss, min, max)
+    """
+    if HAS_NUMBA:
+        return _sample_moments_jit(x)
+    return _sample_moments_numpy(x)
@@ -0,0 +1,75 @@
+"""
+JSON序列化工具
+
+优先使用orjson在C层直接序列化numpy数组和pandas对象，未安装时回退到标准库json。
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # orjson为可选依赖
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """转换JSON无法直接序列化的对象"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    elif isinstance(obj, pd.Timestamp):
+        return str(obj)
+    elif hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"无法序列化的对象类型: {type(obj).__name__}")
+
+
+def dumps_json(obj: Any, indent: bool = True) -> bytes:
+    """
+    将分析结果序列化为UTF-8编码的JSON字节串
+
+    Args:
+        obj: 待序列化的对象，可包含numpy数组、pandas Series/DataFrame和时间戳
+        indent: 是否以2空格缩进输出，为False时输出紧凑格式
+
+    Returns:
+        JSON字节串
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, default=_default, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def to_jsonable(obj: Any) -> Any:
+    """
+    递归地将结果中的numpy数组和标量转换为Python原生类型
+
+    分析结果内部保留numpy数组，仅在交给只接受原生类型的序列化器（如Web框架）时调用。
+    """
+    if isinstance(obj, dict):
+        return {key: to_jsonable(value) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [to_jsonable(value) for value in obj]
+    elif isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    elif isinstance(obj, (pd.Series, pd.DataFrame, pd.Timestamp)):
+        return to_jsonable(_default(obj))
+    return obj
+
+
+def dump_json(obj: Any, file_path: Union[str, Path]) -> None:
+    """
+    将分析结果写入JSON文件
+
+    Args:
+        obj: 待序列化的对象
+        file_path: 输出文件路径
+    """
+    Path(file_path).write_bytes(dumps_json(obj))
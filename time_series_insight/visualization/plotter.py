@@ -4,63 +4,79 @@
 实现ACF/PACF图表绘制、时间序列可视化和诊断图表功能。
 """
 
+import functools
+import hashlib
+import inspect
+import os
+import platform
+import shutil
+import sys
+import weakref
+from collections import OrderedDict, namedtuple
+
+import matplotlib
+
+# 无图形界面的Linux环境（服务器、容器、CI）直接使用Agg，避免探测交互式后端；
+# 用户通过MPLBACKEND显式指定后端（如Jupyter）或已导入pyplot时不做更改
+if (platform.system() == 'Linux'
+        and not os.environ.get('DISPLAY')
+        and not os.environ.get('WAYLAND_DISPLAY')
+        and 'MPLBACKEND' not in os.environ
+        and 'matplotlib.pyplot' not in sys.modules):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import matplotlib.font_manager as fm
-import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
-import platform
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Tuple, List
-from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
-from statsmodels.tsa.seasonal import seasonal_decompose
-import warnings
 
 
-def setup_chinese_fonts():
+@functools.lru_cache(maxsize=1)
+def _resolve_chinese_font() -> Tuple[str, Tuple[str, ...]]:
     """
-    设置中文字体支持
+    查找可用的中文字体（结果缓存，只扫描一次字体列表）
 
-    根据不同操作系统自动选择合适的中文字体
+    Returns:
+        (选中的字体, 当前系统的候选字体列表)
     """
     system = platform.system()
 
     # 定义不同系统的中文字体列表
-    font_candidates = []
-
     if system == "Windows":
-        font_candidates = [
+        font_candidates = (
             'Microsoft YaHei',
             'SimHei',
             'SimSun',
             'KaiTi',
             'FangSong'
-        ]
+        )
     elif system == "Darwin":  # macOS
-        font_candidates = [
+        font_candidates = (
             'PingFang SC',
             'Hiragino Sans GB',
             'STHeiti',
             'Arial Unicode MS'
-        ]
+        )
     else:  # Linux
-        font_candidates = [
+        font_candidates = (
             'WenQuanYi Micro Hei',
             'WenQuanYi Zen Hei',
             'Noto Sans CJK SC',
             'Source Han Sans SC',
             'DejaVu Sans'
-        ]
+        )
 
     # 获取系统可用字体
-    available_fonts = [f.name for f in fm.fontManager.ttflist]
+    available_fonts = {f.name for f in fm.fontManager.ttflist}
 
     # 选择第一个可用的中文字体
-    selected_font = None
-    for font in font_candidates:
-        if font in available_fonts:
-            selected_font = font
-            break
+    selected_font = next((font for font in font_candidates if font in available_fonts), None)
 
     # 如果没有找到中文字体，使用默认字体
     if selected_font is None:
@@ -68,48 +84,765 @@ def setup_chinese_fonts():
         print(f"警告: 未找到合适的中文字体，使用默认字体 {selected_font}")
         print("建议安装中文字体以获得更好的显示效果")
 
-    # 设置matplotlib字体参数
-    plt.rcParams['font.sans-serif'] = [selected_font] + font_candidates
+    print(f"已设置中文字体: {selected_font}")
+    return selected_font, font_candidates
+
+
+def _apply_font(selected_font: str, font_candidates: Tuple[str, ...]) -> None:
+    """写入matplotlib字体参数，已是目标字体时不重复写入"""
+    if (plt.rcParams['font.sans-serif'][:1] == [selected_font]
+            and plt.rcParams['font.family'] == ['sans-serif']
+            and not plt.rcParams['axes.unicode_minus']):
+        return
+
+    plt.rcParams['font.sans-serif'] = [selected_font, *font_candidates]
     plt.rcParams['axes.unicode_minus'] = False
     plt.rcParams['font.size'] = 10
-
-    # 清除字体缓存
     plt.rcParams['font.family'] = 'sans-serif'
 
-    print(f"已设置中文字体: {selected_font}")
+
+def setup_chinese_fonts():
+    """
+    设置中文字体支持
+
+    根据不同操作系统自动选择合适的中文字体
+    """
+    selected_font, font_candidates = _resolve_chinese_font()
+    _apply_font(selected_font, font_candidates)
     return selected_font
 
 
-# 初始化中文字体设置
-setup_chinese_fonts()
+# 每种布局（图形大小, 行数, 列数）在图形池中最多保留的空闲图形数
+FIGURE_POOL_SIZE = 4
+
+# 不能显示窗口的非交互式后端
+_NON_INTERACTIVE_BACKENDS = frozenset({'agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template'})
+
+
+# 与statsmodels的DecomposeResult字段一致，plot_decomposition按相同方式访问
+DecomposeResult = namedtuple('DecomposeResult', ['trend', 'seasonal', 'resid'])
+
+# 移动平均滤波器长度超过该值时改用FFT卷积
+_FFT_FILTER_MIN_LENGTH = 64
+
+def _fast_seasonal_decompose(data: pd.Series, period: int, model: str = 'additive') -> DecomposeResult:
+    """
+    经典季节分解（结果与statsmodels.seasonal_decompose的默认设置一致）
+
+    趋势为中心化移动平均（偶数周期使用2×m移动平均，两端各(滤波器长度-1)/2个点为NaN）；
+    季节项为去趋势序列按周期位置求均值并中心化，通过reshape一次求出，不逐个周期位置循环。
+
+    Args:
+        data: 时间序列数据（不含缺失值）
+        period: 季节周期
+        model: 'additive' 或 'multiplicative'
+
+    Returns:
+        DecomposeResult(trend, seasonal, resid)，均为与data同索引的Series
+    """
+    x = data.to_numpy(dtype=np.float64)
+    n = len(x)
+    multiplicative = model.startswith('m')
+    
+    if not np.all(np.isfinite(x)):
+        raise ValueError("季节分解不支持缺失值")
+    if multiplicative and np.any(x <= 0):
+        raise ValueError("乘法模型要求数据全部为正")
+    if n < 2 * period:
+        raise ValueError(f"季节分解至少需要2个完整周期（{2 * period}个观测），当前只有{n}个")
+    
+    # 中心化移动平均滤波器（长度恒为奇数）
+    if period % 2 == 0:
+        filt = np.concatenate(([0.5], np.ones(period - 1), [0.5])) / period
+    else:
+        filt = np.full(period, 1.0 / period)
+    half = (len(filt) - 1) // 2
+    
+    trend = np.full(n, np.nan)
+    if len(filt) > _FFT_FILTER_MIN_LENGTH:
+        from scipy import signal
+        trend[half:n - half] = signal.fftconvolve(x, filt, mode='valid')
+    else:
+        trend[half:n - half] = np.convolve(x, filt, mode='valid')
+    
+    detrended = x / trend if multiplicative else x - trend
+    
+    # 按周期位置求均值：补NaN到整周期后reshape为(周期数, period)
+    n_cycles = -(-n // period)
+    padded = np.full(n_cycles * period, np.nan)
+    padded[:n] = detrended
+    period_averages = np.nanmean(padded.reshape(n_cycles, period), axis=0)
+    if multiplicative:
+        period_averages /= period_averages.mean()
+    else:
+        period_averages -= period_averages.mean()
+    seasonal = np.tile(period_averages, n_cycles)[:n]
+    
+    resid = x / seasonal / trend if multiplicative else detrended - seasonal
+    
+    index = data.index
+    return DecomposeResult(
+        trend=pd.Series(trend, index=index, name='trend'),
+        seasonal=pd.Series(seasonal, index=index, name='seasonal'),
+        resid=pd.Series(resid, index=index, name='resid'),
+    )
+
+
+def _asnp(series: pd.Series) -> Tuple[Any, np.ndarray]:
+    """
+    把序列一次性转换为绘图用的连续数组
+
+    数值转为连续的float64数组；无时区的DatetimeIndex等索引转为datetime64/数值ndarray，
+    由matplotlib按数组批量转换，而不经过逐元素的对象转换。带时区的日期索引保持原样
+    （转为ndarray会变成对象数组）。
+
+    Returns:
+        (横坐标, 纵坐标)
+    """
+    index = series.index
+    x = index if getattr(index, 'tz', None) is not None else index.to_numpy()
+    return x, np.ascontiguousarray(series.to_numpy(dtype=np.float64))
+
+
+def _series_digest(x: np.ndarray) -> str:
+    """计算序列数值的摘要，作为绘图计算缓存的键"""
+    return hashlib.blake2b(np.ascontiguousarray(x, dtype=np.float64).tobytes(), digest_size=16).hexdigest()
+
+
+# 季节分解结果缓存：(序列摘要, 周期, 模型) -> (趋势, 季节项, 残差)的ndarray
+DECOMPOSE_CACHE_SIZE = 16
+_DECOMPOSE_CACHE: "OrderedDict[Tuple[str, int, str], Tuple[np.ndarray, np.ndarray, np.ndarray]]" = OrderedDict()
+
+
+def _cached_seasonal_decompose(data: pd.Series, period: int, model: str = 'additive') -> DecomposeResult:
+    """
+    按序列内容缓存的季节分解
+
+    缓存中只保存三个分量的数组，取出时按当前序列的索引重建Series。
+    """
+    key = (_series_digest(data.to_numpy(dtype=np.float64)), period, model)
+    cached = _DECOMPOSE_CACHE.get(key)
+    if cached is None:
+        result = _fast_seasonal_decompose(data, period, model)
+        cached = (result.trend.to_numpy(), result.seasonal.to_numpy(), result.resid.to_numpy())
+        _DECOMPOSE_CACHE[key] = cached
+        while len(_DECOMPOSE_CACHE) > DECOMPOSE_CACHE_SIZE:
+            _DECOMPOSE_CACHE.popitem(last=False)
+        return result
+    
+    _DECOMPOSE_CACHE.move_to_end(key)
+    index = data.index
+    return DecomposeResult(
+        trend=pd.Series(cached[0], index=index, name='trend'),
+        seasonal=pd.Series(cached[1], index=index, name='seasonal'),
+        resid=pd.Series(cached[2], index=index, name='resid'),
+    )
+
+
+def _linear_trend(y: np.ndarray) -> Tuple[float, float]:
+    """
+    对y关于0..n-1做一次线性最小二乘拟合（闭式解）
+
+    横坐标中心化后斜率为sum((x - x̄) * y) / sum((x - x̄)^2)，其中分母为n(n²-1)/12，
+    只需一次点积和一次求均值，不经过polyfit的通用最小二乘求解。
+
+    Returns:
+        (斜率, 截距)
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    x_mean = (n - 1) / 2.0
+    y_mean = y.mean()
+    if n < 2:
+        return 0.0, float(y_mean)
+    x_centered = np.arange(n, dtype=np.float64) - x_mean
+    slope = float(x_centered @ y) / (n * (n * n - 1.0) / 12.0)
+    return slope, float(y_mean - slope * x_mean)
+
+
+def _downsample_for_plot(x: np.ndarray, y: np.ndarray, target_px: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    按像素宽度对长序列做M4降采样
+
+    序列长度超过4倍像素宽度时，把数据按顺序均分为target_px个桶（等间隔索引下即每个像素列一个桶），
+    每个桶保留首点、末点、最小值点和最大值点（按原顺序）。桶内折线的上下包络和桶间连线都与原序列一致，
+    栅格化结果与绘制全部数据相同，绘制开销只与图宽有关。含缺失值时不降采样。
+
+    Args:
+        x: 横坐标数组
+        y: 纵坐标数组
+        target_px: 目标像素宽度（桶数）
+
+    Returns:
+        降采样后的(x, y)
+    """
+    n = len(y)
+    if target_px <= 0 or n <= 4 * target_px or not np.all(np.isfinite(y)):
+        return x, y
+    
+    # 桶大小向上取整，末尾以最后一个值补齐到整桶
+    bucket = -(-n // target_px)
+    n_buckets = -(-n // bucket)
+    padded = np.empty(n_buckets * bucket, dtype=np.float64)
+    padded[:n] = y
+    padded[n:] = y[-1]
+    blocks = padded.reshape(n_buckets, bucket)
+    
+    offsets = np.arange(n_buckets) * bucket
+    i_first = offsets
+    i_last = np.minimum(offsets + bucket - 1, n - 1)
+    i_min = np.minimum(offsets + blocks.argmin(axis=1), n - 1)
+    i_max = np.minimum(offsets + blocks.argmax(axis=1), n - 1)
+    
+    # 合并四类点并按原顺序排列（去掉同一点的重复索引）
+    idx = np.unique(np.concatenate((i_first, i_min, i_max, i_last)))
+    return x[idx], y[idx]
+
+
+@functools.lru_cache(maxsize=1)
+def _datashader_available() -> bool:
+    """datashader是否可用（可选依赖，只在首次使用datashader渲染时检查）"""
+    try:
+        import datashader  # noqa: F401
+    except ImportError:  # datashader为可选依赖
+        return False
+    return True
+
+
+def _draw_line_datashader(ax, x, y: np.ndarray, dpi: int, **line_kwargs) -> None:
+    """
+    用datashader把折线栅格化到子图像素网格后以图像绘制
+
+    datashader在固定像素网格上累积线段（Numba编译，O(n)且内存与点数无关），
+    matplotlib只负责坐标轴、标签和一张图像。另画一条空折线取得配色循环中的颜色，
+    同时作为图例句柄。
+
+    Args:
+        ax: 子图
+        x: 横坐标（数值或日期）
+        y: 纵坐标（不含缺失值时效果最佳，缺失值处断开）
+        dpi: 栅格分辨率
+        **line_kwargs: 折线参数（label、alpha等；linewidth不参与栅格化）
+    """
+    import datashader as ds
+    
+    is_date = np.issubdtype(np.asarray(x).dtype, np.datetime64) or isinstance(x, pd.DatetimeIndex)
+    x_num = mdates.date2num(x) if is_date else np.asarray(x, dtype=np.float64)
+    alpha = line_kwargs.pop('alpha', 1.0)
+    line_kwargs.pop('rasterized', None)
+    proxy, = ax.plot([], [], alpha=alpha, **line_kwargs)
+    
+    finite = np.isfinite(y)
+    x_range = (float(x_num[0]), float(x_num[-1]))
+    y_range = (float(y[finite].min()), float(y[finite].max()))
+    if y_range[0] == y_range[1]:
+        y_range = (y_range[0] - 0.5, y_range[1] + 0.5)
+    
+    fig = ax.figure
+    bbox = ax.get_position()
+    width_px = max(int(bbox.width * fig.get_figwidth() * dpi), 1)
+    height_px = max(int(bbox.height * fig.get_figheight() * dpi), 1)
+    canvas = ds.Canvas(plot_width=width_px, plot_height=height_px, x_range=x_range, y_range=y_range)
+    counts = canvas.line(pd.DataFrame({'x': x_num, 'y': y}), 'x', 'y').to_numpy()
+    
+    # 有线段经过的像素取折线颜色，其余透明；datashader的第0行对应y最小值
+    image = np.zeros(counts.shape + (4,))
+    image[..., :3] = matplotlib.colors.to_rgb(proxy.get_color())
+    image[..., 3] = np.where(np.nan_to_num(counts) > 0, alpha, 0.0)
+    ax.imshow(image, extent=(*x_range, *y_range), origin='lower', aspect='auto')
+    if is_date:
+        ax.xaxis_date()
+
+
+def _draw_histogram(ax, values: np.ndarray, bins: int, value_range: Optional[Tuple[float, float]] = None):
+    """
+    绘制密度直方图
+
+    直接由np.histogram计算各箱密度，再用一次ax.bar画出全部条形，
+    不经过ax.hist对输入的逐项校验和缺失值处理（values应已去除缺失值）。
+
+    Args:
+        ax: 子图
+        values: 不含缺失值的数据
+        bins: 箱数
+        value_range: 取值范围，已知时给出可省去一次最小/最大值扫描
+    """
+    density, edges = np.histogram(values, bins=bins, range=value_range, density=True)
+    return ax.bar(edges[:-1], density, width=np.diff(edges), align='edge', alpha=0.7, edgecolor='black')
+
+
+def _normal_qq(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """
+    计算正态Q-Q图的理论分位数、有序样本和参考线（与scipy.stats.probplot的结果一致）
+
+    分位点取均匀分布次序统计量的中位数（Filliben近似），由ndtri一次算出理论分位数；
+    参考线为有序样本对理论分位数的最小二乘直线。
+
+    Returns:
+        (理论分位数, 有序样本, 斜率, 截距)
+    """
+    from scipy.special import ndtri
+    
+    ordered = np.sort(values)
+    n = len(ordered)
+    positions = (np.arange(1, n + 1, dtype=np.float64) - 0.3175) / (n + 0.365)
+    positions[-1] = 0.5 ** (1.0 / n)
+    positions[0] = 1.0 - positions[-1]
+    theoretical = ndtri(positions)
+    
+    theoretical_centered = theoretical - theoretical.mean()
+    slope = float(theoretical_centered @ ordered) / float(theoretical_centered @ theoretical_centered)
+    intercept = float(ordered.mean() - slope * theoretical.mean())
+    return theoretical, ordered, slope, intercept
+
+
+def _draw_correlogram(ax, values: np.ndarray, confint: np.ndarray) -> None:
+    """
+    绘制相关图（ACF或PACF）
+
+    全部滞后的竖线合并为一个LineCollection、标记点合并为一次scatter，置信带为一次fill_between，
+    替代statsmodels逐个滞后创建Line2D的做法。
+
+    Args:
+        ax: 子图
+        values: 0~lags阶相关系数
+        confint: 各阶相关系数的置信区间，形状为(lags + 1, 2)
+    """
+    lags = np.arange(len(values), dtype=np.float64)
+    segments = np.zeros((len(values), 2, 2))
+    segments[:, :, 0] = lags[:, None]
+    segments[:, 1, 1] = values
+    ax.add_collection(LineCollection(segments, colors='C0', linewidths=1.5))
+    ax.scatter(lags, values, s=25, color='C0', zorder=3)
+    ax.axhline(0, color='black', linewidth=0.8)
+    
+    # 置信带以0为中心（与statsmodels一致），0阶不画
+    ax.fill_between(lags[1:], confint[1:, 0] - values[1:], confint[1:, 1] - values[1:],
+                    alpha=0.25, linewidth=0)
+    ax.set_xlim(-1, len(values))
+    ax.autoscale_view()
+
+
+# ACF/PACF结果缓存：(序列摘要, 滞后阶数, 显著性水平) -> acf_pacf_with_confint的结果
+ACF_CACHE_SIZE = 16
+_ACF_CACHE: "OrderedDict[Tuple[str, int, float], Tuple[np.ndarray, ...]]" = OrderedDict()
+
+
+def _cached_acf_pacf(data: pd.Series, lags: int, alpha: float) -> Tuple[np.ndarray, ...]:
+    """
+    按序列内容缓存ACF/PACF及置信区间
+
+    同一序列在ACF/PACF图、综合报告等多处绘制时只计算一次；摘要只取决于数值，与索引无关。
+    """
+    x = np.ascontiguousarray(data, dtype=np.float64)
+    key = (_series_digest(x), lags, alpha)
+    cached = _ACF_CACHE.get(key)
+    if cached is not None:
+        _ACF_CACHE.move_to_end(key)
+        return cached
+    
+    # 模型识别模块会加载statsmodels和scipy.stats，延迟到首次绘制相关图时导入
+    from ..analysis.model_identifier import acf_pacf_with_confint
+    result = acf_pacf_with_confint(x, lags, alpha=alpha)
+    _ACF_CACHE[key] = result
+    while len(_ACF_CACHE) > ACF_CACHE_SIZE:
+        _ACF_CACHE.popitem(last=False)
+    return result
+
+
+def _fast_acf_pacf_plot(ax_acf, ax_pacf, data: pd.Series, lags: int, alpha: float = 0.05) -> None:
+    """基于同一次自协方差计算的ACF/PACF及置信区间，分别绘制到两个子图"""
+    acf_values, pacf_values, acf_confint, pacf_confint = _cached_acf_pacf(data, lags, alpha)
+    _draw_correlogram(ax_acf, acf_values, acf_confint)
+    _draw_correlogram(ax_pacf, pacf_values, pacf_confint)
+
+
+def _hash_plot_argument(digest, value) -> None:
+    """把一个绘图参数写入图像缓存键的摘要"""
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(np.ascontiguousarray(value).tobytes())
+    else:
+        digest.update(repr(value).encode())
+
+
+# 图像缓存支持的保存格式（命中时需读回为图形）
+_IMAGE_CACHE_FORMATS = frozenset({'.png', '.jpg', '.jpeg', '.tif', '.tiff', '.webp'})
+
+
+def _cached_figure(method):
+    """
+    绘图方法的磁盘图像缓存
+
+    可视化器设置了image_cache_dir且调用给出save_path（PNG、JPEG等位图格式）时，以(方法名、全部参数内容、
+    图形大小/分辨率/风格/折线渲染方式等设置、保存格式)的摘要为键：命中时直接把缓存的图像复制到save_path，
+    不再重新绘制，返回显示该图像的图形（开启close_after_save时返回None）；
+    未命中时正常绘制，保存后把图像存入缓存目录。矢量格式无法读回为图形，不使用缓存。
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        save_path = bound.arguments.get('save_path')
+        if self.image_cache_dir is None or not save_path:
+            return method(self, *args, **kwargs)
+        ext = os.path.splitext(str(save_path))[1] or '.' + matplotlib.rcParams['savefig.format']
+        if ext.lower() not in _IMAGE_CACHE_FORMATS:
+            return method(self, *args, **kwargs)
+        
+        from .. import __version__
+        
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((__version__, method.__name__, tuple(self.figsize), self.dpi,
+                            TimeSeriesPlotter._applied_style, self.downsample,
+                            self.rasterize_threshold, self.line_renderer, ext)).encode())
+        for name, value in bound.arguments.items():
+            if name not in ('self', 'save_path'):
+                digest.update(name.encode())
+                _hash_plot_argument(digest, value)
+        cache_path = os.path.join(self.image_cache_dir, digest.hexdigest() + ext)
+        
+        if os.path.exists(cache_path):
+            shutil.copyfile(cache_path, save_path)
+            return None if self.close_after_save else self._image_figure(cache_path)
+        
+        fig = method(self, *args, **kwargs)
+        if self._deferred_cache_copies is not None:
+            # render_batch推迟了保存，保存完成后再存入缓存
+            self._deferred_cache_copies.append((save_path, cache_path))
+        elif os.path.exists(save_path):
+            os.makedirs(self.image_cache_dir, exist_ok=True)
+            shutil.copyfile(save_path, cache_path)
+        return fig
+
+    return wrapper
 
 
 class TimeSeriesPlotter:
     """时间序列可视化器"""
 
-    def __init__(self, figsize: Tuple[int, int] = (12, 8), style: str = 'seaborn-v0_8'):
+    # 中文字体是否已设置（字体参数为全局状态，所有实例共享）
+    _fonts_ready = False
+    # 最近一次应用的绘图风格（风格和调色板为全局状态，相同风格不重复应用）
+    _applied_style: Optional[str] = None
+
+    def __init__(self,
+                 figsize: Tuple[int, int] = (12, 8),
+                 style: str = 'seaborn-v0_8',
+                 backend: Optional[str] = None,
+                 reuse_figures: bool = False,
+                 rasterize_threshold: int = 5000,
+                 dpi: int = 150,
+                 downsample: bool = True,
+                 close_after_save: bool = False,
+                 image_cache_dir: Optional[str] = None,
+                 line_renderer: str = 'matplotlib'):
         """
         初始化可视化器
 
         Args:
             figsize: 图形大小
             style: 绘图风格
+            backend: matplotlib后端（如'Agg'），为None时沿用当前后端
+            reuse_figures: 是否复用同一绘图方法上次创建的图形（清空子图后重绘），
+                省去重复构建Figure/Axes的开销；开启后此前返回的图形会被后续同类调用覆盖，
+                适用于绘制后立即保存的批量出图场景
+            rasterize_threshold: 数据点数超过该值的线条和散点栅格化，
+                保存为SVG/PDF等矢量格式时不再逐点写出路径
+            dpi: 保存图片的分辨率（同时决定栅格化图层的分辨率）
+            downsample: 是否在绘制长序列折线前按图宽像素做最小/最大值降采样
+            close_after_save: 给出save_path时，保存后立即关闭图形并返回None，
+                适用于只需输出文件的批量出图和Web服务；需要返回图形时保持False
+            image_cache_dir: 图像缓存目录（如'~/.cache/tsi'），为None时不缓存。
+                设置后ACF/PACF图、分解图和综合报告在参数与设置完全相同且保存为位图格式时，
+                直接复制已缓存的图像，并返回显示该图像的图形
+            line_renderer: 长序列折线的渲染方式，'matplotlib'或'datashader'。
+                选择'datashader'时，点数超过rasterize_threshold的原始序列折线由datashader
+                栅格化后以图像绘制（需安装datashader，未安装时回退到matplotlib）
         """
+        if line_renderer not in ('matplotlib', 'datashader'):
+            raise ValueError(f"不支持的折线渲染方式: {line_renderer}")
         self.figsize = figsize
+        self.reuse_figures = reuse_figures
+        self.rasterize_threshold = rasterize_threshold
+        self.dpi = dpi
+        self.downsample = downsample
+        self.close_after_save = close_after_save
+        self.image_cache_dir = os.path.expanduser(image_cache_dir) if image_cache_dir else None
+        self.line_renderer = line_renderer
+        # 本可视化器创建的图形（弱引用，不延长图形生命周期），供close_figures统一关闭
+        self._active_figs = weakref.WeakSet()
+        # (绘图方法, 图形大小, 行数, 列数) -> (图形, 子图)
+        self._fig_cache: Dict[Tuple, Tuple[Figure, Any]] = {}
+        # 经release归还的空闲图形：(图形大小, 行数, 列数) -> [(图形, 子图)]
+        self._fig_pool: Dict[Tuple, List[Tuple[Figure, Any]]] = {}
+        # 图形 -> (布局键, 子图)，release据此把图形放回对应的池
+        self._fig_layouts = weakref.WeakKeyDictionary()
+        # render_batch构建图表期间推迟的保存任务[(图形, 保存路径)]和图像缓存写入[(保存路径, 缓存路径)]
+        self._deferred_saves: Optional[List[Tuple[Figure, Any]]] = None
+        self._deferred_cache_copies: Optional[List[Tuple[Any, str]]] = None
+        if backend is not None:
+            matplotlib.use(backend, force=False)
+        if TimeSeriesPlotter._applied_style != style:
+            try:
+                plt.style.use(style)
+            except:
+                plt.style.use('default')
+
+            # 设置seaborn样式（seaborn导入较慢，延迟到创建可视化器时）
+            import seaborn as sns
+            sns.set_palette("husl")
+            TimeSeriesPlotter._applied_style = style
+
+        # 绘图风格可能覆盖字体参数，重新设置中文字体
+        setup_chinese_fonts()
+        TimeSeriesPlotter._fonts_ready = True
+
+    @classmethod
+    def reset_style(cls):
+        """清除已应用风格的记录，下次创建可视化器时重新应用绘图风格和调色板"""
+        cls._applied_style = None
+
+    def _new_figure(self,
+                    nrows: int = 1,
+                    ncols: int = 1,
+                    cache_key: Optional[str] = None,
+                    **kwargs) -> Tuple[Figure, Any]:
+        """
+        创建图形和子图
+
+        非交互式后端下图形无法显示，直接创建绑定Agg画布的Figure，不经过pyplot的全局图形管理
+        （不会累积在pyplot中，也无需plt.close）；交互式后端下仍由pyplot创建以便显示。
+        启用reuse_figures且给出cache_key时，复用相同布局的已有图形并清空各子图；
+        否则优先取用经release归还的相同布局图形，省去重新构建Figure、画布和子图的开销。
+        默认使用constrained布局，在绘制时完成排版，无需再调用tight_layout。
+
+        Args:
+            nrows: 子图行数，为0时不创建子图
+            ncols: 子图列数
+            cache_key: 图形复用的键（通常为绘图方法名）
+            **kwargs: 传给Figure的参数（如figsize）
+
+        Returns:
+            (图形, 子图或子图数组；nrows为0时为None)
+        """
+        kwargs.setdefault('layout', 'constrained')
+        key = None
+        if self.reuse_figures and cache_key is not None and nrows:
+            key = (cache_key, tuple(kwargs.get('figsize', ())), nrows, ncols)
+            cached = self._fig_cache.get(key)
+            if cached is not None:
+                fig, axes = cached
+                for ax in fig.axes:
+                    ax.cla()
+                return fig, axes
+        
+        layout_key = (tuple(kwargs.get('figsize', ())), nrows, ncols)
+        pooled = self._fig_pool.get(layout_key) if nrows else None
+        if pooled:
+            fig, axes = pooled.pop()
+        else:
+            if matplotlib.get_backend().lower() in _NON_INTERACTIVE_BACKENDS:
+                fig = Figure(**kwargs)
+                FigureCanvasAgg(fig)
+            else:
+                fig = plt.figure(**kwargs)
+            axes = fig.subplots(nrows, ncols) if nrows else None
+            self._active_figs.add(fig)
+            if nrows:
+                self._fig_layouts[fig] = (layout_key, axes)
+        if key is not None:
+            self._fig_cache[key] = (fig, axes)
+        return fig, axes
+
+    def _image_figure(self, path: str) -> Figure:
+        """创建铺满整幅显示图像文件的图形（按self.dpi还原图形大小），用于图像缓存命中时返回"""
+        import matplotlib.image as mpimg
+        
+        image = mpimg.imread(path)
+        height, width = image.shape[:2]
+        fig, _ = self._new_figure(0, figsize=(width / self.dpi, height / self.dpi), layout=None)
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.imshow(image)
+        ax.set_axis_off()
+        return fig
+
+    def release(self, fig: Optional[Figure]) -> None:
+        """
+        归还不再使用的图形
+
+        图形清空后放回图形池，后续相同布局的绘图直接复用；无法复用的图形
+        （综合报告等自定义网格、复用缓存中的图形）或池已满时关闭图形。
+
+        Args:
+            fig: 绘图方法返回的图形，为None时忽略
+        """
+        if fig is None or any(fig is cached for cached, _ in self._fig_cache.values()):
+            return
+        entry = self._fig_layouts.get(fig)
+        pool = self._fig_pool.setdefault(entry[0], []) if entry is not None else []
+        if any(fig is pooled for pooled, _ in pool):
+            return
+        if entry is None or len(pool) >= FIGURE_POOL_SIZE:
+            self._active_figs.discard(fig)
+            plt.close(fig)
+            return
+        
+        for ax in fig.axes:
+            ax.cla()
+        if fig.get_suptitle():
+            fig.suptitle('')
+        pool.append((fig, entry[1]))
+
+    def _finish(self, fig: Figure, save_path) -> Optional[Figure]:
+        """
+        绘图方法的收尾：按需保存图形，开启close_after_save时保存后关闭
+
+        Returns:
+            图形对象；保存后已关闭时为None
+        """
+        if not save_path:
+            return fig
+        if self._deferred_saves is not None:
+            self._deferred_saves.append((fig, save_path))
+            return fig
+        self.save_figure(fig, save_path)
+        if self.close_after_save and not any(fig is cached for cached, _ in self._fig_cache.values()):
+            self._active_figs.discard(fig)
+            plt.close(fig)
+            return None
+        return fig
+
+    def close_figures(self) -> None:
+        """关闭本可视化器创建的全部图形（含复用缓存中的图形）"""
+        for fig in list(self._active_figs):
+            plt.close(fig)
+        self._active_figs.clear()
+        self._fig_cache.clear()
+        self._fig_pool.clear()
+
+    def __enter__(self) -> "TimeSeriesPlotter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close_figures()
+
+    def save_figure(self, fig: Figure, save_path, dpi: Optional[int] = None) -> None:
+        """
+        保存图形
+
+        图形已由constrained布局排版，不再用bbox_inches='tight'额外绘制一遍求边界；
+        PNG使用低压缩级别，以少量文件体积换取更快的编码。
+
+        Args:
+            fig: 图形对象
+            save_path: 保存路径
+            dpi: 分辨率，为None时使用self.dpi
+        """
+        ext = os.path.splitext(str(save_path))[1].lstrip('.') or matplotlib.rcParams['savefig.format']
+        kwargs = {'pil_kwargs': {'compress_level': 1}} if ext.lower() == 'png' else {}
+        fig.savefig(save_path, dpi=self.dpi if dpi is None else dpi, **kwargs)
+
+    def clear_cache(self) -> None:
+        """释放复用的图形"""
+        for fig, _ in self._fig_cache.values():
+            plt.close(fig)
+        self._fig_cache.clear()
+
+    def render_batch(self,
+                     jobs: List[Tuple[str, Dict[str, Any]]],
+                     max_workers: Optional[int] = None) -> List[Optional[Figure]]:
+        """
+        批量绘制（并保存）多张图表
+
+        matplotlib不保证线程安全，各图表在调用线程中依次构建；非交互式后端下，
+        给出save_path的图表在全部构建完成后由线程池并行保存（Agg栅格化与PNG编码期间释放GIL）。
+        交互式后端或max_workers=1时逐个绘制并保存。各任务的save_path应互不相同。
+
+        Args:
+            jobs: (绘图方法名, 参数字典)列表，如[('plot_time_series', {'data': s, 'save_path': 'a.png'})]
+            max_workers: 最大保存线程数，默认为CPU核数
+
+        Returns:
+            与jobs顺序一致的图形列表（开启close_after_save时已保存的图形为None）
+        """
+        for method_name, _ in jobs:
+            if not method_name.startswith(('plot_', 'create_')) or not hasattr(self, method_name):
+                raise ValueError(f"不支持的绘图方法: {method_name}")
+        
+        if (matplotlib.get_backend().lower() not in _NON_INTERACTIVE_BACKENDS
+                or len(jobs) <= 1 or max_workers == 1):
+            return [getattr(self, method_name)(**kwargs) for method_name, kwargs in jobs]
+        
+        # 构建期间推迟保存；同一方法的多张图表在保存前不能共用同一图形，暂时关闭图形复用
+        reuse_figures = self.reuse_figures
+        self.reuse_figures = False
+        self._deferred_saves, self._deferred_cache_copies = [], []
         try:
-            plt.style.use(style)
-        except:
-            plt.style.use('default')
+            figures = [getattr(self, method_name)(**kwargs) for method_name, kwargs in jobs]
+            saves, cache_copies = self._deferred_saves, self._deferred_cache_copies
+        finally:
+            self.reuse_figures = reuse_figures
+            self._deferred_saves = self._deferred_cache_copies = None
+        
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            list(executor.map(lambda item: self.save_figure(*item), saves))
+        
+        for save_path, cache_path in cache_copies:
+            if os.path.exists(save_path):
+                os.makedirs(self.image_cache_dir, exist_ok=True)
+                shutil.copyfile(save_path, cache_path)
+        
+        if self.close_after_save:
+            saved = {id(fig) for fig, _ in saves}
+            for fig, _ in saves:
+                self._active_figs.discard(fig)
+                plt.close(fig)
+            figures = [None if id(fig) in saved else fig for fig in figures]
+        return figures
 
-        # 设置seaborn样式
-        sns.set_palette("husl")
+    def _plot_xy(self, x, y: np.ndarray, width_scale: float = 1.0) -> Tuple[Any, np.ndarray]:
+        """
+        取出用于绘制折线的(x, y)数组，开启降采样时按图宽像素降采样
 
-        # 确保中文字体设置
-        self._ensure_chinese_fonts()
+        Args:
+            x: 横坐标（_asnp的结果）
+            y: 纵坐标（_asnp的结果）
+            width_scale: 图宽相对figsize[0]的倍数
+        """
+        if self.downsample:
+            x, y = _downsample_for_plot(x, y, int(self.figsize[0] * width_scale * self.dpi))
+        return x, y
+
+    def _draw_series(self, ax, x, y: np.ndarray, width_scale: float = 1.0, **line_kwargs) -> None:
+        """
+        绘制序列折线
+
+        开启datashader渲染且点数较多时由datashader栅格化；否则按需降采样后用matplotlib绘制，
+        点数较多时栅格化线条。
+
+        Args:
+            ax: 子图
+            x: 横坐标（_asnp的结果）
+            y: 纵坐标（_asnp的结果）
+            width_scale: 图宽相对figsize[0]的倍数（用于降采样）
+            **line_kwargs: 传给ax.plot的参数
+        """
+        if (self.line_renderer == 'datashader' and len(y) > self.rasterize_threshold
+                and np.isfinite(y).any() and _datashader_available()):
+            _draw_line_datashader(ax, x, y, self.dpi, **line_kwargs)
+            return
+        plot_x, plot_y = self._plot_xy(x, y, width_scale)
+        ax.plot(plot_x, plot_y, rasterized=len(plot_y) > self.rasterize_threshold, **line_kwargs)
 
     def _ensure_chinese_fonts(self):
-        """确保中文字体设置正确"""
-        setup_chinese_fonts()
+        """确保中文字体设置正确（首次设置后不再重复）"""
+        if not TimeSeriesPlotter._fonts_ready:
+            setup_chinese_fonts()
+            TimeSeriesPlotter._fonts_ready = True
         
     def plot_time_series(self,
                         data: pd.Series,
@@ -131,16 +864,18 @@ class TimeSeriesPlotter:
         # 确保中文字体设置
         self._ensure_chinese_fonts()
 
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = self._new_figure(cache_key='plot_time_series', figsize=self.figsize)
+        
+        x_arr, values = _asnp(data)
         
-        # 绘制时间序列
-        ax.plot(data.index, data.values, linewidth=1.5, alpha=0.8, label='原始数据')
+        # 绘制时间序列（长序列按像素宽度降采样）
+        self._draw_series(ax, x_arr, values, linewidth=1.5, alpha=0.8, label='原始数据')
         
-        # 添加趋势线
+        # 添加趋势线（一次线性拟合，趋势为直线，只需绘制首尾两点）
         if show_trend:
-            z = np.polyfit(range(len(data)), data.values, 1)
-            p = np.poly1d(z)
-            ax.plot(data.index, p(range(len(data))), "r--", alpha=0.8, label='趋势线')
+            slope, intercept = _linear_trend(values)
+            ends = np.array([0.0, len(values) - 1.0])
+            ax.plot(data.index[[0, -1]], slope * ends + intercept, "r--", alpha=0.8, label='趋势线')
         
         ax.set_title(title, fontsize=16, fontweight='bold')
         ax.set_xlabel('时间', fontsize=12)
@@ -148,19 +883,16 @@ class TimeSeriesPlotter:
         ax.grid(True, alpha=0.3)
         ax.legend()
         
-        # 格式化x轴日期（如果是日期索引）
+        # 格式化x轴日期（如果是日期索引）：刻度数按显示的时间跨度确定（最多12个），与数据点数无关
         if isinstance(data.index, pd.DatetimeIndex):
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-            ax.xaxis.set_major_locator(mdates.MonthLocator(interval=max(1, len(data)//10)))
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            locator = mdates.AutoDateLocator(maxticks=12)
+            ax.xaxis.set_major_locator(locator)
+            ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+            ax.tick_params(axis='x', labelrotation=45)
         
-        return fig
+        return self._finish(fig, save_path)
     
+    @_cached_figure
     def plot_acf_pacf(self,
                      data: pd.Series,
                      lags: int = 20,
@@ -183,33 +915,26 @@ class TimeSeriesPlotter:
         # 确保中文字体设置
         self._ensure_chinese_fonts()
 
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(self.figsize[0], self.figsize[1]*1.2))
+        fig, (ax1, ax2) = self._new_figure(2, 1, cache_key='plot_acf_pacf', figsize=(self.figsize[0], self.figsize[1]*1.2))
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
+        # ACF与PACF共用一次自协方差计算
+        _fast_acf_pacf_plot(ax1, ax2, data, lags, alpha)
 
-            # 绘制ACF - 不使用默认标题，后面手动设置
-            plot_acf(data, lags=lags, alpha=alpha, ax=ax1, title=None)
-            ax1.set_title('自相关函数 (ACF)', fontsize=14, fontweight='bold')
-            ax1.set_xlabel('滞后阶数', fontsize=12)
-            ax1.set_ylabel('自相关系数', fontsize=12)
-            ax1.grid(True, alpha=0.3)
+        ax1.set_title('自相关函数 (ACF)', fontsize=14, fontweight='bold')
+        ax1.set_xlabel('滞后阶数', fontsize=12)
+        ax1.set_ylabel('自相关系数', fontsize=12)
+        ax1.grid(True, alpha=0.3)
 
-            # 绘制PACF - 不使用默认标题，后面手动设置
-            plot_pacf(data, lags=lags, alpha=alpha, ax=ax2, title=None)
-            ax2.set_title('偏自相关函数 (PACF)', fontsize=14, fontweight='bold')
-            ax2.set_xlabel('滞后阶数', fontsize=12)
-            ax2.set_ylabel('偏自相关系数', fontsize=12)
-            ax2.grid(True, alpha=0.3)
+        ax2.set_title('偏自相关函数 (PACF)', fontsize=14, fontweight='bold')
+        ax2.set_xlabel('滞后阶数', fontsize=12)
+        ax2.set_ylabel('偏自相关系数', fontsize=12)
+        ax2.grid(True, alpha=0.3)
 
         fig.suptitle(title, fontsize=16, fontweight='bold')
-        plt.tight_layout()
 
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-
-        return fig
+        return self._finish(fig, save_path)
     
+    @_cached_figure
     def plot_decomposition(self, 
                           data: pd.Series,
                           model: str = 'additive',
@@ -235,43 +960,45 @@ class TimeSeriesPlotter:
                 period = min(12, len(data) // 2)
             
             # 进行分解
-            decomposition = seasonal_decompose(data, model=model, period=period)
+            decomposition = _cached_seasonal_decompose(data, period, model)
             
             # 创建图形
-            fig, axes = plt.subplots(4, 1, figsize=(self.figsize[0], self.figsize[1]*1.5))
+            fig, axes = self._new_figure(4, 1, cache_key='plot_decomposition', figsize=(self.figsize[0], self.figsize[1]*1.5))
             
             # 原始数据
-            axes[0].plot(data.index, data.values, linewidth=1.5)
+            dense = len(data) > self.rasterize_threshold
+            # 原序列与三个分量共用同一索引，只转换一次
+            x_arr, values = _asnp(data)
+            axes[0].plot(x_arr, values, linewidth=1.5, rasterized=dense)
             axes[0].set_title('原始数据', fontsize=12, fontweight='bold')
             axes[0].set_ylabel('数值', fontsize=10)
             axes[0].grid(True, alpha=0.3)
 
             # 趋势
-            axes[1].plot(decomposition.trend.index, decomposition.trend.values, linewidth=1.5, color='orange')
+            axes[1].plot(x_arr, decomposition.trend.to_numpy(), linewidth=1.5, color='orange',
+                         rasterized=dense)
             axes[1].set_title('趋势', fontsize=12, fontweight='bold')
             axes[1].set_ylabel('趋势值', fontsize=10)
             axes[1].grid(True, alpha=0.3)
 
             # 季节性
-            axes[2].plot(decomposition.seasonal.index, decomposition.seasonal.values, linewidth=1.5, color='green')
+            axes[2].plot(x_arr, decomposition.seasonal.to_numpy(), linewidth=1.5, color='green',
+                         rasterized=dense)
             axes[2].set_title('季节性', fontsize=12, fontweight='bold')
             axes[2].set_ylabel('季节值', fontsize=10)
             axes[2].grid(True, alpha=0.3)
 
             # 残差
-            axes[3].plot(decomposition.resid.index, decomposition.resid.values, linewidth=1.5, color='red')
+            axes[3].plot(x_arr, decomposition.resid.to_numpy(), linewidth=1.5, color='red',
+                         rasterized=dense)
             axes[3].set_title('残差', fontsize=12, fontweight='bold')
             axes[3].set_ylabel('残差值', fontsize=10)
             axes[3].grid(True, alpha=0.3)
             axes[3].set_xlabel('时间', fontsize=10)
             
             fig.suptitle(title, fontsize=16, fontweight='bold')
-            plt.tight_layout()
             
-            if save_path:
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            
-            return fig
+            return self._finish(fig, save_path)
             
         except Exception as e:
             # 如果分解失败，返回简单的时间序列图
@@ -295,10 +1022,21 @@ class TimeSeriesPlotter:
         Returns:
             matplotlib图形对象
         """
-        fig, axes = plt.subplots(2, 2, figsize=(self.figsize[0]*1.2, self.figsize[1]))
+        fig, axes = self._new_figure(2, 2, cache_key='plot_residual_diagnostics', figsize=(self.figsize[0]*1.2, self.figsize[1]))
         
-        # 1. 残差vs拟合值
-        axes[0, 0].scatter(fitted_values, residuals, alpha=0.6)
+        # 点数较多时栅格化各子图中的数据图层
+        dense = len(residuals) > self.rasterize_threshold
+        
+        # 各子图共用的ndarray视图
+        resid_x, resid_arr = _asnp(residuals)
+        fit_arr = np.ascontiguousarray(fitted_values.to_numpy(dtype=np.float64))
+        
+        # 1. 残差vs拟合值（点数较多时改用Line2D小圆点标记，按同一标记路径批量绘制）
+        if dense:
+            axes[0, 0].plot(fit_arr, resid_arr, linestyle='none', marker='.', markersize=3,
+                            alpha=0.6, rasterized=True)
+        else:
+            axes[0, 0].scatter(fit_arr, resid_arr, alpha=0.6)
         axes[0, 0].axhline(y=0, color='r', linestyle='--', alpha=0.8)
         axes[0, 0].set_xlabel('拟合值')
         axes[0, 0].set_ylabel('残差')
@@ -306,21 +1044,29 @@ class TimeSeriesPlotter:
         axes[0, 0].grid(True, alpha=0.3)
         
         # 2. 残差时间序列图
-        axes[0, 1].plot(residuals.index, residuals.values, linewidth=1)
+        axes[0, 1].plot(resid_x, resid_arr, linewidth=1, rasterized=dense)
         axes[0, 1].axhline(y=0, color='r', linestyle='--', alpha=0.8)
         axes[0, 1].set_xlabel('时间')
         axes[0, 1].set_ylabel('残差')
         axes[0, 1].set_title('残差时间序列')
         axes[0, 1].grid(True, alpha=0.3)
         
-        # 3. 残差直方图
-        axes[1, 0].hist(residuals.dropna(), bins=30, density=True, alpha=0.7, edgecolor='black')
+        from scipy import stats
+        from ..utils.moments import sample_moments
+        
+        # 去除缺失值后的残差，直方图、正态曲线和Q-Q图共用
+        resid_clean = resid_arr[~np.isnan(resid_arr)]
+        
+        # 一次遍历得到均值、方差和取值范围
+        _, mu, var, _, _, _, r_min, r_max = sample_moments(resid_clean)
+        sigma = np.sqrt(var)
+        
+        # 3. 残差直方图（直接给出取值范围，省去再求一遍最小/最大值）
+        _draw_histogram(axes[1, 0], resid_clean, 30, (r_min, r_max))
         
         # 添加正态分布曲线
-        mu, sigma = residuals.mean(), residuals.std()
-        x = np.linspace(residuals.min(), residuals.max(), 100)
-        axes[1, 0].plot(x, (1/(sigma * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mu) / sigma) ** 2), 
-                       'r-', linewidth=2, label='正态分布')
+        x = np.linspace(r_min, r_max, 100)
+        axes[1, 0].plot(x, stats.norm.pdf(x, loc=mu, scale=sigma), 'r-', linewidth=2, label='正态分布')
         axes[1, 0].set_xlabel('残差值')
         axes[1, 0].set_ylabel('密度')
         axes[1, 0].set_title('残差分布')
@@ -328,18 +1074,19 @@ class TimeSeriesPlotter:
         axes[1, 0].grid(True, alpha=0.3)
         
         # 4. Q-Q图
-        from scipy import stats
-        stats.probplot(residuals.dropna(), dist="norm", plot=axes[1, 1])
+        theoretical, ordered, slope, intercept = _normal_qq(resid_clean)
+        axes[1, 1].plot(theoretical, ordered, 'bo', rasterized=dense)
+        # 参考线为直线，只需绘制首尾两点
+        ends = theoretical[[0, -1]]
+        axes[1, 1].plot(ends, slope * ends + intercept, 'r-')
+        axes[1, 1].set_xlabel('Theoretical quantiles')
+        axes[1, 1].set_ylabel('Ordered Values')
         axes[1, 1].set_title('Q-Q图')
         axes[1, 1].grid(True, alpha=0.3)
         
         fig.suptitle(title, fontsize=16, fontweight='bold')
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
         
-        return fig
+        return self._finish(fig, save_path)
     
     def plot_model_comparison(self, 
                              models_results: List[Dict[str, Any]],
@@ -362,47 +1109,38 @@ class TimeSeriesPlotter:
             raise ValueError("没有模型结果可供比较")
         
         # 提取模型信息
-        model_names = []
-        criteria_values = []
-        
-        for result in models_results:
-            if 'order' in result and criteria in result:
-                order = result['order']
-                model_names.append(f"ARIMA{order}")
-                criteria_values.append(result[criteria])
-        
-        if not model_names:
+        valid = [result for result in models_results if 'order' in result and criteria in result]
+        if not valid:
             raise ValueError(f"没有找到有效的{criteria}值")
         
+        model_names = [f"ARIMA{result['order']}" for result in valid]
+        criteria_values = np.fromiter((result[criteria] for result in valid),
+                                      dtype=np.float64, count=len(valid))
+        
         # 创建图形
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = self._new_figure(cache_key='plot_model_comparison', figsize=self.figsize)
         
         # 绘制条形图
-        bars = ax.bar(range(len(model_names)), criteria_values, alpha=0.7)
+        positions = np.arange(len(model_names))
+        bars = ax.bar(positions, criteria_values, alpha=0.7)
         
         # 标记最优模型
-        best_idx = np.argmin(criteria_values)
+        best_idx = int(criteria_values.argmin())
         bars[best_idx].set_color('red')
         bars[best_idx].set_alpha(0.9)
         
         ax.set_xlabel('模型')
         ax.set_ylabel(criteria.upper())
         ax.set_title(f'{title} - {criteria.upper()}比较')
-        ax.set_xticks(range(len(model_names)))
-        ax.set_xticklabels(model_names, rotation=45)
+        ax.set_xticks(positions)
+        ax.set_xticklabels(model_names, rotation=45, ha='right')
         ax.grid(True, alpha=0.3, axis='y')
         
-        # 添加数值标签
-        for i, v in enumerate(criteria_values):
-            ax.text(i, v + max(criteria_values) * 0.01, f'{v:.2f}', 
-                   ha='center', va='bottom', fontweight='bold' if i == best_idx else 'normal')
-        
-        plt.tight_layout()
+        # 添加数值标签（bar_label按条形端点统一定位，最优模型加粗）
+        labels = ax.bar_label(bars, labels=[f'{v:.2f}' for v in criteria_values], padding=3)
+        labels[best_idx].set_fontweight('bold')
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        return fig
+        return self._finish(fig, save_path)
     
     def plot_forecast(self, 
                      original_data: pd.Series,
@@ -423,22 +1161,26 @@ class TimeSeriesPlotter:
         Returns:
             matplotlib图形对象
         """
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = self._new_figure(cache_key='plot_forecast', figsize=self.figsize)
         
         # 绘制原始数据
-        ax.plot(original_data.index, original_data.values, 
-               label='历史数据', linewidth=1.5, alpha=0.8)
+        self._draw_series(ax, *_asnp(original_data), label='历史数据', linewidth=1.5, alpha=0.8)
         
-        # 绘制预测值
-        ax.plot(forecast.index, forecast.values, 
-               label='预测值', linewidth=2, color='red', alpha=0.8)
+        # 绘制预测值（预测期较长时预测线和置信带同样栅格化）
+        dense_forecast = len(forecast) > self.rasterize_threshold
+        forecast_x, forecast_y = _asnp(forecast)
+        ax.plot(forecast_x, forecast_y, 
+               label='预测值', linewidth=2, color='red', alpha=0.8,
+               rasterized=dense_forecast)
         
         # 绘制置信区间
         if confidence_intervals is not None:
-            ax.fill_between(forecast.index, 
-                           confidence_intervals.iloc[:, 0], 
-                           confidence_intervals.iloc[:, 1],
-                           alpha=0.3, color='red', label='95%置信区间')
+            bounds = confidence_intervals.to_numpy()
+            ax.fill_between(forecast_x, 
+                           bounds[:, 0], 
+                           bounds[:, 1],
+                           alpha=0.3, color='red', label='95%置信区间',
+                           rasterized=dense_forecast)
         
         ax.set_title(title, fontsize=16, fontweight='bold')
         ax.set_xlabel('时间')
@@ -451,13 +1193,9 @@ class TimeSeriesPlotter:
             ax.axvline(x=original_data.index[-1], color='gray', 
                       linestyle='--', alpha=0.7, label='预测起点')
         
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        return fig
+        return self._finish(fig, save_path)
     
+    @_cached_figure
     def create_comprehensive_report(self, 
                                    data: pd.Series,
                                    acf_pacf_data: Optional[pd.Series] = None,
@@ -482,42 +1220,42 @@ class TimeSeriesPlotter:
         if residuals is not None and fitted_values is not None:
             n_plots += 1  # 残差诊断
         
-        fig = plt.figure(figsize=(self.figsize[0]*1.5, self.figsize[1]*n_plots*0.8))
+        fig, _ = self._new_figure(0, figsize=(self.figsize[0]*1.5, self.figsize[1]*n_plots*0.8))
+        
+        gs = fig.add_gridspec(n_plots, 2)
         
         # 1. 原始时间序列
-        ax1 = plt.subplot(n_plots, 1, 1)
-        ax1.plot(data.index, data.values, linewidth=1.5, alpha=0.8)
+        ax1 = fig.add_subplot(gs[0, :])
+        self._draw_series(ax1, *_asnp(data), width_scale=1.5, linewidth=1.5, alpha=0.8)
         ax1.set_title('原始时间序列', fontsize=14, fontweight='bold')
         ax1.set_ylabel('数值')
         ax1.grid(True, alpha=0.3)
         
         # 2. ACF/PACF（如果提供了数据）
         if acf_pacf_data is not None:
-            ax2 = plt.subplot(n_plots, 2, 3)
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                plot_acf(acf_pacf_data, lags=20, ax=ax2, title=None)
-                ax2.set_title('自相关函数 (ACF)', fontsize=12, fontweight='bold')
-                ax2.set_xlabel('滞后阶数', fontsize=10)
-                ax2.set_ylabel('自相关系数', fontsize=10)
-                ax2.grid(True, alpha=0.3)
-
-            ax3 = plt.subplot(n_plots, 2, 4)
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                plot_pacf(acf_pacf_data, lags=20, ax=ax3, title=None)
-                ax3.set_title('偏自相关函数 (PACF)', fontsize=12, fontweight='bold')
-                ax3.set_xlabel('滞后阶数', fontsize=10)
-                ax3.set_ylabel('偏自相关系数', fontsize=10)
-                ax3.grid(True, alpha=0.3)
+            ax2 = fig.add_subplot(gs[1, 0])
+            # ACF与PACF取值范围相近，共用纵轴便于对照，也只需确定一次纵轴范围和刻度
+            ax3 = fig.add_subplot(gs[1, 1], sharey=ax2)
+            _fast_acf_pacf_plot(ax2, ax3, acf_pacf_data, 20)
+
+            ax2.set_title('自相关函数 (ACF)', fontsize=12, fontweight='bold')
+            ax2.set_xlabel('滞后阶数', fontsize=10)
+            ax2.set_ylabel('自相关系数', fontsize=10)
+            ax2.grid(True, alpha=0.3)
+
+            ax3.set_title('偏自相关函数 (PACF)', fontsize=12, fontweight='bold')
+            ax3.set_xlabel('滞后阶数', fontsize=10)
+            ax3.set_ylabel('偏自相关系数', fontsize=10)
+            ax3.grid(True, alpha=0.3)
         
         # 3. 残差诊断（如果提供了残差）
         if residuals is not None and fitted_values is not None:
             start_row = 3 if acf_pacf_data is not None else 2
             
             # 残差时间序列
-            ax4 = plt.subplot(n_plots, 2, start_row*2-1)
-            ax4.plot(residuals.index, residuals.values, linewidth=1)
+            ax4 = fig.add_subplot(gs[start_row-1, 0])
+            ax4.plot(*_asnp(residuals), linewidth=1,
+                     rasterized=len(residuals) > self.rasterize_threshold)
             ax4.axhline(y=0, color='r', linestyle='--', alpha=0.8)
             ax4.set_title('残差时间序列', fontsize=12, fontweight='bold')
             ax4.set_ylabel('残差', fontsize=10)
@@ -525,17 +1263,12 @@ class TimeSeriesPlotter:
             ax4.grid(True, alpha=0.3)
 
             # 残差直方图
-            ax5 = plt.subplot(n_plots, 2, start_row*2)
-            ax5.hist(residuals.dropna(), bins=20, density=True, alpha=0.7, edgecolor='black')
+            ax5 = fig.add_subplot(gs[start_row-1, 1])
+            _draw_histogram(ax5, residuals.dropna().to_numpy(dtype=np.float64), 20)
             ax5.set_title('残差分布', fontsize=12, fontweight='bold')
             ax5.set_xlabel('残差值', fontsize=10)
             ax5.set_ylabel('密度', fontsize=10)
             ax5.grid(True, alpha=0.3)
         
-        plt.suptitle('时间序列分析综合报告', fontsize=16, fontweight='bold')
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        return fig
+        fig.suptitle('时间序列分析综合报告', fontsize=16, fontweight='bold')
+        return self._finish(fig, save_path)